@@ -0,0 +1,40 @@
+"""
+Measures AnimatedSpriteGroup.update throughput against the number of threads.
+Run it on a free-threaded build (python3.13t) to see a speedup; with the GIL
+enabled the group falls back to serial updates.
+"""
+
+import os
+import time
+
+from pygame import Surface
+
+from pygame_animated_sprite import AnimatedSprite
+from pygame_animated_sprite.group import AnimatedSpriteGroup, is_gil_enabled
+
+SPRITES = 20000
+TICKS = 200
+
+surfaces = [Surface((1, 1)) for _ in range(8)]
+sprites = [
+    AnimatedSprite.from_surfaces(surfaces, [16 + i % 50] * len(surfaces))
+    for i in range(SPRITES)
+]
+
+print(f"GIL enabled: {is_gil_enabled()}, {SPRITES} sprites, {TICKS} ticks")
+
+baseline = None
+workers = 1
+while workers <= (os.cpu_count() or 1):
+    with AnimatedSpriteGroup(sprites, workers=workers, parallel=True) as group:
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            group.update(16)
+        elapsed = time.perf_counter() - start
+
+    baseline = baseline or elapsed
+    print(
+        f"{workers:3} threads: {elapsed * 1000 / TICKS:8.2f} ms/tick, "
+        f"speedup {baseline / elapsed:5.2f}x"
+    )
+    workers *= 2
@@ -2,6 +2,18 @@
 Animated Sprite package for pygame
 """
 
+import os
+import sys
+
+# `python -m pygame_animated_sprite.analyze --json` writes JSON to stdout and
+# imports this package, so pygame, before the module runs: hide the pygame
+# banner for that command only
+if any(
+    flag == "-m" and module == "pygame_animated_sprite.analyze"
+    for flag, module in zip(sys.orig_argv, sys.orig_argv[1:])
+):
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
 import pygame_animated_sprite.loader
 from pygame_animated_sprite.sprite import AnimatedSprite, load
 from pygame_animated_sprite.direction import Forward, Reverse, PingPong, PingPongReverse
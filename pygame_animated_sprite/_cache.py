@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import itertools
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Optional
+
+from pygame import Surface
+
+# 8 MiB
+DEFAULT_BUDGET = 8 * 1024 * 1024
+
+# shared by every cache, so keys of different caches never collide
+_tokens = itertools.count()
+
+
+def next_token() -> int:
+    """Gets a unique token for the cache key of an object that may be collected."""
+    return next(_tokens)
+
+
+def surface_size(surface: Surface) -> int:
+    """Approximate memory used by the pixels of a surface."""
+    return surface.get_pitch() * surface.get_height()
+
+
+@dataclass
+class CacheStats:
+    hits: int = field(default=0)
+    misses: int = field(default=0)
+    evictions: int = field(default=0)
+    size: int = field(default=0)  # bytes
+    count: int = field(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SurfaceLRUCache:
+    """Least recently used cache of surfaces bounded by a memory budget."""
+
+    def __init__(self, budget: int) -> None:
+        """
+        :param budget: The maximum memory used by the cached surfaces (bytes).
+        """
+        if budget < 0:
+            raise ValueError("budget cannot be negative.")
+
+        self.budget: int = budget
+        self.stats: CacheStats = CacheStats()
+        self.__items: OrderedDict[Hashable, Surface] = OrderedDict()
+        return
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.__items
+
+    def get(self, key: Hashable) -> Optional[Surface]:
+        surface = self.__items.get(key)
+        if surface is None:
+            self.stats.misses += 1
+            return None
+
+        self.__items.move_to_end(key)
+        self.stats.hits += 1
+        return surface
+
+    def put(self, key: Hashable, surface: Surface) -> None:
+        if key in self.__items:
+            self.stats.size -= surface_size(self.__items.pop(key))
+
+        self.__items[key] = surface
+        self.stats.size += surface_size(surface)
+
+        while self.stats.size > self.budget and len(self.__items) > 1:
+            _, evicted = self.__items.popitem(last=False)
+            self.stats.size -= surface_size(evicted)
+            self.stats.evictions += 1
+
+        self.stats.count = len(self.__items)
+        return
+
+    def get_or_create(self, key: Hashable, create: Callable[[], Surface]) -> Surface:
+        surface = self.get(key)
+        if surface is None:
+            surface = create()
+            self.put(key, surface)
+        return surface
+
+    def clear(self) -> None:
+        self.__items.clear()
+        self.stats.size = 0
+        self.stats.count = 0
+        return
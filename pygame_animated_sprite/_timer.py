@@ -14,6 +14,11 @@ class BaseTimer(ABC):
     def time(self) -> int:
         return self._time
 
+    @time.setter
+    def time(self, value: int) -> None:
+        self._time = value
+        return
+
     def is_paused(self) -> bool:
         return self.__is_paused
 
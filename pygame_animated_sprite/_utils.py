@@ -1,10 +1,71 @@
-from pygame import Surface
+from __future__ import annotations
+
+from typing import Any
+
+from pygame import Rect, Surface
+
+from pygame_animated_sprite.direction import (
+    Direction,
+    Forward,
+    PingPong,
+    PingPongReverse,
+    Reverse,
+)
+from pygame_animated_sprite.structures import Tag
 
 
 def clip_surface(
     surface: Surface, dest: tuple[int, int], size: tuple[int, int]
 ) -> Surface:
-    handle_surface: Surface = surface.copy()
-    handle_surface.set_clip((dest, size))
+    # clamp to the surface without copying the whole surface first
+    rect: Rect = surface.get_rect().clip(Rect(dest, size))
+
+    return surface.subsurface(rect).copy()
+
+
+# only the built-in directions are stored in files, a path read from a file
+# must not import modules or return arbitrary callables
+_DIRECTIONS: dict[str, type[Direction]] = {
+    f"{direction.__module__}:{direction.__qualname__}": direction
+    for direction in (Forward, Reverse, PingPong, PingPongReverse)
+}
+
+
+def direction_to_path(direction: type[Direction]) -> str:
+    path = f"{direction.__module__}:{direction.__qualname__}"
+    if _DIRECTIONS.get(path) is not direction:
+        raise ValueError(f"only built-in directions can be stored, got {path}.")
+    return path
+
+
+def direction_from_path(path: str) -> type[Direction]:
+    direction = _DIRECTIONS.get(path)
+    if direction is None:
+        raise ValueError(f"unknown direction {path!r}.")
+    return direction
+
+
+def tags_to_dict(tags: dict[str, Tag]) -> dict[str, dict[str, Any]]:
+    """Converts tags to JSON-serializable data."""
+    return {
+        name: {
+            "start": tag.start,
+            "end": tag.end,
+            "direction": direction_to_path(tag.direction),
+            "repeat": tag.repeat,
+        }
+        for name, tag in tags.items()
+    }
+
 
-    return surface.subsurface(handle_surface.get_clip()).copy()
+def tags_from_dict(tags: dict[str, dict[str, Any]]) -> dict[str, Tag]:
+    return {
+        name: Tag(
+            name=name,
+            start=tag["start"],
+            end=tag["end"],
+            direction=direction_from_path(tag["direction"]),
+            repeat=tag["repeat"],
+        )
+        for name, tag in tags.items()
+    }
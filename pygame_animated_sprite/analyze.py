@@ -0,0 +1,424 @@
+"""
+Asset footprint analyzer
+
+Loads every sprite sheet of a folder tree with the registered loaders and
+reports what it costs once decoded::
+
+    python -m pygame_animated_sprite.analyze assets/ [--json] [--sort bytes]
+    python -m pygame_animated_sprite.analyze assets/ --json --output report.json
+
+For every sheet: decoded bytes per sheet and per frame, the share of
+transparent pixels, the bytes saved by trimming frames to their bounding
+rect, frames duplicated in other sheets, tags and durations, and the time
+taken to load it. Images referenced by another sheet (e.g. the png of an
+Aseprite json) are only reported as part of that sheet. Images without
+metadata are split with the detected grid of frames (see detect_grid), and
+the grid is reported.
+
+The pygame banner is hidden when run with ``python -m``, so the JSON written
+to stdout is valid.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pygame.image
+from pygame import Surface
+
+from pygame_animated_sprite._cache import surface_size
+from pygame_animated_sprite.loader.base import SpriteSheetData
+from pygame_animated_sprite.loader.image import ImageSpriteSheetLoader
+from pygame_animated_sprite.loader.registry import (
+    find_loader_class,
+    get_loader_entries,
+)
+from pygame_animated_sprite.loader.simple import SimpleSpriteSheetLoader, detect_grid
+from pygame_animated_sprite.structures import Frame
+
+SORT_KEYS = ("bytes", "trim", "load", "frames", "path")
+
+
+@dataclass
+class FrameReport:
+    index: int
+    width: int
+    height: int
+    bytes: int
+    duration: int  # ms
+    transparent_ratio: float
+    trim_savings: int  # bytes
+    duplicate_of: Optional[str] = field(default=None)  # "sheet#index"
+
+
+@dataclass
+class TagReport:
+    name: str
+    start: int
+    end: int
+    frames: int
+    duration: int  # ms, one pass over the frames
+    direction: str
+    repeat: int
+
+
+@dataclass
+class GridReport:
+    columns: int  # frames per line
+    rows: int
+    width: int
+    height: int
+    x: int
+    y: int
+    padding_x: int
+    padding_y: int
+
+
+@dataclass
+class SheetReport:
+    path: str
+    loader: str
+    grid: Optional[GridReport] = field(default=None)  # detected in plain images
+    load_time: float = field(default=0.0)  # ms
+    frame_count: int = field(default=0)
+    bytes: int = field(default=0)
+    trim_savings: int = field(default=0)
+    transparent_ratio: float = field(default=0.0)
+    duplicates: int = field(default=0)
+    frames: list[FrameReport] = field(default_factory=list)
+    tags: list[TagReport] = field(default_factory=list)
+    error: Optional[str] = field(default=None)
+
+
+def find_sheets(root: str | Path) -> list[Path]:
+    """
+    Finds the files of a tree handled by a registered loader, leaving out the
+    files that another sheet depends on.
+    """
+    extensions = {ext for entry in get_loader_entries() for ext in entry.extensions}
+    candidates = sorted(
+        path
+        for path in Path(root).rglob("*")
+        if path.is_file() and path.suffix.lower() in extensions
+    )
+
+    dependencies: set[Path] = set()
+    for path in candidates:
+        try:
+            loader = find_loader_class(path)()
+            dependencies.update(p.resolve() for p in loader.dependencies(path))
+        except Exception:
+            continue
+
+    return [path for path in candidates if path.resolve() not in dependencies]
+
+
+def _digest(surface: Surface) -> str:
+    pixels = pygame.image.tobytes(surface, "RGBA")
+    size = b"%dx%d" % surface.get_size()
+    return hashlib.blake2b(size + pixels, digest_size=16).hexdigest()
+
+
+def _analyze_frame(index: int, frame: Frame) -> FrameReport:
+    surface = frame.surface
+    width, height = surface.get_size()
+    size = surface_size(surface)
+
+    area = width * height
+    opaque = frame.get_mask().count()
+    bounds = frame.get_bounds()
+    trimmed = bounds.width * bounds.height * surface.get_bytesize()
+
+    return FrameReport(
+        index=index,
+        width=width,
+        height=height,
+        bytes=size,
+        duration=frame.duration,
+        transparent_ratio=1 - opaque / area if area else 0.0,
+        trim_savings=max(size - trimmed, 0),
+    )
+
+
+def _detect_grid(path: Path) -> Optional[GridReport]:
+    # a plain image holding more than one frame
+    try:
+        rows, columns, (width, height), (x, y), (padding_x, padding_y) = detect_grid(
+            pygame.image.load(path.as_posix())
+        )
+    except (ValueError, pygame.error):
+        return None
+
+    if columns * rows <= 1:
+        return None
+    return GridReport(columns, rows, width, height, x, y, padding_x, padding_y)
+
+
+def _load_grid(path: Path, grid: GridReport) -> SpriteSheetData:
+    # the loader calls the vertical count columns
+    loader = SimpleSpriteSheetLoader(
+        columns=grid.rows,
+        rows=grid.columns,
+        size=(grid.width, grid.height),
+        position=(grid.x, grid.y),
+        padding=(grid.padding_x, grid.padding_y),
+    )
+    with open(path, "rb") as file:
+        return loader.load(file, name=path.name)
+
+
+def analyze_sheet(
+    path: str | Path, root: Optional[Path] = None, repeat: int = 1
+) -> tuple[SheetReport, list[str]]:
+    """
+    Loads and measures a sheet.
+
+    :param path: The sheet file.
+    :param root: The folder the reported path is relative to.
+    :param repeat: The number of loads, the fastest one is reported.
+    :return: The report and the pixel digest of every frame.
+    """
+    path = Path(path)
+    name = path.relative_to(root).as_posix() if root else path.as_posix()
+
+    try:
+        loader_class = find_loader_class(path)
+    except Exception as error:
+        return SheetReport(path=name, loader="", error=str(error)), []
+
+    report = SheetReport(path=name, loader=loader_class.__name__)
+    if loader_class is ImageSpriteSheetLoader:
+        report.grid = _detect_grid(path)
+
+    grid = report.grid
+    if grid is not None:
+        report.loader = SimpleSpriteSheetLoader.__name__
+        load = lambda: _load_grid(path, grid)
+    else:
+        load = lambda: loader_class().load(path)
+
+    try:
+        times: list[float] = []
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            data = load()
+            times.append((time.perf_counter() - start) * 1000)
+    except Exception as error:
+        report.error = f"{type(error).__name__}: {error}"
+        return report, []
+
+    frames = data.frames or ()
+    report.load_time = min(times)
+    report.frame_count = len(frames)
+    report.frames = [_analyze_frame(i, frame) for i, frame in enumerate(frames)]
+
+    # frames sharing a surface are only decoded once
+    unique = {id(frame.surface): i for i, frame in enumerate(frames)}.values()
+    report.bytes = sum(report.frames[i].bytes for i in unique)
+    report.trim_savings = sum(report.frames[i].trim_savings for i in unique)
+
+    area = sum(f.width * f.height for f in report.frames)
+    if area:
+        report.transparent_ratio = (
+            sum(f.transparent_ratio * f.width * f.height for f in report.frames) / area
+        )
+
+    for tag in (data.tags or {}).values():
+        # the same range as AnimatedSprite.slice_by_tag
+        tag_frames = frames[tag.start : tag.end + 1]
+        report.tags.append(
+            TagReport(
+                name=tag.name,
+                start=tag.start,
+                end=tag.end,
+                frames=len(tag_frames),
+                duration=sum(frame.duration for frame in tag_frames),
+                direction=tag.direction.__name__,
+                repeat=tag.repeat,
+            )
+        )
+
+    return report, [_digest(frame.surface) for frame in frames]
+
+
+def analyze(root: str | Path, repeat: int = 1) -> list[SheetReport]:
+    """Analyzes every sheet of a tree and marks the duplicated frames."""
+    root = Path(root)
+    reports: list[SheetReport] = []
+    first_seen: dict[str, str] = {}
+
+    for path in find_sheets(root):
+        report, digests = analyze_sheet(path, root, repeat)
+        for frame, digest in zip(report.frames, digests):
+            location = f"{report.path}#{frame.index}"
+            if digest in first_seen:
+                frame.duplicate_of = first_seen[digest]
+                report.duplicates += 1
+            else:
+                first_seen[digest] = location
+        reports.append(report)
+
+    return reports
+
+
+def sort_reports(reports: list[SheetReport], key: str = "bytes") -> list[SheetReport]:
+    """Sorts reports, the most expensive first."""
+    if key == "path":
+        return sorted(reports, key=lambda report: report.path)
+
+    attribute = {
+        "bytes": "bytes",
+        "trim": "trim_savings",
+        "load": "load_time",
+        "frames": "frame_count",
+    }[key]
+    return sorted(reports, key=lambda report: getattr(report, attribute), reverse=True)
+
+
+def _format_bytes(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def format_table(reports: Sequence[SheetReport]) -> str:
+    """Formats reports as a text table with a total line."""
+    header = (
+        "sheet",
+        "frames",
+        "decoded",
+        "per frame",
+        "transparent",
+        "trim saves",
+        "dups",
+        "load ms",
+    )
+    rows: list[tuple[str, ...]] = []
+    for report in reports:
+        if report.error is not None:
+            rows.append((report.path, "error") + ("",) * 6)
+            continue
+
+        rows.append(
+            (
+                report.path,
+                str(report.frame_count),
+                _format_bytes(report.bytes),
+                _format_bytes(report.bytes / max(report.frame_count, 1)),
+                f"{report.transparent_ratio:.0%}",
+                _format_bytes(report.trim_savings),
+                str(report.duplicates),
+                f"{report.load_time:.1f}",
+            )
+        )
+
+    loaded = [report for report in reports if report.error is None]
+    rows.append(
+        (
+            "total",
+            str(sum(report.frame_count for report in loaded)),
+            _format_bytes(sum(report.bytes for report in loaded)),
+            "",
+            "",
+            _format_bytes(sum(report.trim_savings for report in loaded)),
+            str(sum(report.duplicates for report in loaded)),
+            f"{sum(report.load_time for report in loaded):.1f}",
+        )
+    )
+
+    widths = [
+        max(len(row[i]) for row in [header] + rows if i < len(row))
+        for i in range(len(header))
+    ]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in [header] + rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    lines.insert(len(lines) - 1, lines[1])
+    return "\n".join(lines)
+
+
+def format_tags(reports: Sequence[SheetReport]) -> str:
+    """Formats the detected grids and the tags of every sheet, one per line."""
+    lines: list[str] = []
+    for report in reports:
+        grid = report.grid
+        if grid is not None:
+            lines.append(
+                f"{report.path} grid {grid.columns}x{grid.rows} of "
+                f"{grid.width}x{grid.height} at ({grid.x}, {grid.y}), "
+                f"padding ({grid.padding_x}, {grid.padding_y})"
+            )
+        for tag in report.tags:
+            lines.append(
+                f"{report.path} [{tag.name}] frames {tag.start}-{tag.end} "
+                f"({tag.frames}), {tag.duration} ms, {tag.direction}, "
+                f"repeat {tag.repeat}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    # no window is opened, loaders only decode images
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    parser = argparse.ArgumentParser(
+        prog="python -m pygame_animated_sprite.analyze",
+        description="Reports the decoded footprint of the sprite sheets of a folder.",
+    )
+    parser.add_argument("root", type=Path, help="the folder to analyze")
+    parser.add_argument("--json", action="store_true", help="prints a JSON report")
+    parser.add_argument(
+        "--output", type=Path, help="writes the report to a file instead of stdout"
+    )
+    parser.add_argument(
+        "--sort", choices=SORT_KEYS, default="bytes", help="the table order"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="loads every sheet this many times and reports the fastest",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.root.is_dir():
+        parser.error(f"{args.root} is not a folder")
+
+    reports = sort_reports(analyze(args.root, args.repeat), args.sort)
+
+    if args.json:
+        text = json.dumps([asdict(report) for report in reports], indent=2)
+    else:
+        text = format_table(reports)
+        tags = format_tags(reports)
+        if tags:
+            text += "\n\n" + tags
+
+    if args.output is not None:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    errors = [report for report in reports if report.error is not None]
+    for report in errors:
+        print(f"{report.path}: {report.error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""
+Delta and RLE compressed frame storage
+
+Frames are stored as keyframes plus deltas. A delta only holds the dirty rect
+that changed since the previous frame. Pixel data is run-length encoded:
+transparent runs are skipped and only opaque runs are stored, then every
+record is zlib compressed.
+
+A pack file holds a whole sprite sheet::
+
+    MAGIC, header size (u32), JSON header, frame records...
+
+The header lists every frame (size, duration, keyframe flag, record offset
+and length) along with repeat, direction and tags.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import struct
+import threading
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+import pygame.image
+from pygame import Surface
+
+from pygame_animated_sprite._utils import (
+    direction_from_path,
+    direction_to_path,
+    tags_from_dict,
+    tags_to_dict,
+)
+from pygame_animated_sprite.structures import Frame
+from pygame_animated_sprite.loader.base import SpriteSheetData
+
+MAGIC = b"PASPACK\x01"
+EXTENSION = ".sprpack"
+
+KEYFRAME = 0
+DELTA = 1
+
+_OPAQUE_RUN = re.compile(rb"[^\x00]+")
+
+Rect = tuple[int, int, int, int]
+
+
+def encode_rle(pixels: bytes) -> bytes:
+    """
+    Run-length encodes RGBA pixels, dropping fully transparent runs.
+
+    :param pixels: RGBA bytes.
+    :return: The run count (u32), (skip, count) pairs (u32) and opaque pixels.
+    """
+    runs = array("I")
+    literals: list[bytes] = []
+    position = 0
+
+    # scan the alpha channel for runs of non transparent pixels
+    for match in _OPAQUE_RUN.finditer(pixels[3::4]):
+        start, end = match.span()
+        runs.append(start - position)
+        runs.append(end - start)
+        literals.append(pixels[start * 4 : end * 4])
+        position = end
+
+    return struct.pack("<I", len(runs) // 2) + _le(runs).tobytes() + b"".join(literals)
+
+
+def _le(values: array) -> array:
+    # records are little endian on disk
+    if struct.pack("=I", 1) != struct.pack("<I", 1):
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def decode_rle(data: bytes | memoryview, pixel_count: int) -> bytearray:
+    """
+    Decodes pixels encoded by encode_rle.
+
+    :param data: The encoded data.
+    :param pixel_count: The number of pixels of the region.
+    :return: RGBA bytes, transparent pixels are zero.
+    """
+    (run_count,) = struct.unpack_from("<I", data, 0)
+    runs = array("I")
+    runs.frombytes(bytes(data[4 : 4 + run_count * 8]))
+    runs = _le(runs)
+
+    pixels = bytearray(pixel_count * 4)
+    literal = 4 + run_count * 8
+    position = 0
+    for i in range(0, len(runs), 2):
+        position += runs[i]
+        size = runs[i + 1] * 4
+        pixels[position * 4 : position * 4 + size] = data[literal : literal + size]
+        literal += size
+        position += runs[i + 1]
+
+    return pixels
+
+
+def _first_difference(a: bytes | memoryview, b: bytes | memoryview) -> int:
+    # binary search on prefix equality, compared in C
+    low, high = 0, len(a)
+    while low < high:
+        middle = (low + high) // 2
+        if a[: middle + 1] == b[: middle + 1]:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _last_difference(a: bytes | memoryview, b: bytes | memoryview) -> int:
+    low, high = 0, len(a)
+    while low < high:
+        middle = (low + high) // 2
+        if a[middle:] == b[middle:]:
+            high = middle
+        else:
+            low = middle + 1
+    return low - 1
+
+
+def dirty_rect(previous: bytes, current: bytes, width: int, height: int) -> Rect:
+    """
+    Finds the bounding rect of the pixels that differ between two frames.
+
+    :return: (x, y, w, h), with w and h zero when the frames are identical.
+    """
+    stride = width * 4
+    a, b = memoryview(previous), memoryview(current)
+
+    top = bottom = -1
+    left, right = width, -1
+    for y in range(height):
+        row_a = a[y * stride : (y + 1) * stride]
+        row_b = b[y * stride : (y + 1) * stride]
+        if row_a == row_b:
+            continue
+
+        if top < 0:
+            top = y
+        bottom = y
+        left = min(left, _first_difference(row_a, row_b) // 4)
+        right = max(right, _last_difference(row_a, row_b) // 4)
+
+    if top < 0:
+        return 0, 0, 0, 0
+    return left, top, right - left + 1, bottom - top + 1
+
+
+def _crop(pixels: bytes, width: int, rect: Rect) -> bytes:
+    x, y, w, h = rect
+    stride = width * 4
+    return b"".join(
+        pixels[row * stride + x * 4 : row * stride + (x + w) * 4]
+        for row in range(y, y + h)
+    )
+
+
+def _paste(canvas: bytearray, width: int, rect: Rect, region: bytes) -> None:
+    x, y, w, h = rect
+    stride = width * 4
+    for row in range(h):
+        start = (y + row) * stride + x * 4
+        canvas[start : start + w * 4] = region[row * w * 4 : (row + 1) * w * 4]
+    return
+
+
+def encode_keyframe(pixels: bytes, level: int = 6) -> bytes:
+    return zlib.compress(encode_rle(pixels), level)
+
+
+def encode_delta(
+    previous: bytes, pixels: bytes, size: tuple[int, int], level: int = 6
+) -> bytes:
+    rect = dirty_rect(previous, pixels, *size)
+    region = _crop(pixels, size[0], rect) if rect[2] else b""
+    return zlib.compress(struct.pack("<4I", *rect) + encode_rle(region), level)
+
+
+def decode_keyframe(record: bytes, size: tuple[int, int]) -> bytearray:
+    return decode_rle(zlib.decompress(record), size[0] * size[1])
+
+
+def apply_delta(canvas: bytearray, record: bytes, size: tuple[int, int]) -> None:
+    """Applies a delta record to the RGBA bytes of the previous frame in place."""
+    data = memoryview(zlib.decompress(record))
+    rect: Rect = struct.unpack_from("<4I", data, 0)
+    if rect[2] == 0:
+        return
+
+    region = decode_rle(data[16:], rect[2] * rect[3])
+    _paste(canvas, size[0], rect, region)
+    return
+
+
+def write_pack(
+    file: str | Path | BinaryIO,
+    data: SpriteSheetData,
+    keyframe_interval: int = 30,
+    level: int = 6,
+) -> None:
+    """
+    Writes a sprite sheet as a pack file.
+
+    :param file: The output path or binary file object.
+    :param data: The sheet to write.
+    :param keyframe_interval: The maximum number of frames between keyframes.
+    :param level: The zlib compression level.
+    """
+    if isinstance(file, (str, Path)):
+        with open(file, "wb") as output:
+            write_pack(output, data, keyframe_interval, level)
+        return
+
+    if keyframe_interval <= 0:
+        raise ValueError("keyframe_interval must be greater than 0.")
+
+    entries: list[dict[str, Any]] = []
+    records: list[bytes] = []
+    offset = 0
+
+    previous: Optional[bytes] = None
+    previous_size: Optional[tuple[int, int]] = None
+    since_keyframe = 0
+    for frame in data.frames or ():
+        size = frame.surface.get_size()
+        pixels = pygame.image.tobytes(frame.surface, "RGBA")
+
+        if (
+            previous is None
+            or size != previous_size
+            or since_keyframe >= keyframe_interval
+        ):
+            kind = KEYFRAME
+            record = encode_keyframe(pixels, level)
+            since_keyframe = 1
+        else:
+            kind = DELTA
+            record = encode_delta(previous, pixels, size, level)
+            since_keyframe += 1
+
+        entries.append(
+            {
+                "width": size[0],
+                "height": size[1],
+                "duration": frame.duration,
+                "kind": kind,
+                "offset": offset,
+                "length": len(record),
+            }
+        )
+        records.append(record)
+        offset += len(record)
+        previous, previous_size = pixels, size
+
+    header = json.dumps(
+        {
+            "frames": entries,
+            "repeat": data.repeat,
+            "direction": (
+                direction_to_path(data.direction) if data.direction else None
+            ),
+            "tags": tags_to_dict(data.tags or {}),
+        },
+        separators=(",", ":"),
+    ).encode()
+
+    file.write(MAGIC + struct.pack("<I", len(header)) + header)
+    for record in records:
+        file.write(record)
+    return
+
+
+class PackReader:
+    """
+    Random access decoder of a pack file, fast for sequential access.
+
+    Decoding a frame applies deltas from the nearest keyframe, or from the
+    last decoded frame when playing forward.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """
+        :param data: The whole pack file.
+        """
+        if not data.startswith(MAGIC):
+            raise ValueError("not a pack file.")
+
+        (header_size,) = struct.unpack_from("<I", data, len(MAGIC))
+        body = len(MAGIC) + 4 + header_size
+        self.header: dict[str, Any] = json.loads(data[len(MAGIC) + 4 : body])
+        self.__data: memoryview = memoryview(data)[body:]
+        self.__entries: list[dict[str, Any]] = self.header["frames"]
+
+        self.__lock = threading.Lock()
+        self.__last_index: int = -1
+        self.__canvas: Optional[bytearray] = None
+        return
+
+    @classmethod
+    def open(cls: type[PackReader], file: str | Path | BinaryIO) -> PackReader:
+        if isinstance(file, (str, Path)):
+            with open(file, "rb") as input_file:
+                return cls(input_file.read())
+        return cls(file.read())
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def durations(self) -> tuple[int, ...]:
+        return tuple(entry["duration"] for entry in self.__entries)
+
+    def __record(self, index: int) -> bytes:
+        entry = self.__entries[index]
+        return bytes(self.__data[entry["offset"] : entry["offset"] + entry["length"]])
+
+    def __size(self, index: int) -> tuple[int, int]:
+        entry = self.__entries[index]
+        return entry["width"], entry["height"]
+
+    def decode(self, index: int) -> bytes:
+        """Decodes the RGBA bytes of a frame."""
+        with self.__lock:
+            if self.__canvas is not None and index == self.__last_index:
+                return bytes(self.__canvas)
+
+            keyframe = index
+            while self.__entries[keyframe]["kind"] != KEYFRAME:
+                keyframe -= 1
+
+            if self.__canvas is not None and keyframe <= self.__last_index < index:
+                # continue from the last decoded frame
+                start = self.__last_index + 1
+            else:
+                self.__canvas = decode_keyframe(
+                    self.__record(keyframe), self.__size(keyframe)
+                )
+                start = keyframe + 1
+
+            for i in range(start, index + 1):
+                apply_delta(self.__canvas, self.__record(i), self.__size(i))
+
+            self.__last_index = index
+            return bytes(self.__canvas)
+
+    def decode_surface(self, index: int) -> Surface:
+        return pygame.image.frombytes(self.decode(index), self.__size(index), "RGBA")
+
+    def read(self) -> SpriteSheetData:
+        """Decodes every frame of the pack."""
+        frames = tuple(
+            Frame(surface=self.decode_surface(i), duration=entry["duration"])
+            for i, entry in enumerate(self.__entries)
+        )
+        direction = self.header["direction"]
+        return SpriteSheetData(
+            frames=frames,
+            repeat=self.header["repeat"],
+            direction=direction_from_path(direction) if direction else None,
+            tags=tags_from_dict(self.header["tags"]),
+        )
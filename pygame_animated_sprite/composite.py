@@ -0,0 +1,164 @@
+"""
+Layered composite sprites
+
+A ``LayeredSprite`` plays several ``AnimatedSprite`` layers on one timeline and
+blits them as a single surface. Every combination of layer frames is
+flattened once and kept in an LRU cache bounded by a memory budget.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from pygame import Surface, Vector2, SRCALPHA
+
+from pygame_animated_sprite._cache import (
+    DEFAULT_BUDGET,
+    CacheStats,
+    SurfaceLRUCache,
+    next_token,
+)
+from pygame_animated_sprite.sprite import AnimatedSprite
+
+
+@dataclass(frozen=True)
+class Layer:
+    name: str
+    sprite: AnimatedSprite
+    offset: tuple[int, int]
+    token: int  # unique per layer assignment, part of the cache key
+
+
+class LayeredSprite:
+    """
+    Several animated sprites stacked and played on one timeline.
+    """
+
+    def __init__(self, budget: int = DEFAULT_BUDGET) -> None:
+        """
+        :param budget: The maximum memory used by the composited frames (bytes).
+        """
+        self.__layers: list[Layer] = []
+        self.__cache: SurfaceLRUCache = SurfaceLRUCache(budget)
+        return
+
+    def __len__(self) -> int:
+        """Returns the number of layers."""
+        return len(self.__layers)
+
+    def __contains__(self, name: str) -> bool:
+        return any(layer.name == name for layer in self.__layers)
+
+    @property
+    def layers(self) -> tuple[Layer, ...]:
+        """The layers, from bottom to top."""
+        return tuple(self.__layers)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss and memory statistics of the composited frame cache."""
+        return self.__cache.stats
+
+    def get_layer(self, name: str) -> AnimatedSprite:
+        """Gets the sprite of a layer."""
+        for layer in self.__layers:
+            if layer.name == name:
+                return layer.sprite
+        raise KeyError(name)
+
+    def set_layer(
+        self,
+        name: str,
+        sprite: AnimatedSprite,
+        offset: tuple[int, int] = (0, 0),
+        index: Optional[int] = None,
+    ) -> None:
+        """
+        Adds or replaces a layer.
+
+        :param name: The name of the layer.
+        :param sprite: The sprite drawn on the layer.
+        :param offset: The position of the layer in the composite.
+        :param index: The position in the stack. A replaced layer keeps its
+                      position and a new one goes on top by default.
+        """
+        if offset[0] < 0 or offset[1] < 0:
+            raise ValueError("offset cannot be negative.")
+
+        layer = Layer(name=name, sprite=sprite, offset=offset, token=next_token())
+
+        for i, current in enumerate(self.__layers):
+            if current.name == name:
+                del self.__layers[i]
+                if index is None:
+                    index = i
+                break
+
+        if index is None:
+            index = len(self.__layers)
+        self.__layers.insert(index, layer)
+        return
+
+    def remove_layer(self, name: str) -> None:
+        """Removes a layer."""
+        for i, layer in enumerate(self.__layers):
+            if layer.name == name:
+                del self.__layers[i]
+                return
+        raise KeyError(name)
+
+    def clear_cache(self) -> None:
+        """Drops every composited frame, e.g. after the layer frames were edited."""
+        self.__cache.clear()
+        return
+
+    def is_playing(self) -> bool:
+        """Returns True if any layer is playing."""
+        return any(layer.sprite.is_playing() for layer in self.__layers)
+
+    def play(self) -> None:
+        """Plays every layer."""
+        for layer in self.__layers:
+            layer.sprite.play()
+        return
+
+    def pause(self) -> None:
+        """Pauses every layer."""
+        for layer in self.__layers:
+            layer.sprite.pause()
+        return
+
+    def reset(self) -> None:
+        """Resets every layer to the beginning."""
+        for layer in self.__layers:
+            layer.sprite.reset()
+        return
+
+    def update(self, time_delta: int) -> None:
+        """
+        Updates every layer by a given time delta.
+        """
+        for layer in self.__layers:
+            layer.sprite.update(time_delta)
+        return
+
+    def __composite(self) -> Surface:
+        surfaces = [(layer.sprite.render(), layer.offset) for layer in self.__layers]
+
+        width = max((s.width + x for s, (x, _) in surfaces), default=0)
+        height = max((s.height + y for s, (_, y) in surfaces), default=0)
+
+        composite = Surface((width, height), SRCALPHA)
+        composite.blits(surfaces)
+        return composite
+
+    def render(self) -> Surface:
+        """Renders the current frames of every layer as one surface."""
+        key = tuple((layer.token, layer.sprite.index) for layer in self.__layers)
+        return self.__cache.get_or_create(key, self.__composite)
+
+    def draw(self, surface: Surface, dest: tuple[int, int] | Vector2) -> None:
+        """Draws the composited frame to a surface."""
+        surface.blit(self.render(), dest)
+        return
@@ -59,6 +59,17 @@ class Direction(ABC, Iterator[int]):
         """Resets the internal state for a new iteration loop."""
         self._current_index = 0
 
+    def get_state(self) -> tuple[int, int, int]:
+        """
+        Returns the iteration state as (current index, repeats left, phase).
+        The phase is the travel direction of ping-pong iterators, 0 otherwise.
+        """
+        return self._current_index, self._repeats_left, 0
+
+    def set_state(self, state: tuple[int, int, int]) -> None:
+        """Restores an iteration state returned by get_state."""
+        self._current_index, self._repeats_left, _ = state
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(frame_count={self.frame_count}, repeats={self._initial_repeats})"
 
@@ -115,6 +126,12 @@ class PingPong(Direction):
         self._current_index = 0
         self._direction = 1 if self.frame_count > 1 else 0
 
+    def get_state(self) -> tuple[int, int, int]:
+        return self._current_index, self._repeats_left, self._direction
+
+    def set_state(self, state: tuple[int, int, int]) -> None:
+        self._current_index, self._repeats_left, self._direction = state
+
     def __next__(self) -> int:
         if self._repeats_left == 0 or self.frame_count == 0:
             raise StopIteration
@@ -152,6 +169,12 @@ class PingPongReverse(Direction):
         self._current_index = self.frame_count - 1 if self.frame_count > 0 else 0
         self._direction = -1 if self.frame_count > 1 else 0
 
+    def get_state(self) -> tuple[int, int, int]:
+        return self._current_index, self._repeats_left, self._direction
+
+    def set_state(self, state: tuple[int, int, int]) -> None:
+        self._current_index, self._repeats_left, self._direction = state
+
     def __next__(self) -> int:
         if self._repeats_left == 0 or self.frame_count == 0:
             raise StopIteration
@@ -0,0 +1,218 @@
+"""
+Cached effect variants of frames
+
+Effects such as a team tint, a hit flash, a shadow silhouette or an outline
+are rendered once per frame and parameters, then kept in an LRU cache bounded
+by a memory budget. Rendering an effect on a later tick is a cache lookup.
+"""
+
+from __future__ import annotations
+
+import inspect
+import weakref
+from typing import Any, Callable, Iterable
+
+import pygame.mask
+from pygame import Color, Surface, BLEND_RGB_ADD, BLEND_RGB_MULT, SRCALPHA
+
+from pygame_animated_sprite._cache import (
+    DEFAULT_BUDGET,
+    CacheStats,
+    SurfaceLRUCache,
+    next_token,
+)
+from pygame_animated_sprite.sprite import AnimatedSprite
+from pygame_animated_sprite.structures import Frame
+
+# (surface, *params) -> new surface, the source surface must not be modified
+Effect = Callable[..., Surface]
+
+
+def _copy(surface: Surface) -> Surface:
+    # blend fills need true color pixels and would change the colorkey,
+    # so indexed and colorkeyed surfaces are expanded
+    if surface.get_bitsize() >= 24 and surface.get_colorkey() is None:
+        return surface.copy()
+
+    copy = Surface(surface.get_size(), SRCALPHA)
+    copy.blit(surface, (0, 0))
+    return copy
+
+
+def tint(surface: Surface, color: Any) -> Surface:
+    """Multiplies the colors of the surface, keeping its alpha."""
+    tinted = _copy(surface)
+    tinted.fill(color, special_flags=BLEND_RGB_MULT)
+    return tinted
+
+
+def flash(surface: Surface, color: Any = (255, 255, 255)) -> Surface:
+    """Adds a color to the surface, white by default, keeping its alpha."""
+    flashed = _copy(surface)
+    flashed.fill(color, special_flags=BLEND_RGB_ADD)
+    return flashed
+
+
+def silhouette(surface: Surface, color: Any = (0, 0, 0, 128)) -> Surface:
+    """Fills the opaque pixels of the surface with a single color."""
+    return pygame.mask.from_surface(surface).to_surface(
+        setcolor=color, unsetcolor=(0, 0, 0, 0)
+    )
+
+
+def outline(
+    surface: Surface, color: Any = (255, 255, 255), thickness: int = 1
+) -> Surface:
+    """
+    Draws the surface over an outline of its opaque pixels.
+
+    The result is larger by thickness on every side, draw it at
+    (x - thickness, y - thickness).
+    """
+    if thickness <= 0:
+        raise ValueError("thickness must be greater than 0.")
+
+    mask = pygame.mask.from_surface(surface)
+    size = thickness * 2 + 1
+    grown = mask.convolve(pygame.mask.Mask((size, size), fill=True))
+
+    outlined = grown.to_surface(setcolor=color, unsetcolor=(0, 0, 0, 0))
+    outlined.blit(surface, (thickness, thickness))
+    return outlined
+
+
+BUILTIN_EFFECTS: dict[str, Effect] = {
+    "tint": tint,
+    "flash": flash,
+    "silhouette": silhouette,
+    "outline": outline,
+}
+
+
+def _defaults(effect: Effect) -> tuple[Any, ...]:
+    # the defaults of the positional params after the surface,
+    # Parameter.empty for the required ones
+    try:
+        parameters = list(inspect.signature(effect).parameters.values())[1:]
+    except (TypeError, ValueError):
+        return ()
+
+    defaults: list[Any] = []
+    for parameter in parameters:
+        if parameter.kind not in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            break
+        defaults.append(parameter.default)
+    return tuple(defaults)
+
+
+def _freeze(value: Any) -> Any:
+    # params are part of the cache key
+    if isinstance(value, (Color, list)):
+        return tuple(value)
+    return value
+
+
+class EffectCache:
+    """
+    Effect variants of frames, keyed by (frame surface, effect, params).
+    """
+
+    def __init__(self, budget: int = DEFAULT_BUDGET) -> None:
+        """
+        :param budget: The maximum memory used by the cached variants (bytes).
+        """
+        self.__effects: dict[str, Effect] = dict(BUILTIN_EFFECTS)
+        self.__defaults: dict[str, tuple[Any, ...]] = {
+            name: _defaults(effect) for name, effect in self.__effects.items()
+        }
+        self.__cache: SurfaceLRUCache = SurfaceLRUCache(budget)
+        # a token per source surface, so a new surface never hits the
+        # variants of a collected one with the same id
+        self.__sources: weakref.WeakKeyDictionary[Surface, int] = (
+            weakref.WeakKeyDictionary()
+        )
+        return
+
+    @property
+    def effects(self) -> tuple[str, ...]:
+        """The names of the available effects."""
+        return tuple(self.__effects)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.__cache.stats
+
+    def register(self, name: str, effect: Effect) -> None:
+        """
+        Registers a custom effect.
+
+        :param name: The name of the effect. Replaces an effect of the same name.
+        :param effect: Called with the source surface and the params, returns
+                       a new surface.
+        """
+        self.__effects[name] = effect
+        self.__defaults[name] = _defaults(effect)
+        self.clear()
+        return
+
+    def __key(self, surface: Surface, effect: str, params: tuple[Any, ...]) -> tuple:
+        token = self.__sources.get(surface)
+        if token is None:
+            token = next_token()
+            self.__sources[surface] = token
+        return token, effect, tuple(map(_freeze, params))
+
+    def get(self, frame: Frame | Surface, effect: str, *params: Any) -> Surface:
+        """
+        Gets an effect variant of a frame, rendering it on a miss.
+
+        :param frame: The frame or the surface to apply the effect to.
+        :param effect: The name of the effect.
+        :param params: The params of the effect, e.g. a color. Must be hashable.
+        """
+        if effect not in self.__effects:
+            raise KeyError(f"unknown effect {effect}.")
+
+        # bind the defaults, flash(s) and flash(s, (255, 255, 255)) share a key
+        for default in self.__defaults[effect][len(params) :]:
+            if default is inspect.Parameter.empty:
+                break
+            params += (default,)
+
+        surface = frame.surface if isinstance(frame, Frame) else frame
+        key = self.__key(surface, effect, params)
+
+        variant = self.__cache.get(key)
+        if variant is None:
+            variant = self.__effects[effect](surface, *params)
+            self.__cache.put(key, variant)
+        return variant
+
+    def render(self, sprite: AnimatedSprite, effect: str, *params: Any) -> Surface:
+        """Gets an effect variant of the current frame of a sprite."""
+        return self.get(sprite.get_current_frame(), effect, *params)
+
+    def precompute(
+        self,
+        frames: AnimatedSprite | Iterable[Frame],
+        effect: str,
+        *params: Any,
+    ) -> None:
+        """
+        Renders an effect for every frame of a clip ahead of time. Variants
+        beyond the budget evict the least recently used ones.
+        """
+        if isinstance(frames, AnimatedSprite):
+            frames = frames.frames
+
+        for frame in {id(frame.surface): frame for frame in frames}.values():
+            self.get(frame, effect, *params)
+        return
+
+    def clear(self) -> None:
+        """Drops every cached variant."""
+        self.__cache.clear()
+        return
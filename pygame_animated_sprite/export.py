@@ -0,0 +1,314 @@
+"""
+Offline export of animations
+
+The playback of an ``AnimatedSprite`` is sampled at a fixed frame rate as a
+generator and written as a PNG sequence or an animated PNG. Frames are PNG
+encoded in a thread pool (zlib releases the GIL) with a bounded number of
+frames in flight, so long animations export in constant memory.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+
+import pygame.image
+from pygame import Surface, SRCALPHA
+
+from pygame_animated_sprite.sprite import AnimatedSprite
+from pygame_animated_sprite.structures import Frame
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# APNG frame delays are stored as 16-bit fractions
+MAX_DELAY = 0xFFFF
+
+
+def iter_timeline(
+    sprite: AnimatedSprite, fps: float, duration: Optional[int] = None
+) -> Iterator[Frame]:
+    """
+    Samples the playback of a sprite at a fixed frame rate.
+
+    The direction, repeats and per-frame durations of the sprite are followed
+    from the beginning. The sprite itself is not modified.
+
+    :param sprite: The sprite to sample.
+    :param fps: The output frame rate.
+    :param duration: Stops after this time (ms). Required for infinite repeats.
+    :return: A generator of the frame shown at every output tick.
+    """
+    if fps <= 0:
+        raise ValueError("fps must be greater than 0.")
+    if sprite.repeat < 0 and duration is None:
+        raise ValueError("duration is required for infinitely repeating sprites.")
+
+    frames = sprite.frames
+    if not frames:
+        return
+    if sprite.repeat < 0 and sum(frame.duration for frame in frames) <= 0:
+        raise ValueError("sprite has no duration to sample.")
+
+    direction = sprite.direction(frame_count=len(frames), repeats=sprite.repeat)
+
+    tick = 0
+    start = 0.0
+    for index in direction:
+        end = start + frames[index].duration
+        if duration is not None:
+            end = min(end, duration)
+
+        while tick * 1000 / fps < end:
+            yield frames[index]
+            tick += 1
+
+        start = end
+        if duration is not None and start >= duration:
+            return
+    return
+
+
+def iter_runs(
+    sprite: AnimatedSprite, fps: float, duration: Optional[int] = None
+) -> Iterator[tuple[Frame, int]]:
+    """
+    Like iter_timeline, but merges consecutive identical frames.
+
+    :return: A generator of (frame, number of ticks) pairs.
+    """
+    current: Optional[Frame] = None
+    count = 0
+    for frame in iter_timeline(sprite, fps, duration):
+        if frame is current:
+            count += 1
+            continue
+
+        if current is not None:
+            yield current, count
+        current, count = frame, 1
+
+    if current is not None:
+        yield current, count
+    return
+
+
+def _canvas_size(sprite: AnimatedSprite) -> tuple[int, int]:
+    frames = sprite.frames
+    return (
+        max((frame.surface.width for frame in frames), default=1),
+        max((frame.surface.height for frame in frames), default=1),
+    )
+
+
+def _to_rgba(surface: Surface, size: tuple[int, int]) -> bytes:
+    if surface.get_size() != size:
+        canvas = Surface(size, SRCALPHA)
+        canvas.blit(surface, (0, 0))
+        surface = canvas
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + kind
+        + data
+        + struct.pack(">I", zlib.crc32(kind + data))
+    )
+
+
+def _ihdr(size: tuple[int, int]) -> bytes:
+    # 8-bit RGBA, no interlace
+    return _chunk(b"IHDR", struct.pack(">IIBBBBB", size[0], size[1], 8, 6, 0, 0, 0))
+
+
+def _compress(raw: bytes, width: int, level: int) -> bytes:
+    stride = width * 4
+    scanlines = b"".join(
+        b"\x00" + raw[i : i + stride] for i in range(0, len(raw), stride)
+    )
+    return zlib.compress(scanlines, level)
+
+
+def _encode_png(raw: bytes, size: tuple[int, int], level: int) -> bytes:
+    return (
+        PNG_SIGNATURE
+        + _ihdr(size)
+        + _chunk(b"IDAT", _compress(raw, size[0], level))
+        + _chunk(b"IEND", b"")
+    )
+
+
+def _encode_apng_frame(
+    raw: bytes, size: tuple[int, int], delay: int, level: int
+) -> tuple[int, bytes]:
+    return delay, _compress(raw, size[0], level)
+
+
+def _pipeline(
+    jobs: Iterator[tuple[Callable[..., Any], tuple]],
+    write: Callable[[Any], None],
+    workers: Optional[int],
+    max_pending: Optional[int],
+) -> None:
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+
+    pending: deque[Future[Any]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for function, args in jobs:
+            pending.append(executor.submit(function, *args))
+            # write in order, keeping a bounded number of frames in memory
+            while len(pending) >= max_pending:
+                write(pending.popleft().result())
+
+        while pending:
+            write(pending.popleft().result())
+    return
+
+
+def export_png_sequence(
+    sprite: AnimatedSprite,
+    directory: str | Path,
+    fps: float,
+    duration: Optional[int] = None,
+    name: str = "frame_{:05}.png",
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    level: int = 6,
+) -> int:
+    """
+    Exports the playback of a sprite as one PNG file per output frame.
+
+    :param sprite: The sprite to export.
+    :param directory: The output directory, created if missing.
+    :param fps: The output frame rate.
+    :param duration: Stops after this time (ms). Required for infinite repeats.
+    :param name: The file name format, given the frame number.
+    :param workers: The number of encoding threads. Defaults to the CPU count.
+    :param max_pending: The maximum number of frames in flight.
+    :param level: The zlib compression level.
+    :return: The number of written files.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    size = _canvas_size(sprite)
+    count = 0
+
+    def jobs() -> Iterator[tuple[Callable[..., Any], tuple]]:
+        for frame in iter_timeline(sprite, fps, duration):
+            yield _encode_png, (_to_rgba(frame.surface, size), size, level)
+
+    def write(data: bytes) -> None:
+        nonlocal count
+        with open(directory / name.format(count), "wb") as file:
+            file.write(data)
+        count += 1
+        return
+
+    _pipeline(jobs(), write, workers, max_pending)
+    return count
+
+
+def export_apng(
+    sprite: AnimatedSprite,
+    path: str | Path | BinaryIO,
+    fps: float,
+    duration: Optional[int] = None,
+    loops: int = 0,
+    workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    level: int = 6,
+) -> int:
+    """
+    Exports the playback of a sprite as an animated PNG.
+
+    Consecutive identical output frames are merged into one longer APNG frame.
+
+    :param sprite: The sprite to export.
+    :param path: The output file, or a seekable binary file object.
+    :param fps: The output frame rate.
+    :param duration: Stops after this time (ms). Required for infinite repeats.
+    :param loops: The number of times viewers play the file, 0 for infinite.
+    :param workers: The number of encoding threads. Defaults to the CPU count.
+    :param max_pending: The maximum number of frames in flight.
+    :param level: The zlib compression level.
+    :return: The number of APNG frames.
+    """
+    if isinstance(path, (str, Path)):
+        with open(path, "wb") as file:
+            return export_apng(
+                sprite, file, fps, duration, loops, workers, max_pending, level
+            )
+
+    file = path
+    size = _canvas_size(sprite)
+    delay_den = round(fps) if float(fps).is_integer() else 1000
+    tick_delay = 1 if delay_den != 1000 else round(1000 / fps)
+
+    file.write(PNG_SIGNATURE + _ihdr(size))
+    actl_position = file.tell()
+    file.write(_chunk(b"acTL", struct.pack(">II", 0, loops)))
+
+    sequence = 0
+    frame_count = 0
+
+    def jobs() -> Iterator[tuple[Callable[..., Any], tuple]]:
+        for frame, ticks in iter_runs(sprite, fps, duration):
+            delay = ticks * tick_delay
+            while delay > 0:
+                part = min(delay, MAX_DELAY)
+                delay -= part
+                yield _encode_apng_frame, (
+                    _to_rgba(frame.surface, size),
+                    size,
+                    part,
+                    level,
+                )
+
+    def write(result: tuple[int, bytes]) -> None:
+        nonlocal sequence, frame_count
+        delay, data = result
+
+        file.write(
+            _chunk(
+                b"fcTL",
+                struct.pack(
+                    ">IIIIIHHBB",
+                    sequence,
+                    size[0],
+                    size[1],
+                    0,
+                    0,
+                    delay,
+                    delay_den,
+                    0,  # APNG_DISPOSE_OP_NONE
+                    0,  # APNG_BLEND_OP_SOURCE
+                ),
+            )
+        )
+        sequence += 1
+
+        if frame_count == 0:
+            file.write(_chunk(b"IDAT", data))
+        else:
+            file.write(_chunk(b"fdAT", struct.pack(">I", sequence) + data))
+            sequence += 1
+        frame_count += 1
+        return
+
+    _pipeline(jobs(), write, workers, max_pending)
+    if frame_count == 0:
+        raise ValueError("nothing to export.")
+    file.write(_chunk(b"IEND", b""))
+
+    end = file.tell()
+    file.seek(actl_position)
+    file.write(_chunk(b"acTL", struct.pack(">II", frame_count, loops)))
+    file.seek(end)
+    return frame_count
@@ -0,0 +1,141 @@
+"""
+Group update of many animated sprites
+
+On free-threaded CPython builds the members of an ``AnimatedSpriteGroup`` are
+split into contiguous chunks and advanced in a thread pool. The playback state
+of a sprite (its timer and direction iterator) belongs to that sprite only and
+every sprite is in exactly one chunk, so no locking is needed. Frames are only
+read. On builds with the GIL the update runs serially.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+from pygame_animated_sprite.sprite import AnimatedSprite
+
+
+def is_gil_enabled() -> bool:
+    """Returns True unless running on a free-threaded build with the GIL off."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+class AnimatedSpriteGroup:
+    """
+    A collection of animated sprites updated together.
+    """
+
+    def __init__(
+        self,
+        sprites: Iterable[AnimatedSprite] = (),
+        workers: Optional[int] = None,
+        min_chunk_size: int = 256,
+        parallel: Optional[bool] = None,
+    ) -> None:
+        """
+        :param sprites: The initial members.
+        :param workers: The number of update threads. Defaults to the CPU count.
+        :param min_chunk_size: The minimum number of sprites per thread.
+        :param parallel: Forces parallel (True) or serial (False) updates.
+                         Parallel only when the GIL is disabled by default.
+        """
+        self.__sprites: dict[int, AnimatedSprite] = {}
+        self.__order: Optional[list[AnimatedSprite]] = None
+        self.workers: int = workers or os.cpu_count() or 1
+        self.min_chunk_size: int = max(min_chunk_size, 1)
+        self.parallel: bool = not is_gil_enabled() if parallel is None else parallel
+        self.__executor: Optional[ThreadPoolExecutor] = None
+
+        for sprite in sprites:
+            self.add(sprite)
+        return
+
+    def __len__(self) -> int:
+        return len(self.__sprites)
+
+    def __iter__(self) -> Iterator[AnimatedSprite]:
+        return iter(self.sprites)
+
+    def __contains__(self, sprite: AnimatedSprite) -> bool:
+        return id(sprite) in self.__sprites
+
+    @property
+    def sprites(self) -> list[AnimatedSprite]:
+        """The members, in insertion order."""
+        if self.__order is None:
+            self.__order = list(self.__sprites.values())
+        return self.__order
+
+    def add(self, *sprites: AnimatedSprite) -> None:
+        for sprite in sprites:
+            self.__sprites[id(sprite)] = sprite
+        self.__order = None
+        return
+
+    def remove(self, *sprites: AnimatedSprite) -> None:
+        for sprite in sprites:
+            del self.__sprites[id(sprite)]
+        self.__order = None
+        return
+
+    def clear(self) -> None:
+        self.__sprites.clear()
+        self.__order = None
+        return
+
+    def __chunks(self) -> list[list[AnimatedSprite]]:
+        sprites = self.sprites
+        count = min(self.workers, max(len(sprites) // self.min_chunk_size, 1))
+        size = -(-len(sprites) // count)
+        return [sprites[i : i + size] for i in range(0, len(sprites), size)]
+
+    @staticmethod
+    def __update_chunk(sprites: list[AnimatedSprite], time_delta: int) -> None:
+        for sprite in sprites:
+            sprite.update(time_delta)
+        return
+
+    def update(self, time_delta: int) -> None:
+        """
+        Updates every member by a given time delta.
+        """
+        if not self.parallel or self.workers <= 1:
+            self.__update_chunk(self.sprites, time_delta)
+            return
+
+        chunks = self.__chunks()
+        if len(chunks) <= 1:
+            self.__update_chunk(self.sprites, time_delta)
+            return
+
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="AnimatedSpriteGroup"
+            )
+
+        futures = [
+            self.__executor.submit(self.__update_chunk, chunk, time_delta)
+            for chunk in chunks
+        ]
+        for future in futures:
+            # re-raises errors from the worker threads
+            future.result()
+        return
+
+    def close(self) -> None:
+        """Stops the update threads."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+        return
+
+    def __enter__(self) -> AnimatedSpriteGroup:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        return
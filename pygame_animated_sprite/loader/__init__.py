@@ -1,5 +1,33 @@
 from pygame_animated_sprite.loader.base import (
+    SheetLayout,
     SpriteSheetData,
     UnsupportedFileFormatError,
 )
-from pygame_animated_sprite.loader.simple import SimpleSpriteSheetLoader
+from pygame_animated_sprite.loader.source import (
+    AssetSource,
+    DirectorySource,
+    MemorySource,
+    ZipSource,
+)
+from pygame_animated_sprite.loader.registry import (
+    find_loader_class,
+    get_loader,
+    register_loader,
+    unregister_loader,
+)
+
+# loader modules are imported on first use
+__lazy_loaders: dict[str, str] = {
+    "SimpleSpriteSheetLoader": "pygame_animated_sprite.loader.simple",
+    "AsepriteSpriteSheetLoader": "pygame_animated_sprite.loader.aseprite",
+    "ImageSpriteSheetLoader": "pygame_animated_sprite.loader.image",
+    "PackSpriteSheetLoader": "pygame_animated_sprite.loader.pack",
+}
+
+
+def __getattr__(name: str):
+    if name in __lazy_loaders:
+        import importlib
+
+        return getattr(importlib.import_module(__lazy_loaders[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
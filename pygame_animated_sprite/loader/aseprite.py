@@ -3,12 +3,13 @@ from __future__ import annotations
 import json
 import warnings
 from pathlib import Path
-from typing import Literal, TypedDict, Optional
+from typing import BinaryIO, Literal, TypedDict, Optional
 
 import pygame.image
-from pygame import Surface
+from pygame import Rect, Surface
 
 from pygame_animated_sprite._utils import clip_surface
+from pygame_animated_sprite.palette import quantize_frames
 from pygame_animated_sprite.structures import Frame, Tag
 from pygame_animated_sprite.direction import (
     Direction,
@@ -19,8 +20,10 @@ from pygame_animated_sprite.direction import (
 )
 from pygame_animated_sprite.loader.base import (
     BaseSpriteSheetLoader,
+    SheetLayout,
     SpriteSheetData,
 )
+from pygame_animated_sprite.loader.source import AssetSource, DirectorySource
 
 # __JsonFormat = Literal["array", "hash"]
 __Size = TypedDict("__Size", {"w": int, "h": int})
@@ -47,6 +50,8 @@ __Tag = TypedDict(
         "color": str,
     },
 )
+__SliceKey = TypedDict("__SliceKey", {"frame": int, "bounds": __Rect})
+__Slice = TypedDict("__Slice", {"name": str, "color": str, "keys": list[__SliceKey]})
 __Meta = TypedDict(
     "__Meta",
     {
@@ -57,6 +62,7 @@ __Meta = TypedDict(
         "size": __Size,
         "scale": str,
         "frameTags": list[__Tag],
+        "slices": list[__Slice],
     },
 )
 
@@ -67,9 +73,12 @@ class AsepriteSpriteSheetLoader(BaseSpriteSheetLoader):
     # minimum supported version
     MIN_SUPPORTED_VERSION = (1, 2)
 
-    def __init__(self, image: Optional[Surface] = None) -> None:
+    def __init__(self, image: Optional[Surface] = None, indexed: bool = False) -> None:
         # self.json_format: __JsonFormat = json_format
         self.image = image
+
+        # keep frames as 8-bit palettized surfaces
+        self.indexed = indexed
         return
 
     def __warn_if_unsupported_version(self, version: str) -> None:
@@ -120,6 +129,39 @@ class AsepriteSpriteSheetLoader(BaseSpriteSheetLoader):
 
         return tags
 
+    def __load_slices(
+        self, frame_count: int, slices: list[__Slice]
+    ) -> list[dict[str, Rect]]:
+        # a slice key applies from its frame until the next key
+        hitboxes: list[dict[str, Rect]] = [{} for _ in range(frame_count)]
+        for slice_data in slices:
+            keys = sorted(slice_data["keys"], key=lambda key: key["frame"])
+            for i, key in enumerate(keys):
+                end = keys[i + 1]["frame"] if i + 1 < len(keys) else frame_count
+                bounds = key["bounds"]
+                for frame_hitboxes in hitboxes[key["frame"] : end]:
+                    frame_hitboxes[slice_data["name"]] = Rect(
+                        bounds["x"], bounds["y"], bounds["w"], bounds["h"]
+                    )
+        return hitboxes
+
+    def __load_layout(self, data: dict) -> Optional[SheetLayout]:
+        frames_raw: list[__Frames] = data["frames"]
+        # trimmed frames are merged into the previous one
+        if type(frames_raw) != list or any(f["trimmed"] for f in frames_raw):
+            return None
+
+        meta: __Meta = data["meta"]
+        return SheetLayout(
+            rects=tuple(
+                (f["frame"]["x"], f["frame"]["y"], f["frame"]["w"], f["frame"]["h"])
+                for f in frames_raw
+            ),
+            durations=tuple(f["duration"] for f in frames_raw),
+            tags=self.__load_tags(meta["frameTags"]),
+            hitboxes=tuple(self.__load_slices(len(frames_raw), meta.get("slices", []))),
+        )
+
     def __load_frames(
         self, image: Surface, frames_raw: list[__Frames]
     ) -> tuple[Frame, ...]:
@@ -174,21 +216,62 @@ class AsepriteSpriteSheetLoader(BaseSpriteSheetLoader):
 
         return tuple(frames)
 
-    def load_file(self, path: Path) -> SpriteSheetData:
+    def dependencies(self, path: Path) -> list[Path]:
+        if self.image is not None or not path.is_file():
+            return []
+
         with open(path.as_posix(), "r") as file:
-            data = json.load(file)
+            meta = json.load(file)["meta"]
+
+        if "image" not in meta:
+            return []
+        return [path.parent / meta["image"]]
+
+    def load_layout(self, path: Path) -> Optional[SheetLayout]:
+        # an image given to the loader is not read from a file
+        if self.image is not None or self.indexed:
+            return None
+
+        with open(path.as_posix(), "rb") as file:
+            return self.__load_layout(json.load(file))
+
+    def load_file(self, path: Path) -> SpriteSheetData:
+        with open(path.as_posix(), "rb") as file:
+            return self.load_stream(file, path.name, DirectorySource(path.parent))
+
+    def load_stream(
+        self, file: BinaryIO, name: str, source: Optional[AssetSource] = None
+    ) -> SpriteSheetData:
+        data = json.load(file)
 
         meta: __Meta = data["meta"]
         self.__warn_if_unsupported_version(meta["version"])
 
+        layout: Optional[SheetLayout] = None
         if self.image is None:
-            if "image" in meta:
-                self.image = pygame.image.load(str(path.parent / meta["image"]))
+            if "image" in meta and source is not None:
+                image_name = source.resolve(meta["image"], name)
+                with source.open(image_name) as image_file:
+                    self.image = pygame.image.load(image_file, image_name)
+                if not self.indexed:
+                    layout = self.__load_layout(data)
             else:
                 raise RuntimeError
 
         tags = self.__load_tags(meta["frameTags"])
         frames = self.__load_frames(self.image.copy(), data["frames"])
+        if self.indexed:
+            frames = quantize_frames(frames)
+        hitboxes = self.__load_slices(len(frames), meta.get("slices", []))
+        for frame, frame_hitboxes in zip(frames, hitboxes):
+            frame.hitboxes = frame_hitboxes
 
         # repeat=-1 (infinite), direction=Forward (default)
-        return SpriteSheetData(frames=frames, repeat=-1, direction=Forward, tags=tags)
+        return SpriteSheetData(
+            frames=frames,
+            repeat=-1,
+            direction=Forward,
+            tags=tags,
+            image=self.image if layout is not None else None,
+            layout=layout,
+        )
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from dataclasses import dataclass, field
 
+from pygame import Rect, Surface
+
 from pygame_animated_sprite.direction import Direction
 from pygame_animated_sprite.structures import Frame, Tag
+from pygame_animated_sprite.loader.source import AssetSource
+
+
+@dataclass(frozen=True)
+class SheetLayout:
+    """
+    Where the frames of a sheet are in its image, for sheets whose frames
+    are plain clips of a single image: the only dependency of the sheet or
+    the sheet file itself.
+    """
+
+    rects: tuple[tuple[int, int, int, int], ...]  # (x, y, w, h), not clamped
+    durations: tuple[int, ...]
+    tags: dict[str, Tag] = field(default_factory=dict)
+    hitboxes: tuple[dict[str, Rect], ...] = field(default=())
 
 
 @dataclass(frozen=True)
@@ -14,6 +32,9 @@ class SpriteSheetData:
     repeat: int = field(default=-1)
     direction: Optional[type[Direction]] = field(default=None)
     tags: Optional[dict[str, Tag]] = field(default=None)
+    # the decoded image and the layout of the frames, see SheetLayout
+    image: Optional[Surface] = field(default=None, repr=False)
+    layout: Optional[SheetLayout] = field(default=None, repr=False)
 
 
 class BaseSpriteSheetLoader:
@@ -23,11 +44,52 @@ class BaseSpriteSheetLoader:
     def load_folder(self, path: Path) -> SpriteSheetData:
         raise NotImplementedError("folder load is not implemented.")
 
-    def load(self, path: Path) -> SpriteSheetData:
+    def load_stream(
+        self, file: BinaryIO, name: str, source: Optional[AssetSource] = None
+    ) -> SpriteSheetData:
+        raise NotImplementedError("stream load is not implemented.")
+
+    def load(
+        self,
+        path: Path | str | bytes | BinaryIO,
+        source: Optional[AssetSource] = None,
+        name: str = "",
+    ) -> SpriteSheetData:
+        """
+        Loads a sprite sheet.
+
+        :param path: A file or folder path, the name of an asset in source,
+                     raw bytes or a binary file object.
+        :param source: The source to read path and the files it references from.
+        :param name: The file name of raw bytes or a file object, used as a
+                     format hint and to resolve referenced files in source.
+        """
+        if isinstance(path, (bytes, bytearray, memoryview)):
+            return self.load_stream(io.BytesIO(path), name, source)
+
+        if hasattr(path, "read"):
+            return self.load_stream(path, name or getattr(path, "name", ""), source)
+
+        if source is not None:
+            with source.open(str(path)) as file:
+                return self.load_stream(file, str(path), source)
+
+        path = Path(path)
         if path.is_file():
             return self.load_file(path)
         return self.load_folder(path)
 
+    def dependencies(self, path: Path) -> list[Path]:
+        """Other files read when loading path, e.g. the image of a json sheet."""
+        return []
+
+    def load_layout(self, path: Path) -> Optional[SheetLayout]:
+        """
+        Reads the layout of a sheet without decoding its image.
+        None when the frames are not plain clips of the image.
+        """
+        return None
+
 
 class UnsupportedFileFormatError(Exception):
     pass
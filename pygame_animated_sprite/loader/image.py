@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import pygame.image
+from pygame import Surface
+
+from pygame_animated_sprite.structures import Frame
+from pygame_animated_sprite.direction import Forward
+from pygame_animated_sprite.loader.base import (
+    BaseSpriteSheetLoader,
+    SpriteSheetData,
+)
+from pygame_animated_sprite.loader.source import AssetSource
+
+
+class ImageSpriteSheetLoader(BaseSpriteSheetLoader):
+    """Single image loader, one frame with no duration"""
+
+    def __load_image(self, image: Surface) -> SpriteSheetData:
+        return SpriteSheetData(
+            frames=(Frame(surface=image, duration=0),),
+            repeat=-1,
+            direction=Forward,
+            tags={},
+        )
+
+    def load_file(self, path: Path) -> SpriteSheetData:
+        return self.__load_image(pygame.image.load(path.as_posix()))
+
+    def load_stream(
+        self, file: BinaryIO, name: str, source: Optional[AssetSource] = None
+    ) -> SpriteSheetData:
+        return self.__load_image(pygame.image.load(file, name))
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from pygame_animated_sprite.codec import PackReader
+from pygame_animated_sprite.loader.base import (
+    BaseSpriteSheetLoader,
+    SpriteSheetData,
+)
+from pygame_animated_sprite.loader.source import AssetSource
+
+
+class PackSpriteSheetLoader(BaseSpriteSheetLoader):
+    """Delta/RLE compressed pack file loader, see pygame_animated_sprite.codec"""
+
+    def load_file(self, path: Path) -> SpriteSheetData:
+        return PackReader.open(path).read()
+
+    def load_stream(
+        self, file: BinaryIO, name: str, source: Optional[AssetSource] = None
+    ) -> SpriteSheetData:
+        return PackReader.open(file).read()
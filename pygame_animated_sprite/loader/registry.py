@@ -0,0 +1,239 @@
+"""
+Loader registry
+
+Loaders are registered by import path and only imported the first time a file
+needs them. A loader is picked by file extension, then by the magic bytes at
+the start of the file. Third party loaders are registered through the
+``pygame_animated_sprite.loaders`` entry point group, named by extension::
+
+    [project.entry-points."pygame_animated_sprite.loaders"]
+    ".ase" = "my_package.loader:AseLoader"
+
+Entry point loaders are registered before any call to ``register_loader``
+takes effect, so an explicit registration always wins over a plugin. Magic
+bytes are declared with ``register_loader``, entry point loaders are only
+picked by extension, so they are not imported to sniff a file.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import BinaryIO, Optional
+
+from pygame_animated_sprite.loader.base import (
+    BaseSpriteSheetLoader,
+    UnsupportedFileFormatError,
+)
+from pygame_animated_sprite.loader.source import AssetSource
+
+ENTRY_POINT_GROUP = "pygame_animated_sprite.loaders"
+
+# the longest magic prefix read from a file
+MAGIC_SIZE = 16
+
+
+@dataclass(frozen=True)
+class LoaderEntry:
+    name: str
+    target: str  # "module:attribute"
+    extensions: tuple[str, ...] = field(default=())
+    magic: tuple[bytes, ...] = field(default=())
+
+    def load_class(self) -> type[BaseSpriteSheetLoader]:
+        """Imports the loader class."""
+        return _import_target(self.target)
+
+
+_entries: dict[str, LoaderEntry] = {}
+_entry_points_loaded: bool = False
+
+
+@lru_cache(maxsize=None)
+def _import_target(target: str) -> type[BaseSpriteSheetLoader]:
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def register_loader(
+    name: str,
+    target: str,
+    extensions: tuple[str, ...] = (),
+    magic: tuple[bytes, ...] = (),
+) -> None:
+    """
+    Registers a loader. Later registrations take precedence, over built-in
+    and entry point loaders too.
+
+    :param name: The name of the loader.
+    :param target: The import path of the loader class ("module:Class").
+    :param extensions: The file extensions handled by the loader.
+    :param magic: The byte prefixes identifying files handled by the loader.
+    """
+    # installed plugins must not override what the user registers
+    _load_entry_points()
+    _register(name, target, extensions, magic)
+    return
+
+
+def _register(
+    name: str,
+    target: str,
+    extensions: tuple[str, ...] = (),
+    magic: tuple[bytes, ...] = (),
+) -> None:
+    # re-registering moves the loader to the front of the lookup order
+    _entries.pop(name, None)
+    _entries[name] = LoaderEntry(
+        name=name,
+        target=target,
+        extensions=tuple(ext.lower() for ext in extensions),
+        magic=tuple(magic),
+    )
+    _find_by_extension.cache_clear()
+    return
+
+
+def unregister_loader(name: str) -> None:
+    """Removes a registered loader."""
+    del _entries[name]
+    _find_by_extension.cache_clear()
+    return
+
+
+def get_loader_entries() -> tuple[LoaderEntry, ...]:
+    """Returns the registered loaders, most recent first."""
+    _load_entry_points()
+    return tuple(reversed(_entries.values()))
+
+
+def _load_entry_points() -> None:
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+
+    # importlib.metadata is slow to import, only pay for it when dispatching
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        extensions = (entry_point.name,) if entry_point.name.startswith(".") else ()
+        _register(
+            name=entry_point.name,
+            target=entry_point.value,
+            extensions=extensions,
+        )
+    return
+
+
+@lru_cache(maxsize=None)
+def _find_by_extension(suffix: str) -> Optional[LoaderEntry]:
+    for entry in get_loader_entries():
+        if suffix in entry.extensions:
+            return entry
+    return None
+
+
+def _find_by_magic(header: bytes) -> Optional[LoaderEntry]:
+    for entry in get_loader_entries():
+        if any(header.startswith(m) for m in entry.magic):
+            return entry
+    return None
+
+
+def sniff(header: bytes) -> bytes:
+    """Normalizes a file header for magic matching."""
+    # text formats may start with whitespace or a byte order mark
+    stripped = header.removeprefix(b"\xef\xbb\xbf").lstrip()
+    return stripped if stripped[:1] in (b"{", b"[") else header
+
+
+def _read_header(
+    path: str | Path | bytes | BinaryIO, source: Optional[AssetSource]
+) -> bytes:
+    if isinstance(path, (bytes, bytearray, memoryview)):
+        return bytes(path[:MAGIC_SIZE])
+
+    if hasattr(path, "read"):
+        # peek without consuming the stream
+        position = path.tell()
+        header = path.read(MAGIC_SIZE)
+        path.seek(position)
+        return header
+
+    try:
+        if source is not None:
+            with source.open(str(path)) as file:
+                return file.read(MAGIC_SIZE)
+
+        with open(path, "rb") as file:
+            return file.read(MAGIC_SIZE)
+    except OSError:
+        return b""
+
+
+def find_loader_class(
+    path: str | Path | bytes | BinaryIO,
+    header: Optional[bytes] = None,
+    source: Optional[AssetSource] = None,
+    name: str = "",
+) -> type[BaseSpriteSheetLoader]:
+    """
+    Finds the loader class for a file.
+
+    :param path: A file path, the name of an asset in source, raw bytes or a
+                 binary file object. Only the extension is used if it is known.
+    :param header: The first bytes of the file. Read from path if not given.
+    :param source: The source to read the asset from.
+    :param name: The file name of raw bytes or a file object.
+    :return: The loader class.
+    """
+    if isinstance(path, (str, Path)):
+        name = str(path)
+    elif not name:
+        name = getattr(path, "name", "")
+
+    entry = _find_by_extension(PurePath(name).suffix.lower())
+    if entry is None:
+        if header is None:
+            header = _read_header(path, source)
+        entry = _find_by_magic(sniff(header))
+
+    if entry is None:
+        raise UnsupportedFileFormatError(
+            f"no loader found for {PurePath(name).name or 'data'}"
+        )
+
+    return entry.load_class()
+
+
+def get_loader(
+    path: str | Path | bytes | BinaryIO,
+    header: Optional[bytes] = None,
+    source: Optional[AssetSource] = None,
+    name: str = "",
+) -> BaseSpriteSheetLoader:
+    """Creates a loader with default settings for a file."""
+    return find_loader_class(path, header, source, name)()
+
+
+_register(
+    name="image",
+    target="pygame_animated_sprite.loader.image:ImageSpriteSheetLoader",
+    extensions=(".png", ".jpeg", ".jpg", ".bmp", ".gif", ".webp", ".tga"),
+    magic=(b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff", b"GIF87a", b"GIF89a", b"BM"),
+)
+_register(
+    name="aseprite",
+    target="pygame_animated_sprite.loader.aseprite:AsepriteSpriteSheetLoader",
+    extensions=(".json",),
+    magic=(b"{",),
+)
+_register(
+    name="pack",
+    target="pygame_animated_sprite.loader.pack:PackSpriteSheetLoader",
+    extensions=(".sprpack",),
+    magic=(b"PASPACK",),
+)
@@ -1,15 +1,95 @@
 from __future__ import annotations
 
+import re
 from pathlib import Path
+from typing import BinaryIO, Optional
 
 import pygame.image
-from pygame import Surface
+import pygame.mask
+from pygame import Surface, SRCALPHA
 
 from pygame_animated_sprite.structures import Frame
 from pygame_animated_sprite.direction import Forward
 from pygame_animated_sprite._utils import clip_surface
+from pygame_animated_sprite.palette import quantize_frames
 from pygame_animated_sprite.loader import SpriteSheetData, UnsupportedFileFormatError
-from pygame_animated_sprite.loader.base import BaseSpriteSheetLoader
+from pygame_animated_sprite.loader.base import BaseSpriteSheetLoader, SheetLayout
+from pygame_animated_sprite.loader.source import AssetSource
+
+Grid = tuple[int, int, tuple[int, int], tuple[int, int], tuple[int, int]]
+
+
+def _runs(occupied: bytes, min_gap: int) -> list[tuple[int, int]]:
+    # (start, end) of the non empty runs, merging gaps shorter than min_gap
+    runs: list[tuple[int, int]] = []
+    for match in re.finditer(rb"[^\x00]+", occupied):
+        start, end = match.span()
+        if runs and start - runs[-1][1] < min_gap:
+            runs[-1] = (runs[-1][0], end)
+        else:
+            runs.append((start, end))
+    return runs
+
+
+def _axis(runs: list[tuple[int, int]]) -> tuple[int, int, int, int]:
+    # count, position, size and padding of evenly spaced cells
+    size = max(end - start for start, end in runs)
+    # runs under half a cell are labels or marks next to the frames
+    runs = [(start, end) for start, end in runs if (end - start) * 2 >= size]
+    if len(runs) == 1:
+        return 1, runs[0][0], size, 0
+
+    pitch = min(b[0] - a[0] for a, b in zip(runs, runs[1:]))
+    return len(runs), runs[0][0], size, max(pitch - size, 0)
+
+
+def detect_grid(image: Surface, min_gap: int = 1) -> Grid:
+    """
+    Detects a grid of frames separated by empty gutters.
+
+    Empty pixels are transparent ones, the colorkey, or the color of the
+    top-left pixel for opaque sheets (without a colorkey or a single
+    transparent pixel), e.g. frames separated by drawn grid lines. Lines or
+    columns of content smaller than half a frame, such as a title above the
+    frames, are ignored.
+
+    :param image: The sprite sheet.
+    :param min_gap: The narrowest gutter. Narrower empty gaps are part of a frame.
+    :return: (columns, rows, size, position, padding) for SimpleSpriteSheetLoader.
+    """
+    mask = None
+    if image.get_flags() & SRCALPHA or image.get_colorkey() is not None:
+        mask = pygame.mask.from_surface(image)
+        if mask.count() == image.width * image.height:
+            mask = None
+
+    if mask is None:
+        background = image.get_at((0, 0))
+        mask = pygame.mask.from_threshold(image, background, (1, 1, 1, 255))
+        mask.invert()
+
+    occupied = pygame.image.tobytes(
+        mask.to_surface(setcolor=(255, 255, 255, 255), unsetcolor=(0, 0, 0, 0)),
+        "RGBA",
+    )[3::4]
+
+    width, height = image.get_size()
+    # a line or column is empty when none of its pixels are set
+    rows_occupied = bytes(
+        any(occupied[y * width : (y + 1) * width]) for y in range(height)
+    )
+    columns_occupied = bytes(any(occupied[x::width]) for x in range(width))
+
+    x_runs = _runs(columns_occupied, min_gap)
+    y_runs = _runs(rows_occupied, min_gap)
+    if not x_runs or not y_runs:
+        raise ValueError("sprite sheet is empty.")
+
+    count_x, x, width, padding_x = _axis(x_runs)
+    count_y, y, height, padding_y = _axis(y_runs)
+
+    # the loader calls the vertical count columns and the horizontal one rows
+    return count_y, count_x, (width, height), (x, y), (padding_x, padding_y)
 
 
 class SimpleSpriteSheetLoader(BaseSpriteSheetLoader):
@@ -17,26 +97,41 @@ class SimpleSpriteSheetLoader(BaseSpriteSheetLoader):
 
     def __init__(
         self,
-        columns: int,
-        rows: int,
-        size: tuple[int, int],
+        columns: Optional[int] = None,
+        rows: Optional[int] = None,
+        size: Optional[tuple[int, int]] = None,
         position: tuple[int, int] = (0, 0),
         padding: tuple[int, int] = (0, 0),
         default_duration: int = 100,
+        indexed: bool = False,
+        min_gap: int = 1,
     ) -> None:
-        if columns <= 0:
-            raise ValueError("columns must be greater than 0.")
-        self.columns = columns
-
-        if rows <= 0:
-            raise ValueError("rows must be greater than 0.")
-        self.rows = rows
-
-        self.width, self.height = size
+        """
+        Leave columns, rows and size out to detect the grid from the
+        transparent gutters of each loaded sheet (see detect_grid).
+        """
+        self.auto = columns is None and rows is None and size is None
+        self.min_gap = min_gap
+
+        if not self.auto:
+            if columns is None or columns <= 0:
+                raise ValueError("columns must be greater than 0.")
+            if rows is None or rows <= 0:
+                raise ValueError("rows must be greater than 0.")
+            if size is None:
+                raise ValueError("size is required.")
+
+        self.columns = columns or 0
+        self.rows = rows or 0
+
+        self.width, self.height = size or (0, 0)
         self.x, self.y = position
         self.padding_x, self.padding_y = padding
 
         self.default_duration = default_duration
+
+        # keep frames as 8-bit palettized surfaces
+        self.indexed = indexed
         return
 
     def __load_frames(self, image: Surface) -> tuple[Frame, ...]:
@@ -61,17 +156,67 @@ class SimpleSpriteSheetLoader(BaseSpriteSheetLoader):
 
         return tuple(frames)
 
+    def __layout(self) -> SheetLayout:
+        # the rects of __load_frames in the coordinates of the whole image
+        rects = tuple(
+            (
+                self.x + (self.width + self.padding_x) * row,
+                self.y + (self.height + self.padding_y) * column,
+                self.width,
+                self.height,
+            )
+            for column in range(self.columns)
+            for row in range(self.rows)
+        )
+        return SheetLayout(
+            rects=rects,
+            durations=(self.default_duration,) * len(rects),
+            hitboxes=({},) * len(rects),
+        )
+
+    def __load_image(self, image: Surface) -> SpriteSheetData:
+        if self.auto:
+            (
+                self.columns,
+                self.rows,
+                (self.width, self.height),
+                (self.x, self.y),
+                (self.padding_x, self.padding_y),
+            ) = detect_grid(image, self.min_gap)
+
+        # a view, frames are copied out of it
+        view = image.subsurface(
+            image.get_rect().clip(
+                (self.x, self.y, image.width - self.x, image.height - self.y)
+            )
+        )
+
+        frames = self.__load_frames(view)
+        if self.indexed:
+            frames = quantize_frames(frames)
+            return SpriteSheetData(frames=frames, repeat=-1, direction=Forward)
+
+        return SpriteSheetData(
+            frames=frames,
+            repeat=-1,
+            direction=Forward,
+            image=image,
+            layout=self.__layout(),
+        )
+
+    def load_layout(self, path: Path) -> Optional[SheetLayout]:
+        # a detected grid depends on the pixels
+        if self.auto or self.indexed:
+            return None
+        return self.__layout()
+
     def load_file(self, path: Path) -> SpriteSheetData:
         if path.suffix not in [".png", ".jpeg", ".jpg"]:
             raise UnsupportedFileFormatError
 
-        image = pygame.image.load(path.as_posix())
-        image = clip_surface(
-            image,
-            (self.x, self.y),
-            (image.width - self.x, image.height - self.y),
-        )
-
-        frames = self.__load_frames(image)
+        return self.__load_image(pygame.image.load(path.as_posix()))
 
-        return SpriteSheetData(frames=frames, repeat=-1, direction=Forward)
+    def load_stream(
+        self, file: BinaryIO, name: str, source: Optional[AssetSource] = None
+    ) -> SpriteSheetData:
+        return self.__load_image(pygame.image.load(file, name))
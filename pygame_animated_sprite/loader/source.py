@@ -0,0 +1,113 @@
+"""
+Asset sources
+
+A source resolves asset names to readable binary streams, so loaders can read
+sheets and the images they reference from a directory, a zip archive or
+memory.
+"""
+
+from __future__ import annotations
+
+import io
+import posixpath
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Mapping
+
+
+class AssetSource(ABC):
+    """Abstract base class for a collection of named assets."""
+
+    @abstractmethod
+    def open(self, name: str) -> BinaryIO:
+        """Opens an asset for reading. Raises FileNotFoundError if missing."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def exists(self, name: str) -> bool:
+        raise NotImplementedError
+
+    def read(self, name: str) -> bytes:
+        with self.open(name) as file:
+            return file.read()
+
+    def resolve(self, name: str, relative_to: str) -> str:
+        """Resolves a name referenced from another asset, e.g. a sheet image."""
+        return posixpath.normpath(posixpath.join(posixpath.dirname(relative_to), name))
+
+    def close(self) -> None:
+        return
+
+    def __enter__(self) -> AssetSource:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        return
+
+
+class DirectorySource(AssetSource):
+    """Assets stored as files under a directory."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root: Path = Path(root)
+        return
+
+    def open(self, name: str) -> BinaryIO:
+        return open(self.root / name, "rb")
+
+    def exists(self, name: str) -> bool:
+        return (self.root / name).is_file()
+
+
+class ZipSource(AssetSource):
+    """
+    Assets stored in a zip archive. The archive index is read once and
+    members are streamed on demand.
+    """
+
+    def __init__(self, file: str | Path | BinaryIO) -> None:
+        if isinstance(file, Path):
+            file = file.as_posix()
+
+        self.__archive: zipfile.ZipFile = zipfile.ZipFile(file, "r")
+        self.__names: frozenset[str] = frozenset(self.__archive.namelist())
+        self.__lock = threading.Lock()
+        return
+
+    @property
+    def names(self) -> frozenset[str]:
+        """The names of every member of the archive."""
+        return self.__names
+
+    def open(self, name: str) -> BinaryIO:
+        if name not in self.__names:
+            raise FileNotFoundError(name)
+
+        with self.__lock:
+            return self.__archive.open(name, "r")  # type: ignore[return-value]
+
+    def exists(self, name: str) -> bool:
+        return name in self.__names
+
+    def close(self) -> None:
+        self.__archive.close()
+        return
+
+
+class MemorySource(AssetSource):
+    """Assets held in memory as bytes."""
+
+    def __init__(self, assets: Mapping[str, bytes]) -> None:
+        self.assets: dict[str, bytes] = dict(assets)
+        return
+
+    def open(self, name: str) -> BinaryIO:
+        if name not in self.assets:
+            raise FileNotFoundError(name)
+        return io.BytesIO(self.assets[name])
+
+    def exists(self, name: str) -> bool:
+        return name in self.assets
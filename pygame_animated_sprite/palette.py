@@ -0,0 +1,233 @@
+"""
+Palettized 8-bit frames and palette swapped variants
+
+Indexed frames keep one byte per pixel. A color variant is a set of
+subsurfaces over the same pixels with a different palette, so it only costs
+a palette instead of a full copy of every frame.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Mapping, Optional, Sequence
+
+import pygame.image
+from pygame import Color, Surface, SRCALPHA
+
+from pygame_animated_sprite.sprite import AnimatedSprite
+from pygame_animated_sprite.structures import Frame
+
+# palette index 0 is reserved for transparent pixels
+TRANSPARENT_INDEX = 0
+MAX_COLORS = 255
+
+Palette = Sequence[Color | tuple[int, int, int] | tuple[int, int, int, int]]
+
+
+def _channels(value: int) -> bytes:
+    # RGBA bytes read back from a native uint32
+    return value.to_bytes(4, sys.byteorder)
+
+
+def is_indexed(surface: Surface) -> bool:
+    """Returns True if the surface is an 8-bit palettized surface."""
+    return surface.get_bitsize() == 8 and surface.get_palette() is not None
+
+
+def quantize_frames(
+    frames: Sequence[Frame], alpha_threshold: int = 128
+) -> tuple[Frame, ...]:
+    """
+    Converts frames to 8-bit surfaces sharing a single palette.
+
+    Frames that are already indexed with the same palette are returned as is.
+    Pixels with an alpha below the threshold become transparent (index 0).
+    When there are more than 255 colors, the low bits of each channel are
+    dropped until the colors fit.
+
+    :param frames: The frames to convert.
+    :param alpha_threshold: The alpha under which a pixel is transparent.
+    :return: The indexed frames.
+    """
+    if not frames:
+        return tuple(frames)
+
+    first = frames[0].surface
+    if is_indexed(first) and all(
+        is_indexed(frame.surface) and frame.surface.get_palette() == first.get_palette()
+        for frame in frames
+    ):
+        return tuple(frames)
+
+    pixels: list[memoryview] = []
+    colors: set[int] = set()
+    for frame in frames:
+        data = pygame.image.tobytes(frame.surface, "RGBA")
+        view = memoryview(data).cast("I")
+        pixels.append(view)
+        colors.update(view)
+
+    opaque = {c: _channels(c)[:3] for c in colors if _channels(c)[3] >= alpha_threshold}
+
+    # drop channel bits until the palette fits
+    reduced = opaque
+    for bits in range(1, 8):
+        if len(set(reduced.values())) <= MAX_COLORS:
+            break
+        mask = (0xFF << bits) & 0xFF
+        reduced = {c: bytes(v & mask for v in rgb) for c, rgb in opaque.items()}
+
+    palette_colors = sorted(set(reduced.values()))
+    index_of = {rgb: i + 1 for i, rgb in enumerate(palette_colors)}
+    lookup = {
+        c: index_of[reduced[c]] if c in reduced else TRANSPARENT_INDEX for c in colors
+    }
+
+    palette = [(0, 0, 0)] + [tuple(rgb) for rgb in palette_colors]
+
+    indexed: list[Frame] = []
+    for frame, view in zip(frames, pixels):
+        surface = pygame.image.frombytes(
+            bytes(map(lookup.__getitem__, view)), frame.surface.get_size(), "P"
+        )
+        surface.set_palette(palette)
+        surface.set_colorkey(TRANSPARENT_INDEX)
+        indexed.append(Frame(surface=surface, duration=frame.duration))
+
+    return tuple(indexed)
+
+
+class PaletteVariants:
+    """
+    Color variants of a set of indexed frames.
+
+    Every variant shares the pixel buffers of the base frames. Converted
+    32-bit copies can be cached per variant for the blit hot path.
+    """
+
+    def __init__(self, frames: Sequence[Frame]) -> None:
+        """
+        :param frames: Indexed frames sharing one palette. Use quantize_frames first.
+        """
+        if not all(is_indexed(frame.surface) for frame in frames):
+            raise ValueError("frames must be 8-bit indexed surfaces.")
+
+        self.__base: tuple[Frame, ...] = tuple(frames)
+        self.__palettes: dict[str, list[Color]] = {}
+        self.__variants: dict[str, tuple[Frame, ...]] = {}
+        self.__converted: dict[Optional[str], tuple[Frame, ...]] = {}
+        return
+
+    @classmethod
+    def from_sprite(
+        cls: type[PaletteVariants], sprite: AnimatedSprite
+    ) -> PaletteVariants:
+        """Creates variants from the frames of a sprite, quantizing them if needed."""
+        return cls(quantize_frames(sprite.frames))
+
+    @property
+    def palette(self) -> list[Color]:
+        """The palette of the base frames."""
+        if not self.__base:
+            return []
+        return list(self.__base[0].surface.get_palette())
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """The names of the registered variants."""
+        return tuple(self.__palettes)
+
+    def add(
+        self,
+        name: str,
+        palette: Optional[Palette] = None,
+        recolor: Optional[Mapping[Any, Any]] = None,
+    ) -> None:
+        """
+        Registers a color variant.
+
+        :param name: The name of the variant.
+        :param palette: A full replacement palette.
+        :param recolor: A mapping of base colors to new colors, applied to the base palette.
+        """
+        if palette is None and recolor is None:
+            raise ValueError("either palette or recolor must be given.")
+
+        new_palette = [Color(c) for c in (palette or self.palette)]
+        if recolor:
+            mapping = {Color(old)[:3]: Color(new) for old, new in recolor.items()}
+            new_palette = [mapping.get(c[:3], c) for c in new_palette]
+
+        self.__palettes[name] = new_palette
+        self.__variants.pop(name, None)
+        self.__converted.pop(name, None)
+        return
+
+    def remove(self, name: str) -> None:
+        """Removes a color variant."""
+        del self.__palettes[name]
+        self.__variants.pop(name, None)
+        self.__converted.pop(name, None)
+        return
+
+    def get_frames(self, name: Optional[str] = None) -> tuple[Frame, ...]:
+        """
+        Gets the indexed frames of a variant.
+
+        :param name: The name of the variant. None returns the base frames.
+        """
+        if name is None:
+            return self.__base
+
+        if name not in self.__palettes:
+            raise KeyError(name)
+
+        if name not in self.__variants:
+            frames: list[Frame] = []
+            for frame in self.__base:
+                # a subsurface shares the pixels but has its own palette
+                surface = frame.surface.subsurface(frame.surface.get_rect())
+                surface.set_palette(self.__palettes[name])
+                frames.append(Frame(surface=surface, duration=frame.duration))
+            self.__variants[name] = tuple(frames)
+
+        return self.__variants[name]
+
+    def get_converted_frames(self, name: Optional[str] = None) -> tuple[Frame, ...]:
+        """Gets cached 32-bit copies of the frames of a variant."""
+        if name not in self.__converted:
+            self.__converted[name] = tuple(
+                Frame(surface=_to_rgba(frame.surface), duration=frame.duration)
+                for frame in self.get_frames(name)
+            )
+
+        return self.__converted[name]
+
+    def clear_cache(self) -> None:
+        """Drops the cached 32-bit frames."""
+        self.__converted.clear()
+        return
+
+    def make_sprite(
+        self, sprite: AnimatedSprite, name: Optional[str] = None, convert: bool = False
+    ) -> AnimatedSprite:
+        """
+        Creates a sprite playing a variant with the settings of another sprite.
+
+        :param sprite: The sprite to copy repeat, direction and tags from.
+        :param name: The name of the variant.
+        :param convert: Uses the cached 32-bit frames instead of the indexed ones.
+        """
+        frames = self.get_converted_frames(name) if convert else self.get_frames(name)
+        return AnimatedSprite(
+            frames=frames,
+            repeats=sprite.repeat,
+            direction=sprite.direction,
+            tags=sprite.tags,
+        )
+
+
+def _to_rgba(surface: Surface) -> Surface:
+    converted = Surface(surface.get_size(), SRCALPHA)
+    converted.blit(surface, (0, 0))
+    return converted
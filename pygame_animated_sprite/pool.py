@@ -0,0 +1,210 @@
+"""
+Object pool for short-lived animated sprites
+
+Effects such as bullets, hit sparks and dust puffs are spawned and removed
+many times per second. A ``SpritePool`` keeps released instances per clip
+and hands them out again after a reset, so spawning does not construct a new
+``AnimatedSprite``. Pooled instances share the frames of their template.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import Iterator, Optional
+
+from pygame_animated_sprite.sprite import AnimatedSprite
+
+
+@dataclass
+class PoolStats:
+    created: int = field(default=0)
+    acquired: int = field(default=0)
+    reused: int = field(default=0)
+    released: int = field(default=0)
+    dropped: int = field(default=0)  # released while the pool was full
+    active: int = field(default=0)
+    high_water: int = field(default=0)  # most instances active at once
+
+    @property
+    def reuse_rate(self) -> float:
+        """The share of acquires served from the pool."""
+        if self.acquired == 0:
+            return 0.0
+        return self.reused / self.acquired
+
+
+@dataclass
+class _Clip:
+    template: AnimatedSprite
+    tag: Optional[str]
+    size: int
+    auto_release: bool
+    free: list[AnimatedSprite] = field(default_factory=list)
+    stats: PoolStats = field(default_factory=PoolStats)
+
+
+class SpritePool:
+    """
+    Pools of reusable sprites, keyed by clip name.
+    """
+
+    def __init__(self) -> None:
+        self.__clips: dict[str, _Clip] = {}
+        # id(sprite) -> (clip name, sprite)
+        self.__active: dict[int, tuple[str, AnimatedSprite]] = {}
+        return
+
+    def __len__(self) -> int:
+        """Returns the number of active sprites."""
+        return len(self.__active)
+
+    def __iter__(self) -> Iterator[AnimatedSprite]:
+        """Iterates over the active sprites, in acquire order."""
+        return (sprite for _, sprite in self.__active.values())
+
+    def __contains__(self, sprite: AnimatedSprite) -> bool:
+        return id(sprite) in self.__active
+
+    @property
+    def clips(self) -> tuple[str, ...]:
+        """The names of the registered clips."""
+        return tuple(self.__clips)
+
+    def register(
+        self,
+        clip: str,
+        template: AnimatedSprite,
+        size: int = 32,
+        prewarm: int = 0,
+        tag: Optional[str] = None,
+        auto_release: bool = True,
+    ) -> None:
+        """
+        Registers a clip.
+
+        :param clip: The name of the clip.
+        :param template: The sprite to copy frames, repeat, direction and tags from.
+        :param size: The maximum number of released instances kept for reuse.
+        :param prewarm: The number of instances created right away.
+        :param tag: The tag played by the instances, None for the whole animation.
+        :param auto_release: Releases instances when their animation finishes.
+                             Only non looping animations finish.
+        """
+        if size < 0:
+            raise ValueError("size cannot be negative.")
+        if clip in self.__clips:
+            raise ValueError(f"clip {clip} is already registered.")
+        if tag is not None and tag not in template.tags:
+            raise KeyError(tag)
+
+        self.__clips[clip] = _Clip(
+            template=template, tag=tag, size=size, auto_release=auto_release
+        )
+        self.prewarm(clip, prewarm)
+        return
+
+    def unregister(self, clip: str) -> None:
+        """Removes a clip. Its active sprites are dropped from the pool."""
+        del self.__clips[clip]
+        for key in [k for k, (name, _) in self.__active.items() if name == clip]:
+            del self.__active[key]
+        return
+
+    def __create(self, entry: _Clip) -> AnimatedSprite:
+        template = entry.template
+        entry.stats.created += 1
+        return AnimatedSprite(
+            frames=template.frames,
+            repeats=template.repeat,
+            direction=template.direction,
+            tags=template.tags,
+        )
+
+    def prewarm(self, clip: str, count: int) -> None:
+        """Fills the free list of a clip with up to count instances."""
+        entry = self.__clips[clip]
+        while len(entry.free) < min(count, entry.size):
+            entry.free.append(self.__create(entry))
+        return
+
+    def acquire(self, clip: str) -> AnimatedSprite:
+        """
+        Gets a playing sprite of a clip, reset to its first frame.
+        """
+        entry = self.__clips[clip]
+        stats = entry.stats
+
+        if entry.free:
+            sprite = entry.free.pop()
+            stats.reused += 1
+        else:
+            sprite = self.__create(entry)
+
+        if entry.tag is not None:
+            sprite.play_tag(entry.tag, restart=True)
+        else:
+            sprite.reset()
+
+        self.__active[id(sprite)] = (clip, sprite)
+        stats.acquired += 1
+        stats.active += 1
+        stats.high_water = max(stats.high_water, stats.active)
+        return sprite
+
+    def release(self, sprite: AnimatedSprite) -> None:
+        """
+        Returns an active sprite to its pool. The sprite must not be used
+        after it is released.
+        """
+        if id(sprite) not in self.__active:
+            raise KeyError("sprite is not active in this pool.")
+
+        clip, _ = self.__active.pop(id(sprite))
+        entry = self.__clips[clip]
+        entry.stats.released += 1
+        entry.stats.active -= 1
+
+        if len(entry.free) < entry.size:
+            sprite.pause()
+            entry.free.append(sprite)
+        else:
+            entry.stats.dropped += 1
+        return
+
+    def update(self, time_delta: int) -> None:
+        """
+        Updates the active sprites and releases the finished ones of clips
+        with auto release.
+        """
+        finished: list[AnimatedSprite] = []
+        for clip, sprite in self.__active.values():
+            sprite.update(time_delta)
+            if sprite.is_finished() and self.__clips[clip].auto_release:
+                finished.append(sprite)
+
+        for sprite in finished:
+            self.release(sprite)
+        return
+
+    def get_stats(self, clip: Optional[str] = None) -> PoolStats:
+        """
+        Gets the statistics of a clip, or the sum over every clip.
+        The high water mark of the sum is the sum of the high water marks.
+        """
+        if clip is not None:
+            return self.__clips[clip].stats
+
+        total = PoolStats()
+        for entry in self.__clips.values():
+            for stat in fields(PoolStats):
+                value = getattr(total, stat.name) + getattr(entry.stats, stat.name)
+                setattr(total, stat.name, value)
+        return total
+
+    def clear(self) -> None:
+        """Drops every active and free sprite. Clips stay registered."""
+        self.__active.clear()
+        for entry in self.__clips.values():
+            entry.free.clear()
+            entry.stats.active = 0
+        return
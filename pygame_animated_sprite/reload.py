@@ -0,0 +1,305 @@
+"""
+Hot reload of changed sprite sheets
+
+``HotReloader`` polls the files of loaded sheets and patches the ``Frame``
+objects shared by every live ``AnimatedSprite`` in place, so sprites keep
+their playback state. Only frames whose pixels, duration or hitboxes
+changed are replaced.
+
+Sheets whose frames are plain clips of one image (see ``SheetLayout``) are
+patched without a full reload: the decoded image is kept, a json edit only
+re-clips the frames whose rect changed, and an image edit only compares the
+frames overlapping the changed pixels. Other sheets are reloaded and every
+frame is compared.
+"""
+
+from __future__ import annotations
+
+import os
+import warnings
+import weakref
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Callable, Optional
+
+import pygame.image
+from pygame import Rect, Surface
+
+from pygame_animated_sprite._utils import clip_surface
+from pygame_animated_sprite.codec import dirty_rect
+from pygame_animated_sprite.sprite import AnimatedSprite
+from pygame_animated_sprite.structures import Frame
+from pygame_animated_sprite.loader.base import (
+    BaseSpriteSheetLoader,
+    SheetLayout,
+    SpriteSheetData,
+)
+from pygame_animated_sprite.loader.registry import find_loader_class
+
+LoaderFactory = Callable[[], BaseSpriteSheetLoader]
+
+
+def _stamp(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _same_pixels(a: Surface, b: Surface) -> bool:
+    if a.get_size() != b.get_size():
+        return False
+    return pygame.image.tobytes(a, "RGBA") == pygame.image.tobytes(b, "RGBA")
+
+
+def _changed_region(previous: Surface, current: Surface) -> Rect:
+    if previous is current:
+        return Rect(0, 0, 0, 0)
+    if previous.get_size() != current.get_size():
+        return current.get_rect()
+
+    return Rect(
+        dirty_rect(
+            pygame.image.tobytes(previous, "RGBA"),
+            pygame.image.tobytes(current, "RGBA"),
+            *current.get_size(),
+        )
+    )
+
+
+@dataclass
+class _WatchedSheet:
+    path: Path
+    loader_factory: LoaderFactory
+    data: SpriteSheetData
+    frames: list[Frame]
+    # the file data.layout refers to, None if the sheet reads several images
+    image_path: Optional[Path] = None
+    stamps: dict[Path, Optional[tuple[int, int]]] = field(default_factory=dict)
+    # the stamps of the files when the last reload error was reported
+    error_stamps: Optional[dict[Path, Optional[tuple[int, int]]]] = None
+    sprites: weakref.WeakSet[AnimatedSprite] = field(default_factory=weakref.WeakSet)
+
+
+class HotReloader:
+    """
+    Polls loaded sprite sheets for changes and patches live sprites.
+    """
+
+    def __init__(self, interval: int = 500) -> None:
+        """
+        :param interval: The time between two polls (ms) when driven by update().
+        """
+        self.interval: int = interval
+        self.__time: int = 0
+        self.__sheets: dict[Path, _WatchedSheet] = {}
+        self.on_reload: Optional[Callable[[Path, list[int]], None]] = None
+        # called with the sheet and the error when a reload fails,
+        # a RuntimeWarning is issued if not set
+        self.on_error: Optional[Callable[[Path, Exception], None]] = None
+        return
+
+    def __watch_files(self, sheet: _WatchedSheet) -> None:
+        loader = sheet.loader_factory()
+        dependencies = loader.dependencies(sheet.path)
+        files = [sheet.path, *dependencies]
+        sheet.stamps = {file: _stamp(file) for file in files}
+
+        if len(dependencies) > 1:
+            sheet.image_path = None
+        else:
+            sheet.image_path = dependencies[0] if dependencies else sheet.path
+        return
+
+    def load(
+        self,
+        path: str | Path,
+        loader_factory: Optional[LoaderFactory] = None,
+    ) -> AnimatedSprite:
+        """
+        Loads a sprite sheet and watches its files.
+
+        :param path: The path to the sheet.
+        :param loader_factory: Creates a fresh loader for every (re)load.
+                               Picked from the registry if not given.
+        :return: A sprite that is patched when the sheet changes.
+        """
+        path = Path(path).resolve()
+        if loader_factory is None:
+            loader_factory = find_loader_class(path)
+
+        sheet = self.__sheets.get(path)
+        if sheet is None:
+            data = loader_factory().load(path)
+            frames = list(data.frames or ())
+            sheet = _WatchedSheet(
+                path=path,
+                loader_factory=loader_factory,
+                data=data,
+                frames=frames,
+            )
+            self.__watch_files(sheet)
+            self.__sheets[path] = sheet
+
+        data = sheet.data
+        sprite = AnimatedSprite(
+            frames=sheet.frames,
+            repeats=data.repeat,
+            direction=data.direction,
+            tags=dict(data.tags or {}),
+        )
+        sheet.sprites.add(sprite)
+        return sprite
+
+    def track(self, path: str | Path, sprite: AnimatedSprite) -> None:
+        """Tracks another sprite using the frames of a watched sheet."""
+        self.__sheets[Path(path).resolve()].sprites.add(sprite)
+        return
+
+    def unwatch(self, path: str | Path) -> None:
+        """Stops watching a sheet."""
+        del self.__sheets[Path(path).resolve()]
+        return
+
+    def update(self, time_delta: int) -> list[Path]:
+        """
+        Advances the poll timer and polls when the interval has elapsed.
+
+        :return: The sheets that were reloaded.
+        """
+        self.__time += time_delta
+        if self.__time < self.interval:
+            return []
+
+        self.__time = 0
+        return self.poll()
+
+    def poll(self) -> list[Path]:
+        """
+        Checks every watched sheet and reloads the changed ones.
+
+        :return: The sheets that were reloaded.
+        """
+        reloaded: list[Path] = []
+        for sheet in self.__sheets.values():
+            if all(_stamp(file) == stamp for file, stamp in sheet.stamps.items()):
+                continue
+
+            stamps = sheet.stamps
+            try:
+                # reading the dependencies parses the sheet too
+                self.__watch_files(sheet)
+                changed = self.__reload(sheet, stamps)
+            except Exception as error:
+                # the file may be half written; try again on the next poll,
+                # reporting the error once until the files change again
+                current = {file: _stamp(file) for file in sheet.stamps}
+                if current != sheet.error_stamps:
+                    sheet.error_stamps = current
+                    self.__report(sheet.path, error)
+                for file in sheet.stamps:
+                    sheet.stamps[file] = None
+                continue
+
+            sheet.error_stamps = None
+            reloaded.append(sheet.path)
+            if self.on_reload is not None:
+                self.on_reload(sheet.path, changed)
+
+        return reloaded
+
+    def __report(self, path: Path, error: Exception) -> None:
+        if self.on_error is not None:
+            self.on_error(path, error)
+        else:
+            warnings.warn(f"could not reload {path}: {error!r}", RuntimeWarning)
+        return
+
+    def __reload(
+        self, sheet: _WatchedSheet, stamps: dict[Path, Optional[tuple[int, int]]]
+    ) -> list[int]:
+        loader = sheet.loader_factory()
+
+        if sheet.data.layout is not None and sheet.image_path is not None:
+            layout = loader.load_layout(sheet.path)
+            if layout is not None and len(layout.rects) == len(sheet.frames):
+                image = sheet.data.image
+                # a renamed image is read even if its stamp looks the same
+                if (
+                    sheet.image_path not in stamps
+                    or stamps[sheet.image_path] != sheet.stamps[sheet.image_path]
+                ):
+                    image = pygame.image.load(sheet.image_path.as_posix())
+                return self.__patch_layout(sheet, layout, image)
+
+        return self.__patch(sheet, loader.load(sheet.path))
+
+    def __patch_layout(
+        self, sheet: _WatchedSheet, layout: SheetLayout, image: Surface
+    ) -> list[int]:
+        previous = sheet.data.layout
+        dirty = _changed_region(sheet.data.image, image)
+
+        changed: list[int] = []
+        for index, frame in enumerate(sheet.frames):
+            rect = layout.rects[index]
+            modified = False
+
+            if rect != previous.rects[index] or dirty.colliderect(rect):
+                surface = clip_surface(image, rect[:2], rect[2:])
+                if not _same_pixels(frame.surface, surface):
+                    frame.surface = surface
+                    modified = True
+
+            if frame.duration != layout.durations[index]:
+                frame.duration = layout.durations[index]
+                modified = True
+
+            hitboxes = layout.hitboxes[index] if index < len(layout.hitboxes) else {}
+            if frame.hitboxes != hitboxes:
+                frame.hitboxes = dict(hitboxes)
+                modified = True
+
+            if modified:
+                changed.append(index)
+
+        sheet.data = replace(sheet.data, tags=layout.tags, image=image, layout=layout)
+        for sprite in sheet.sprites:
+            sprite.tags = dict(layout.tags)
+        return changed
+
+    def __patch(self, sheet: _WatchedSheet, data: SpriteSheetData) -> list[int]:
+        new_frames = list(data.frames or ())
+
+        changed: list[int] = []
+        for index, (frame, new_frame) in enumerate(zip(sheet.frames, new_frames)):
+            if (
+                frame.duration == new_frame.duration
+                and frame.hitboxes == new_frame.hitboxes
+                and _same_pixels(frame.surface, new_frame.surface)
+            ):
+                continue
+
+            # patch in place: every sprite holding this frame sees the change
+            frame.surface = new_frame.surface
+            frame.duration = new_frame.duration
+            frame.hitboxes = new_frame.hitboxes
+            changed.append(index)
+
+        resized = len(new_frames) != len(sheet.frames)
+        if resized:
+            changed.extend(range(len(sheet.frames), len(new_frames)))
+            sheet.frames = (
+                sheet.frames[: len(new_frames)] + new_frames[len(sheet.frames) :]
+            )
+
+        sheet.data = data
+
+        for sprite in sheet.sprites:
+            sprite.tags = dict(data.tags or {})
+            if resized:
+                # the frame count changed, playback has to restart
+                sprite.frames = sheet.frames
+
+        return changed
@@ -0,0 +1,250 @@
+"""
+SDL2 Renderer/Texture draw backend
+
+Frames are packed into atlas surfaces which are uploaded once as ``Texture``
+pages, as few as the maximum texture size allows. Drawing an ``AnimatedSprite`` is then a source-rect copy with
+flip, rotation and scale done by the renderer instead of surface transforms.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterable, Optional
+
+from pygame import Rect, Surface, Vector2, SRCALPHA
+from pygame._sdl2.video import Renderer, Texture
+
+from pygame_animated_sprite.sprite import AnimatedSprite
+from pygame_animated_sprite.structures import Frame
+
+# pygame does not expose the limit of the renderer, this one is supported by
+# the software renderer and virtually every GPU
+DEFAULT_MAX_TEXTURE_SIZE = 4096
+
+
+class TextureAtlas:
+    """Frames of one or more sprites packed into texture pages"""
+
+    def __init__(
+        self,
+        renderer: Renderer,
+        frames: Iterable[Frame],
+        padding: int = 1,
+        max_size: int = DEFAULT_MAX_TEXTURE_SIZE,
+    ) -> None:
+        """
+        Packs the frames into atlas pages and uploads them to the renderer.
+
+        :param renderer: The renderer that owns the textures.
+        :param frames: The frames to pack. Frames sharing a surface share a rect.
+        :param padding: Empty pixels between frames to avoid filtering bleed.
+        :param max_size: The maximum width and height of a texture. Frames that
+                         do not fit in one page go to the next.
+        """
+        if padding < 0:
+            raise ValueError("padding cannot be negative.")
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0.")
+
+        self.renderer: Renderer = renderer
+        self.padding: int = padding
+        self.max_size: int = max_size
+
+        # keep frames alive so their ids stay valid as keys
+        self.__frames: list[Frame] = list(frames)
+        # id(frame) -> (page, rect)
+        self.__rects: dict[int, tuple[int, Rect]] = {}
+
+        surfaces: dict[int, Surface] = {}
+        for frame in self.__frames:
+            surfaces.setdefault(id(frame.surface), frame.surface)
+
+        surface_rects = self.__pack(surfaces)
+        for frame in self.__frames:
+            self.__rects[id(frame)] = surface_rects[id(frame.surface)]
+
+        self.__textures: list[Texture] = [
+            Texture.from_surface(renderer, atlas)
+            for atlas in self.__build_surfaces(surfaces, surface_rects)
+        ]
+        return
+
+    def __pack(self, surfaces: dict[int, Surface]) -> dict[int, tuple[int, Rect]]:
+        # simple shelf packing: tallest surfaces first, rows of a fixed width,
+        # a new page when a shelf would be taller than max_size
+        self.__sizes: list[tuple[int, int]] = []
+        if not surfaces:
+            self.__sizes.append((1, 1))
+            return {}
+
+        limit = self.max_size
+        for surface in surfaces.values():
+            if surface.width > limit or surface.height > limit:
+                raise ValueError(
+                    f"a {surface.width}x{surface.height} frame does not fit "
+                    f"in a {limit}x{limit} texture."
+                )
+
+        area = sum(
+            (s.width + self.padding) * (s.height + self.padding)
+            for s in surfaces.values()
+        )
+        widest = max(s.width for s in surfaces.values()) + self.padding
+        width = max(widest, 2 ** math.ceil(math.log2(max(math.sqrt(area), 1))))
+        width = min(width, limit)
+
+        rects: dict[int, tuple[int, Rect]] = {}
+        page = x = y = shelf_height = bottom = 0
+        for key, surface in sorted(
+            surfaces.items(), key=lambda item: item[1].height, reverse=True
+        ):
+            if x + surface.width > width:
+                x = 0
+                y += shelf_height + self.padding
+                shelf_height = 0
+
+            if y + surface.height > limit:
+                self.__sizes.append((width, max(bottom, 1)))
+                page += 1
+                x = y = shelf_height = bottom = 0
+
+            rects[key] = (page, Rect(x, y, surface.width, surface.height))
+            x += surface.width + self.padding
+            shelf_height = max(shelf_height, surface.height)
+            bottom = max(bottom, y + surface.height)
+
+        self.__sizes.append((width, max(bottom, 1)))
+        return rects
+
+    def __build_surfaces(
+        self, surfaces: dict[int, Surface], rects: dict[int, tuple[int, Rect]]
+    ) -> list[Surface]:
+        atlases = [Surface(size, SRCALPHA) for size in self.__sizes]
+        for key, (page, rect) in rects.items():
+            atlases[page].blit(surfaces[key], rect)
+        return atlases
+
+    @classmethod
+    def from_sprite(
+        cls: type[TextureAtlas],
+        renderer: Renderer,
+        sprite: AnimatedSprite,
+        padding: int = 1,
+        max_size: int = DEFAULT_MAX_TEXTURE_SIZE,
+    ) -> TextureAtlas:
+        """Creates an atlas holding every frame of the sprite."""
+        return cls(renderer, sprite.frames, padding, max_size)
+
+    @classmethod
+    def from_sprites(
+        cls: type[TextureAtlas],
+        renderer: Renderer,
+        sprites: Iterable[AnimatedSprite],
+        padding: int = 1,
+        max_size: int = DEFAULT_MAX_TEXTURE_SIZE,
+    ) -> TextureAtlas:
+        """Creates one atlas shared by several sprites."""
+        return cls(
+            renderer,
+            [frame for sprite in sprites for frame in sprite.frames],
+            padding,
+            max_size,
+        )
+
+    @property
+    def texture(self) -> Texture:
+        """The first uploaded atlas page."""
+        return self.__textures[0]
+
+    @property
+    def textures(self) -> tuple[Texture, ...]:
+        """The uploaded atlas pages."""
+        return tuple(self.__textures)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """The size of the first atlas page."""
+        return self.__sizes[0]
+
+    @property
+    def sizes(self) -> tuple[tuple[int, int], ...]:
+        """The size of every atlas page."""
+        return tuple(self.__sizes)
+
+    def __contains__(self, frame: Frame) -> bool:
+        return id(frame) in self.__rects
+
+    def get_rect(self, frame: Frame) -> Rect:
+        """Gets the source rect of a frame in the atlas."""
+        return self.__get_entry(frame)[1]
+
+    def get_page(self, frame: Frame) -> int:
+        """Gets the index of the page holding a frame."""
+        return self.__get_entry(frame)[0]
+
+    def __get_entry(self, frame: Frame) -> tuple[int, Rect]:
+        if id(frame) not in self.__rects:
+            raise KeyError("frame is not in this atlas.")
+
+        return self.__rects[id(frame)]
+
+    def draw_frame(
+        self,
+        frame: Frame,
+        dest: tuple[int, int] | Vector2,
+        scale: float | tuple[float, float] = 1,
+        angle: float = 0,
+        origin: Optional[tuple[float, float]] = None,
+        flip_x: bool = False,
+        flip_y: bool = False,
+    ) -> None:
+        """
+        Copies a frame to the renderer target.
+
+        :param frame: The frame to draw.
+        :param dest: The top-left position on the target.
+        :param scale: A uniform scale or a (x, y) scale pair.
+        :param angle: Clockwise rotation in degrees.
+        :param origin: The rotation center relative to dest. Defaults to the center.
+        :param flip_x: Flips the frame horizontally.
+        :param flip_y: Flips the frame vertically.
+        """
+        page, src = self.__get_entry(frame)
+
+        if isinstance(scale, tuple):
+            scale_x, scale_y = scale
+        else:
+            scale_x = scale_y = scale
+
+        dst = (dest[0], dest[1], src.width * scale_x, src.height * scale_y)
+        self.__textures[page].draw(
+            srcrect=src,
+            dstrect=dst,
+            angle=angle,
+            origin=origin,
+            flip_x=flip_x,
+            flip_y=flip_y,
+        )
+        return
+
+    def draw(
+        self,
+        sprite: AnimatedSprite,
+        dest: tuple[int, int] | Vector2,
+        scale: float | tuple[float, float] = 1,
+        angle: float = 0,
+        origin: Optional[tuple[float, float]] = None,
+        flip_x: bool = False,
+        flip_y: bool = False,
+    ) -> None:
+        """Copies the current frame of the sprite to the renderer target."""
+        self.draw_frame(
+            sprite.get_current_frame(),
+            dest,
+            scale=scale,
+            angle=angle,
+            origin=origin,
+            flip_x=flip_x,
+            flip_y=flip_y,
+        )
+        return
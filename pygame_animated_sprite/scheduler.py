@@ -0,0 +1,170 @@
+"""
+Update rate scheduler for distant or unimportant sprites
+
+Sprites are assigned to tiers that update every tick, every 2nd tick, every
+4th tick and so on. The time of the skipped ticks is accumulated and applied
+when the tier of a sprite comes up. Sprites of a tier are spread over its
+phases so that, for example, half of the every-2nd-tick sprites update on
+even ticks and the other half on odd ticks.
+"""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Sequence
+
+from pygame_animated_sprite.sprite import AnimatedSprite
+
+DEFAULT_TIERS = (1, 2, 4, 8)
+
+
+@dataclass
+class _Bucket:
+    period: int
+    phase: int
+    sprites: dict[int, AnimatedSprite] = field(default_factory=dict)
+    elapsed: int = field(default=0)  # time since the bucket last updated (ms)
+
+
+class UpdateScheduler:
+    """
+    Updates sprites at a rate picked from their priority.
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[int] = DEFAULT_TIERS,
+        thresholds: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        :param tiers: The update period (in ticks) of every tier, fastest first.
+        :param thresholds: The ascending priority bounds between tiers, e.g.
+                           distances. A priority below thresholds[0] is in the
+                           first tier, below thresholds[1] in the second...
+                           Without thresholds, the priority is the tier index.
+        """
+        if not tiers or any(period <= 0 for period in tiers):
+            raise ValueError("tiers must be periods greater than 0.")
+        if thresholds is not None:
+            if len(thresholds) != len(tiers) - 1:
+                raise ValueError("there must be one threshold less than tiers.")
+            if list(thresholds) != sorted(thresholds):
+                raise ValueError("thresholds must be ascending.")
+
+        self.tiers: tuple[int, ...] = tuple(tiers)
+        self.thresholds: Optional[tuple[float, ...]] = (
+            tuple(thresholds) if thresholds is not None else None
+        )
+
+        # one bucket per (tier, phase)
+        self.__buckets: list[list[_Bucket]] = [
+            [_Bucket(period, phase) for phase in range(period)] for period in tiers
+        ]
+        self.__entries: dict[int, _Bucket] = {}
+        # time owed to sprites that moved to a bucket with less elapsed time
+        self.__offsets: dict[int, int] = {}
+        self.__tick: int = 0
+        self.last_update_count: int = 0
+        return
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, sprite: AnimatedSprite) -> bool:
+        return id(sprite) in self.__entries
+
+    def __iter__(self) -> Iterator[AnimatedSprite]:
+        for tier in self.__buckets:
+            for bucket in tier:
+                yield from bucket.sprites.values()
+
+    def get_tier(self, priority: float) -> int:
+        """Maps a priority to a tier index."""
+        if self.thresholds is not None:
+            return bisect.bisect_right(self.thresholds, priority)
+        return min(max(int(priority), 0), len(self.tiers) - 1)
+
+    def get_tier_counts(self) -> list[int]:
+        """Gets the number of sprites in every tier."""
+        return [sum(len(bucket.sprites) for bucket in tier) for tier in self.__buckets]
+
+    def add(self, sprite: AnimatedSprite, priority: float = 0) -> None:
+        """Adds a sprite, or moves it to the tier of a new priority."""
+        tier = self.__buckets[self.get_tier(priority)]
+        key = id(sprite)
+
+        current = self.__entries.get(key)
+        if current is not None:
+            if any(current is bucket for bucket in tier):
+                return
+            del current.sprites[key]
+            owed = current.elapsed
+        else:
+            owed = 0
+
+        # the least loaded phase keeps the ticks balanced
+        bucket = min(tier, key=lambda b: len(b.sprites))
+        bucket.sprites[key] = sprite
+        self.__entries[key] = bucket
+
+        offset = self.__offsets.pop(key, 0) + owed - bucket.elapsed
+        if offset:
+            self.__offsets[key] = offset
+        return
+
+    def set_priority(self, sprite: AnimatedSprite, priority: float) -> None:
+        """Moves a sprite to the tier of a new priority."""
+        if id(sprite) not in self.__entries:
+            raise KeyError("sprite is not scheduled.")
+        self.add(sprite, priority)
+        return
+
+    def remove(self, sprite: AnimatedSprite) -> None:
+        """Removes a sprite. Its accumulated time is dropped."""
+        bucket = self.__entries.pop(id(sprite))
+        del bucket.sprites[id(sprite)]
+        self.__offsets.pop(id(sprite), None)
+        return
+
+    def clear(self) -> None:
+        self.__entries.clear()
+        self.__offsets.clear()
+        for tier in self.__buckets:
+            for bucket in tier:
+                bucket.sprites.clear()
+                bucket.elapsed = 0
+        return
+
+    def __update_bucket(self, bucket: _Bucket) -> int:
+        offsets = self.__offsets
+        for key, sprite in bucket.sprites.items():
+            if offsets and key in offsets:
+                sprite.update(bucket.elapsed + offsets.pop(key))
+            else:
+                sprite.update(bucket.elapsed)
+        bucket.elapsed = 0
+        return len(bucket.sprites)
+
+    def update(self, time_delta: int) -> None:
+        """
+        Advances the scheduler by one tick and updates the sprites whose
+        tier is due with the time accumulated since their last update.
+        """
+        count = 0
+        for tier in self.__buckets:
+            due = tier[self.__tick % len(tier)]
+            for bucket in tier:
+                bucket.elapsed += time_delta
+            count += self.__update_bucket(due)
+
+        self.__tick += 1
+        self.last_update_count = count
+        return
+
+    def flush(self) -> None:
+        """Applies the accumulated time to every sprite now."""
+        for tier in self.__buckets:
+            for bucket in tier:
+                self.__update_bucket(bucket)
+        return
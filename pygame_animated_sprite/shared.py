@@ -0,0 +1,203 @@
+"""
+Shared-memory frame buffers
+
+``publish`` copies the frames of a loaded sheet once into a
+``multiprocessing.shared_memory`` block. Other processes ``attach`` to it from a
+JSON-serializable manifest and get surfaces viewing the shared pixels, with no
+copy or decode.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import weakref
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+import pygame.image
+
+from pygame_animated_sprite._utils import (
+    direction_from_path,
+    direction_to_path,
+    tags_from_dict,
+    tags_to_dict,
+)
+from pygame_animated_sprite.structures import Frame
+from pygame_animated_sprite.loader.base import SpriteSheetData
+
+PIXEL_FORMAT = "RGBA"
+
+Manifest = dict[str, Any]
+
+
+# blocks published by this process, tracked until they are unlinked
+_published: set[str] = set()
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix" and name not in _published:
+        # before 3.13 attaching registers the block with the resource
+        # tracker, which would unlink it when this process exits
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _release(shm: shared_memory.SharedMemory, owner: bool) -> None:
+    if owner:
+        _published.discard(shm.name)
+        shm.unlink()
+    shm.close()
+    return
+
+
+class _SharedBlock:
+    """
+    Keeps a shared memory block open. Referenced by the sheet and by every
+    frame viewing the block, it is released once all of them are gone.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self.shm: shared_memory.SharedMemory = shm
+        self.release = weakref.finalize(self, _release, shm, owner)
+        return
+
+
+@dataclass
+class SharedFrame(Frame):
+    """A frame whose surface views a shared memory block."""
+
+    _block: Optional[_SharedBlock] = field(default=None, repr=False, compare=False)
+
+
+class SharedSpriteSheet:
+    """
+    A sprite sheet whose frames live in a shared memory block.
+
+    The block stays open (and published, for the owner) as long as the
+    sheet or one of its frames is alive. Surfaces taken out of the frames do not
+    keep it open and must not outlive them.
+    """
+
+    def __init__(
+        self, shm: shared_memory.SharedMemory, manifest: Manifest, owner: bool
+    ) -> None:
+        self.manifest: Manifest = manifest
+        self.owner: bool = owner
+        self.__block: _SharedBlock = _SharedBlock(shm, owner)
+
+        frames: list[Frame] = []
+        for frame in manifest["frames"]:
+            start = frame["offset"]
+            end = start + frame["width"] * frame["height"] * 4
+            surface = pygame.image.frombuffer(
+                shm.buf[start:end], (frame["width"], frame["height"]), PIXEL_FORMAT
+            )
+            frames.append(
+                SharedFrame(
+                    surface=surface, duration=frame["duration"], _block=self.__block
+                )
+            )
+
+        direction = manifest["direction"]
+        self.__data: Optional[SpriteSheetData] = SpriteSheetData(
+            frames=tuple(frames),
+            repeat=manifest["repeat"],
+            direction=direction_from_path(direction) if direction else None,
+            tags=tags_from_dict(manifest["tags"]),
+        )
+        return
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self.manifest["name"]
+
+    @property
+    def data(self) -> SpriteSheetData:
+        """The sheet data, with surfaces viewing the shared memory."""
+        if self.__data is None:
+            raise RuntimeError("shared sprite sheet is closed.")
+        return self.__data
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory now, and unlinks it if this sheet
+        owns it. Every frame of this sheet (and sprites made from it) must
+        be released first. Without close, the block is released when the
+        sheet and its frames are collected.
+        """
+        self.__data = None
+        self.__block.release()
+        return
+
+    def __enter__(self) -> SharedSpriteSheet:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        return
+
+
+def publish(data: SpriteSheetData, name: Optional[str] = None) -> SharedSpriteSheet:
+    """
+    Copies the frames of a sheet into a new shared memory block.
+
+    The returned sheet owns the block and unlinks it when closed.
+
+    :param data: The loaded sheet.
+    :param name: The name of the block. A unique name is chosen if not given.
+    :return: The published sheet. Send its manifest to other processes.
+    """
+    frames = data.frames or ()
+    pixels = [pygame.image.tobytes(frame.surface, PIXEL_FORMAT) for frame in frames]
+
+    shm = shared_memory.SharedMemory(
+        name=name, create=True, size=max(sum(map(len, pixels)), 1)
+    )
+    _published.add(shm.name)
+
+    offset = 0
+    frame_entries: list[dict[str, int]] = []
+    for frame, raw in zip(frames, pixels):
+        shm.buf[offset : offset + len(raw)] = raw
+        frame_entries.append(
+            {
+                "offset": offset,
+                "width": frame.surface.width,
+                "height": frame.surface.height,
+                "duration": frame.duration,
+            }
+        )
+        offset += len(raw)
+
+    manifest: Manifest = {
+        "name": shm.name,
+        "format": PIXEL_FORMAT,
+        "frames": frame_entries,
+        "repeat": data.repeat,
+        "direction": direction_to_path(data.direction) if data.direction else None,
+        "tags": tags_to_dict(data.tags or {}),
+    }
+
+    return SharedSpriteSheet(shm, manifest, owner=True)
+
+
+def attach(manifest: Manifest) -> SharedSpriteSheet:
+    """
+    Attaches to a published sheet.
+
+    :param manifest: The manifest of the published sheet.
+    :return: The attached sheet. Closing it does not unlink the block.
+    """
+    if manifest.get("format", PIXEL_FORMAT) != PIXEL_FORMAT:
+        raise ValueError(f"unsupported pixel format {manifest['format']}.")
+
+    return SharedSpriteSheet(_open(manifest["name"]), manifest, owner=False)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, final
+from array import array
+from typing import BinaryIO, Iterable, Optional, Sequence, final
 from pathlib import Path
 
-import pygame.image
-from pygame import Surface, Vector2
+from pygame import Mask, Rect, Surface, Vector2
 
 from pygame_animated_sprite._timer import CountUpTimer
 from pygame_animated_sprite.direction import (
@@ -15,15 +15,18 @@ from pygame_animated_sprite.structures import Tag, Frame
 from pygame_animated_sprite.loader.base import (
     BaseSpriteSheetLoader,
     SpriteSheetData,
-    UnsupportedFileFormatError,
 )
+from pygame_animated_sprite.loader.registry import get_loader
+from pygame_animated_sprite.loader.source import AssetSource
 
 
 def load(
-    path: str,
+    path: str | Path | bytes | BinaryIO,
     loader: Optional[BaseSpriteSheetLoader] = None,
+    source: Optional[AssetSource] = None,
+    name: str = "",
 ) -> AnimatedSprite:
-    return AnimatedSprite.load(path, loader)
+    return AnimatedSprite.load(path, loader, source, name)
 
 
 @final
@@ -32,12 +35,15 @@ class AnimatedSprite:
     A class for handling animated sprites in Pygame.
     """
 
+    # number of integers in a playback state, see get_state()
+    STATE_SIZE: int = 7
+
     def __init__(
         self,
         frames: Sequence[Frame],
         repeats: int,
         direction: type[Direction],
-        tags: dict[str, Tag],
+        tags: Optional[dict[str, Tag]],
     ) -> None:
         """
         Initializes the AnimatedSprite.
@@ -46,16 +52,26 @@ class AnimatedSprite:
         :param repeats: The number of times to repeat the animation.
         :param direction: The direction of the animation (e.g., Forward, Reverse).
         :param tags: A dictionary of tags for slicing the animation.
+                     None when the sheet has no tags.
         """
         self.__frames: list[Frame] = list(frames)
-        self.__tags: dict[str, Tag] = tags
+        # loaders without tags (e.g. SimpleSpriteSheetLoader) give None
+        self.__tags: dict[str, Tag] = tags or {}
+        self.__tag_names: tuple[str, ...] = tuple(self.__tags)
 
-        self.__direction: Direction = direction(
+        self.__sheet_direction: Direction = direction(
             frame_count=len(frames),
             repeats=repeats,
         )
+        self.__direction: Direction = self.__sheet_direction
+
+        # the tag being played, its first frame and its directions per tag
+        self.__tag: Optional[str] = None
+        self.__offset: int = 0
+        self.__tag_directions: dict[str, Direction] = {}
 
         self.__timer: CountUpTimer = CountUpTimer()
+        self.__finished: bool = False
 
         iter(self.__direction)
         self.__index: int = next(self.__direction)
@@ -85,29 +101,29 @@ class AnimatedSprite:
     @classmethod
     def load(
         cls: type[AnimatedSprite],
-        path: str,
+        path: str | Path | bytes | BinaryIO,
         loader: Optional[BaseSpriteSheetLoader] = None,
+        source: Optional[AssetSource] = None,
+        name: str = "",
     ) -> AnimatedSprite:
         """
         Loads an animated sprite from a file.
 
-        :param path: The path to the file.
+        :param path: The path to the file, the name of an asset in source,
+                     raw bytes or a binary file object.
         :param loader: The loader to use for loading the file.
+                       Picked from the file extension or content if not given.
+        :param source: The source (e.g. a ZipSource) to read the file from.
+        :param name: The file name of raw bytes or a file object.
         :return: An AnimatedSprite object.
         """
         if loader is None:
+            loader = get_loader(path, source=source, name=name)
 
-            class DefaultEncoder(BaseSpriteSheetLoader):
-                def load_file(self, _path: Path) -> SpriteSheetData:
-                    if _path.suffix not in [".png", ".jpeg", ".jpg"]:
-                        raise UnsupportedFileFormatError
-                    return SpriteSheetData(
-                        frames=(Frame(surface=pygame.image.load(_path), duration=0),)
-                    )
-
-            loader = DefaultEncoder()
+        if isinstance(path, str) and source is None:
+            path = Path(path)
 
-        data: SpriteSheetData = loader.load(Path(path))
+        data: SpriteSheetData = loader.load(path, source=source, name=name)
 
         return cls(
             frames=data.frames,
@@ -147,6 +163,9 @@ class AnimatedSprite:
     @frames.setter
     def frames(self, new: Sequence[Frame]) -> None:
         self.__frames = list(new)
+        self.__sheet_direction.frame_count = len(self.__frames)
+        self.__tag_directions.clear()
+        self.__switch(None)
         self.reset()
         return
 
@@ -156,19 +175,58 @@ class AnimatedSprite:
         return self.__tags
 
     @tags.setter
-    def tags(self, new: dict[str, Tag]) -> None:
-        self.__tags = new
+    def tags(self, new: Optional[dict[str, Tag]]) -> None:
+        """
+        Replaces the tags. The tag being played keeps its progress unless it
+        was removed (the whole animation restarts) or its frames or direction
+        changed (the tag restarts).
+        """
+        playing = self.__tags.get(self.__tag) if self.__tag is not None else None
+
+        self.__tags = new or {}
+        self.__tag_names = tuple(self.__tags)
+        self.__tag_directions.clear()
+        if playing is None:
+            return
+
+        tag = self.__tags.get(self.__tag)
+        if tag is None:
+            self.__switch(None)
+            self.reset()
+        elif tag == playing:
+            self.__tag_directions[self.__tag] = self.__direction
+        elif (tag.start, tag.end, tag.direction) != (
+            playing.start,
+            playing.end,
+            playing.direction,
+        ):
+            self.__switch(self.__tag)
+            self.reset()
+        else:
+            # only the repeat changed, it counts from the current pass
+            current_index, _, phase = self.__direction.get_state()
+            self.__switch(self.__tag)
+            self.__direction.set_state((current_index, self.__direction.repeats, phase))
         return
 
+    @property
+    def tag(self) -> Optional[str]:
+        """The name of the tag being played, None for the whole animation."""
+        return self.__tag
+
     @property
     def repeat(self) -> int:
-        """The number of times to repeat the animation."""
-        return self.__direction.repeats
+        """
+        The number of times to repeat the whole animation, whatever tag is
+        being played. See get_current_repeat.
+        """
+        return self.__sheet_direction.repeats
 
     @repeat.setter
     def repeat(self, new: int) -> None:
-        self.__direction.repeats = new
-        self.reset()
+        self.__sheet_direction.repeats = new
+        if self.__tag is None:
+            self.reset()
         return
 
     @property
@@ -178,22 +236,35 @@ class AnimatedSprite:
 
     @property
     def direction(self) -> type[Direction]:
-        """The direction of the animation."""
-        return self.__direction.__class__
+        """
+        The direction of the whole animation, whatever tag is being played.
+        See get_current_direction.
+        """
+        return self.__sheet_direction.__class__
 
     @direction.setter
     def direction(self, new: type[Direction]) -> None:
-        self.__direction = new(
-            frame_count=len(self.__frames),
+        self.__sheet_direction = new(
+            frame_count=self.__sheet_direction.frame_count,
             repeats=self.repeat,
         )
-        self.reset()
+        if self.__tag is None:
+            self.__direction = self.__sheet_direction
+            self.reset()
         return
 
     def get_time(self) -> int:
         """Gets the current time of the animation timer."""
         return self.__timer.time
 
+    def get_current_direction(self) -> type[Direction]:
+        """Gets the direction being played: the one of the tag or the whole animation."""
+        return self.__direction.__class__
+
+    def get_current_repeat(self) -> int:
+        """Gets the repeat being played: the one of the tag or the whole animation."""
+        return self.__direction.repeats
+
     def get_current_frame(self) -> Frame:
         """Gets the current frame of the animation."""
         if not self.__frames:
@@ -201,10 +272,26 @@ class AnimatedSprite:
 
         return self.__frames[self.__index]
 
+    def get_current_mask(self) -> Mask:
+        """Gets the cached collision mask of the current frame."""
+        return self.get_current_frame().get_mask()
+
+    def get_current_bounds(self) -> Rect:
+        """Gets the cached bounding rect of the opaque pixels of the current frame."""
+        return self.get_current_frame().get_bounds()
+
+    def get_current_hitboxes(self) -> dict[str, Rect]:
+        """Gets the named hitboxes (e.g. Aseprite slices) of the current frame."""
+        return self.get_current_frame().hitboxes
+
     def is_playing(self) -> bool:
         """Returns True if the animation is playing."""
         return not self.__timer.is_paused()
 
+    def is_finished(self) -> bool:
+        """Returns True if the animation stopped after its last repeat."""
+        return self.__finished
+
     def play(self) -> None:
         """Plays the animation."""
         self.__timer.unpause()
@@ -219,8 +306,131 @@ class AnimatedSprite:
         """Resets the animation to the beginning."""
         self.play()
         self.__timer.reset()
+        self.__finished = False
         iter(self.__direction)
-        self.__index = next(self.__direction)
+        self.__index = self.__offset + next(self.__direction)
+        return
+
+    def __get_tag_direction(self, name: str) -> Direction:
+        direction = self.__tag_directions.get(name)
+        if direction is None:
+            if name not in self.__tags:
+                raise KeyError(name)
+
+            tag: Tag = self.__tags[name]
+            # same range as slice_by_tag
+            frame_count = min(tag.end + 1, len(self.__frames)) - tag.start
+            if frame_count <= 0:
+                raise ValueError(f"tag {name} has no frames.")
+
+            direction = tag.direction(frame_count=frame_count, repeats=tag.repeat)
+            self.__tag_directions[name] = direction
+        return direction
+
+    def __switch(self, name: Optional[str]) -> None:
+        if name is None:
+            self.__direction = self.__sheet_direction
+            self.__offset = 0
+        else:
+            self.__direction = self.__get_tag_direction(name)
+            self.__offset = self.__tags[name].start
+        self.__tag = name
+        return
+
+    def play_tag(self, name: Optional[str], restart: bool = False) -> None:
+        """
+        Plays the frames of a tag with its direction and repeat, in place.
+        Unlike slice_by_tag, no sprite is created and switching between tags
+        that were played before does not allocate.
+
+        :param name: The name of the tag. None plays the whole animation.
+        :param restart: Restarts the tag if it is already playing.
+        """
+        if name == self.__tag and not restart:
+            if not self.__finished:
+                self.play()
+            return
+
+        self.__switch(name)
+        self.reset()
+        return
+
+    def __get_state(self) -> tuple[int, ...]:
+        current_index, repeats_left, phase = self.__direction.get_state()
+        if self.__finished:
+            paused = 2
+        else:
+            paused = int(self.__timer.is_paused())
+        return (
+            self.__timer.time,
+            self.__index,
+            current_index,
+            repeats_left,
+            phase,
+            paused,
+            -1 if self.__tag is None else self.__tag_names.index(self.__tag),
+        )
+
+    def __set_state(self, state: Sequence[int]) -> None:
+        time, index, current_index, repeats_left, phase, paused, tag = state
+        self.__switch(None if tag < 0 else self.__tag_names[tag])
+        self.__timer.time = time
+        self.__index = index
+        self.__direction.set_state((current_index, repeats_left, phase))
+        self.__finished = paused == 2
+        if paused:
+            self.__timer.pause()
+        else:
+            self.__timer.unpause()
+        return
+
+    def get_state(self) -> array:
+        """
+        Gets the playback state as a flat array of STATE_SIZE integers:
+        time, index, direction index, repeats left, direction phase,
+        paused (2 when finished) and tag (its position in tags, -1 for none).
+        """
+        return array("q", self.__get_state())
+
+    def set_state(self, state: Sequence[int] | bytes) -> None:
+        """
+        Restores a playback state returned by get_state.
+        The frames, tags, direction type and repeat of the sprite must be unchanged.
+        """
+        if isinstance(state, (bytes, bytearray, memoryview)):
+            state = array("q", bytes(state))
+
+        if len(state) != self.STATE_SIZE:
+            raise ValueError(f"state must have {self.STATE_SIZE} values.")
+
+        self.__set_state(state)
+        return
+
+    @staticmethod
+    def get_states(sprites: Iterable[AnimatedSprite]) -> array:
+        """
+        Gets the playback states of many sprites as one flat array.
+        Use tobytes() on the result for a compact buffer.
+        """
+        states = array("q")
+        for sprite in sprites:
+            states.extend(sprite.__get_state())
+        return states
+
+    @staticmethod
+    def set_states(
+        sprites: Sequence[AnimatedSprite], states: Sequence[int] | bytes
+    ) -> None:
+        """Restores the playback states returned by get_states, in the same order."""
+        if isinstance(states, (bytes, bytearray, memoryview)):
+            states = array("q", bytes(states))
+
+        size = AnimatedSprite.STATE_SIZE
+        if len(states) != len(sprites) * size:
+            raise ValueError("states do not match the number of sprites.")
+
+        for i, sprite in enumerate(sprites):
+            sprite.__set_state(states[i * size : (i + 1) * size])
         return
 
     def slice_by_tag(self, tag_name: str) -> AnimatedSprite:
@@ -241,31 +451,68 @@ class AnimatedSprite:
 
     def update(self, time_delta: int) -> None:
         """
-        Updates the animation by a given time delta.
+        Updates the animation by a given time delta, advancing as many
+        frames as the time delta covers.
         """
         if not self.is_playing():
             return
 
-        if self.__timer.time >= self.__frames[self.__index].duration:
+        self.__timer.update(time_delta)
+
+        # a large time delta can span several frames
+        while True:
+            duration: int = self.__frames[self.__index].duration
+            if self.__timer.time < duration:
+                break
+
             try:
-                self.__index = next(self.__direction)
+                self.__index = self.__offset + next(self.__direction)
             except StopIteration:
                 self.pause()
+                self.__finished = True
+                break
 
-            overflow_time: int = (
-                self.__timer.time - self.__frames[self.__index].duration
-            )
-            self.__timer.reset()
-            self.__timer.update(overflow_time)
+            # the overflow of the frame that ended
+            self.__timer.time -= duration
 
-        self.__timer.update(time_delta)
+            # frames without a duration advance once per update
+            if duration <= 0:
+                break
+        return
+
+    def build_lods(self, levels: int = 3) -> None:
+        """
+        Builds downscaled levels (1/2, 1/4, ...) of every frame for zoomed
+        out rendering.
+
+        :param levels: The maximum number of levels below full size.
+        """
+        for frame in {id(frame): frame for frame in self.__frames}.values():
+            frame.build_lods(levels)
         return
 
-    def render(self) -> Surface:
-        """Renders the current frame of the animation."""
-        return self.__frames[self.__index].surface
+    def build_masks(self) -> None:
+        """
+        Computes the collision masks and bounding rects of every frame ahead
+        of time instead of on first use.
+        """
+        for frame in {id(frame): frame for frame in self.__frames}.values():
+            frame.build_mask()
+        return
 
-    def draw(self, surface: Surface, dest: tuple[int, int] | Vector2) -> None:
+    def render(self, zoom: float = 1) -> Surface:
+        """
+        Renders the current frame of the animation.
+
+        :param zoom: Picks the nearest level built by build_lods when below 1.
+        """
+        if zoom == 1:
+            return self.__frames[self.__index].surface
+        return self.__frames[self.__index].get_lod(zoom)
+
+    def draw(
+        self, surface: Surface, dest: tuple[int, int] | Vector2, zoom: float = 1
+    ) -> None:
         """Draws the current frame of the animation to a surface."""
-        surface.blit(self.render(), dest)
+        surface.blit(self.render(zoom), dest)
         return
@@ -0,0 +1,142 @@
+"""
+Declarative animation state machine
+
+States map to tags of a single ``AnimatedSprite`` and are switched with
+``AnimatedSprite.play_tag``, so changing state does not create sprites.
+Transitions are resolved into lookup tables once, when the machine is built.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Mapping, Optional
+
+from pygame_animated_sprite.sprite import AnimatedSprite
+
+
+@dataclass(frozen=True)
+class AnimationState:
+    name: str
+    # the tag played in this state, defaults to the name of the state
+    tag: Optional[str] = field(default=None)
+    # the state entered when the tag finishes
+    on_finish: Optional[str] = field(default=None)
+    # event name -> state
+    transitions: Mapping[str, str] = field(default_factory=dict)
+    # when False, events wait until the tag finishes
+    interruptible: bool = field(default=True)
+
+
+class AnimationStateMachine:
+    """
+    Drives the tag played by a sprite from events and finished animations.
+    """
+
+    def __init__(
+        self,
+        sprite: AnimatedSprite,
+        states: Iterable[AnimationState],
+        initial: str,
+        transitions: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Builds the machine and enters the initial state.
+
+        :param sprite: The sprite to play the tags on.
+        :param states: The states of the machine.
+        :param initial: The name of the first state.
+        :param transitions: Event transitions shared by every state.
+                            Transitions of a state take precedence.
+        """
+        self.sprite: AnimatedSprite = sprite
+
+        self.__tags: dict[str, str] = {}
+        self.__on_finish: dict[str, Optional[str]] = {}
+        self.__interruptible: dict[str, bool] = {}
+        self.__transitions: dict[str, dict[str, str]] = {}
+
+        for state in states:
+            if state.name in self.__tags:
+                raise ValueError(f"state {state.name} is defined twice.")
+
+            tag = state.tag if state.tag is not None else state.name
+            if tag not in sprite.tags:
+                raise KeyError(f"tag {tag} of state {state.name} does not exist.")
+
+            self.__tags[state.name] = tag
+            self.__on_finish[state.name] = state.on_finish
+            self.__interruptible[state.name] = state.interruptible
+            self.__transitions[state.name] = {
+                **(transitions or {}),
+                **state.transitions,
+            }
+
+        for name in self.__tags:
+            targets = list(self.__transitions[name].values())
+            if self.__on_finish[name] is not None:
+                targets.append(self.__on_finish[name])
+            for target in targets:
+                if target not in self.__tags:
+                    raise KeyError(f"state {name} leads to unknown state {target}.")
+
+        if initial not in self.__tags:
+            raise KeyError(f"unknown initial state {initial}.")
+
+        self.__state: str = initial
+        self.__pending: Optional[str] = None
+        self.sprite.play_tag(self.__tags[initial], restart=True)
+        return
+
+    @property
+    def state(self) -> str:
+        """The name of the current state."""
+        return self.__state
+
+    @property
+    def pending(self) -> Optional[str]:
+        """The state waiting for a non interruptible state to finish."""
+        return self.__pending
+
+    def set_state(self, name: str, restart: bool = False) -> None:
+        """
+        Enters a state, ignoring transitions and interruptible.
+
+        :param name: The name of the state.
+        :param restart: Restarts the tag if the state is already active.
+        """
+        if name not in self.__tags:
+            raise KeyError(name)
+
+        self.__state = name
+        self.__pending = None
+        self.sprite.play_tag(self.__tags[name], restart=restart)
+        return
+
+    def send(self, event: str) -> bool:
+        """
+        Sends an event to the current state.
+
+        :return: True if the event leads to a state, now or once the
+                 current tag finishes.
+        """
+        target = self.__transitions[self.__state].get(event)
+        if target is None:
+            return False
+
+        if self.__interruptible[self.__state] or self.sprite.is_finished():
+            self.set_state(target, restart=True)
+        else:
+            self.__pending = target
+        return True
+
+    def update(self, time_delta: int) -> None:
+        """Updates the sprite and follows on_finish and pending transitions."""
+        self.sprite.update(time_delta)
+
+        if not self.sprite.is_finished():
+            return
+
+        target = self.__pending or self.__on_finish[self.__state]
+        if target is not None:
+            self.set_state(target, restart=True)
+        return
@@ -0,0 +1,413 @@
+"""
+Streaming playback for long animations
+
+A ``StreamingSprite`` only keeps a window of frames in memory. Frames ahead of
+the playhead are loaded on a background thread and frames behind it are
+released. Frames come from an image sequence, sheet tiles or a pack file.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+import pygame.image
+from pygame import Surface, Vector2
+
+from pygame_animated_sprite._timer import CountUpTimer
+from pygame_animated_sprite._utils import clip_surface
+from pygame_animated_sprite.codec import PackReader
+from pygame_animated_sprite.direction import Direction, Forward
+
+
+class FrameSource(ABC):
+    """Abstract base class for a source of frames loaded on demand."""
+
+    @property
+    @abstractmethod
+    def durations(self) -> tuple[int, ...]:
+        """The duration of every frame (ms)."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+    @abstractmethod
+    def load_frame(self, index: int) -> Surface:
+        """
+        Loads the surface of a frame. Called from the prefetch thread.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Releases the resources held by the source."""
+        return
+
+
+class ImageSequenceSource(FrameSource):
+    """Frames stored as one image file per frame."""
+
+    def __init__(
+        self,
+        paths: Sequence[str | Path],
+        durations: Optional[Sequence[int]] = None,
+        default_duration: int = 100,
+    ) -> None:
+        if durations is not None and len(durations) != len(paths):
+            raise ValueError("paths and durations must have the same length.")
+
+        self.paths: tuple[Path, ...] = tuple(Path(path) for path in paths)
+        self.__durations: tuple[int, ...] = (
+            tuple(durations)
+            if durations is not None
+            else (default_duration,) * len(self.paths)
+        )
+        return
+
+    @classmethod
+    def from_folder(
+        cls: type[ImageSequenceSource],
+        path: str | Path,
+        pattern: str = "*.png",
+        default_duration: int = 100,
+    ) -> ImageSequenceSource:
+        """Creates a source from the images of a folder, sorted by name."""
+        return cls(sorted(Path(path).glob(pattern)), default_duration=default_duration)
+
+    @property
+    def durations(self) -> tuple[int, ...]:
+        return self.__durations
+
+    def load_frame(self, index: int) -> Surface:
+        return pygame.image.load(self.paths[index].as_posix())
+
+
+class SheetTileSource(FrameSource):
+    """
+    Frames stored as tiles of one or more sprite sheets of the same layout.
+    Only the sheet of the most recently loaded frame is kept decoded.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str | Path],
+        columns: int,
+        rows: int,
+        size: tuple[int, int],
+        position: tuple[int, int] = (0, 0),
+        padding: tuple[int, int] = (0, 0),
+        default_duration: int = 100,
+        frame_count: Optional[int] = None,
+    ) -> None:
+        """
+        :param paths: The sheet files, in playback order.
+        :param columns: The number of tile lines in a sheet.
+        :param rows: The number of tiles in a line.
+        :param size: The size of a tile.
+        :param position: The position of the first tile in a sheet.
+        :param padding: The space between tiles.
+        :param default_duration: The duration of every frame (ms).
+        :param frame_count: The number of frames, if the last sheet is not full.
+        """
+        if columns <= 0:
+            raise ValueError("columns must be greater than 0.")
+        if rows <= 0:
+            raise ValueError("rows must be greater than 0.")
+
+        self.paths: tuple[Path, ...] = tuple(Path(path) for path in paths)
+        self.columns = columns
+        self.rows = rows
+        self.width, self.height = size
+        self.x, self.y = position
+        self.padding_x, self.padding_y = padding
+
+        if frame_count is None:
+            frame_count = len(self.paths) * columns * rows
+        self.__durations: tuple[int, ...] = (default_duration,) * frame_count
+
+        self.__lock = threading.Lock()
+        self.__sheet_index: int = -1
+        self.__sheet: Optional[Surface] = None
+        return
+
+    @property
+    def durations(self) -> tuple[int, ...]:
+        return self.__durations
+
+    def load_frame(self, index: int) -> Surface:
+        sheet_index, tile = divmod(index, self.columns * self.rows)
+        column, row = divmod(tile, self.rows)
+
+        with self.__lock:
+            if self.__sheet_index != sheet_index or self.__sheet is None:
+                self.__sheet = pygame.image.load(self.paths[sheet_index].as_posix())
+                self.__sheet_index = sheet_index
+
+            return clip_surface(
+                self.__sheet,
+                (
+                    self.x + (self.width + self.padding_x) * row,
+                    self.y + (self.height + self.padding_y) * column,
+                ),
+                (self.width, self.height),
+            )
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__sheet = None
+            self.__sheet_index = -1
+        return
+
+
+class PackSource(FrameSource):
+    """
+    Frames stored in a delta/RLE compressed pack file. The compressed file is
+    kept in memory and frames are decoded on demand.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.reader: PackReader = PackReader.open(path)
+        self.__durations: tuple[int, ...] = self.reader.durations
+        return
+
+    @property
+    def durations(self) -> tuple[int, ...]:
+        return self.__durations
+
+    def load_frame(self, index: int) -> Surface:
+        return self.reader.decode_surface(index)
+
+
+@dataclass
+class StreamStats:
+    loads: int = field(default=0)
+    stalls: int = field(default=0)
+    stall_time: float = field(default=0.0)  # ms
+    resident: int = field(default=0)
+
+
+class StreamingSprite:
+    """
+    An animated sprite whose frames are streamed from a FrameSource.
+    """
+
+    def __init__(
+        self,
+        source: FrameSource,
+        repeats: int = -1,
+        direction: type[Direction] = Forward,
+        window: int = 16,
+        lookahead: int = 1000,
+        on_stall: Optional[Callable[[int, float], None]] = None,
+    ) -> None:
+        """
+        Initializes the StreamingSprite and starts prefetching.
+
+        :param source: The source to stream the frames from.
+        :param repeats: The number of times to repeat the animation.
+        :param direction: The direction of the animation.
+        :param window: The maximum number of frames kept in memory.
+        :param lookahead: How far ahead of the playhead to prefetch (ms).
+        :param on_stall: Called with the frame index and the wait time (ms)
+                         when a frame was not ready in time.
+        """
+        if window <= 0:
+            raise ValueError("window must be greater than 0.")
+        if len(source) == 0:
+            raise ValueError("source has no frames.")
+
+        self.source: FrameSource = source
+        self.window: int = window
+        self.lookahead: int = lookahead
+        self.on_stall = on_stall
+        self.stats: StreamStats = StreamStats()
+
+        self.__durations: tuple[int, ...] = source.durations
+        self.__direction: Direction = direction(
+            frame_count=len(source), repeats=repeats
+        )
+        self.__timer: CountUpTimer = CountUpTimer()
+
+        self.__lock = threading.Lock()
+        self.__cache: dict[int, Surface] = {}
+        self.__pending: dict[int, Future[None]] = {}
+        self.__wanted: set[int] = set()
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="StreamingSprite"
+        )
+
+        iter(self.__direction)
+        self.__index: int = next(self.__direction)
+        self.__prefetch()
+        return
+
+    def __len__(self) -> int:
+        """Returns the number of frames in the animation."""
+        return len(self.__durations)
+
+    @property
+    def index(self) -> int:
+        """The current frame index."""
+        return self.__index
+
+    def __upcoming(self) -> list[int]:
+        # walk a copy of the direction to find the frames played next
+        direction = copy.copy(self.__direction)
+        wanted: list[int] = [self.__index]
+        ahead = self.__durations[self.__index] - self.__timer.time
+
+        while len(wanted) < self.window and ahead < self.lookahead:
+            try:
+                index = next(direction)
+            except StopIteration:
+                break
+
+            if index not in wanted:
+                wanted.append(index)
+            ahead += max(self.__durations[index], 1)
+
+        return wanted
+
+    def __load(self, index: int) -> None:
+        surface = self.source.load_frame(index)
+        with self.__lock:
+            self.__pending.pop(index, None)
+            self.stats.loads += 1
+            # released by a prefetch while loading, keep the window bounded
+            if index in self.__wanted:
+                self.__cache[index] = surface
+                self.stats.resident = len(self.__cache)
+        return
+
+    def __prefetch(self) -> None:
+        wanted = self.__upcoming()
+
+        with self.__lock:
+            self.__wanted = set(wanted)
+
+            # release frames behind the playhead
+            for index in [i for i in self.__cache if i not in wanted]:
+                del self.__cache[index]
+
+            for index in [i for i in self.__pending if i not in wanted]:
+                if self.__pending[index].cancel():
+                    del self.__pending[index]
+
+            for index in wanted:
+                if index in self.__cache or index in self.__pending:
+                    continue
+                self.__pending[index] = self.__executor.submit(self.__load, index)
+
+            self.stats.resident = len(self.__cache)
+        return
+
+    def is_playing(self) -> bool:
+        """Returns True if the animation is playing."""
+        return not self.__timer.is_paused()
+
+    def play(self) -> None:
+        """Plays the animation."""
+        self.__timer.unpause()
+        return
+
+    def pause(self) -> None:
+        """Pauses the animation."""
+        self.__timer.pause()
+        return
+
+    def reset(self) -> None:
+        """Resets the animation to the beginning."""
+        self.play()
+        self.__timer.reset()
+        iter(self.__direction)
+        self.__index = next(self.__direction)
+        self.__prefetch()
+        return
+
+    def update(self, time_delta: int) -> None:
+        """
+        Updates the animation by a given time delta.
+        """
+        if not self.is_playing():
+            return
+
+        self.__timer.update(time_delta)
+
+        # same stepping as AnimatedSprite.update
+        advanced = False
+        while True:
+            duration: int = self.__durations[self.__index]
+            if self.__timer.time < duration:
+                break
+
+            try:
+                self.__index = next(self.__direction)
+            except StopIteration:
+                self.pause()
+                break
+
+            advanced = True
+            self.__timer.time -= duration
+            if duration <= 0:
+                break
+
+        if advanced:
+            self.__prefetch()
+        return
+
+    def render(self) -> Surface:
+        """
+        Renders the current frame of the animation.
+        Blocks if the frame has not been loaded yet and reports a stall.
+        """
+        index = self.__index
+        with self.__lock:
+            surface = self.__cache.get(index)
+            future = self.__pending.get(index)
+
+        if surface is not None:
+            return surface
+
+        start = time.perf_counter()
+        if future is not None:
+            future.result()
+        else:
+            self.__load(index)
+        waited = (time.perf_counter() - start) * 1000
+
+        with self.__lock:
+            self.stats.stalls += 1
+            self.stats.stall_time += waited
+            surface = self.__cache[index]
+
+        if self.on_stall is not None:
+            self.on_stall(index, waited)
+        return surface
+
+    def draw(self, surface: Surface, dest: tuple[int, int] | Vector2) -> None:
+        """Draws the current frame of the animation to a surface."""
+        surface.blit(self.render(), dest)
+        return
+
+    def close(self) -> None:
+        """Stops prefetching and releases every frame."""
+        self.__executor.shutdown(wait=True, cancel_futures=True)
+        with self.__lock:
+            self.__cache.clear()
+            self.__pending.clear()
+            self.stats.resident = 0
+        self.source.close()
+        return
+
+    def __enter__(self) -> StreamingSprite:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+        return
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+from typing import Optional
 
-from pygame import Surface
+import pygame.mask
+import pygame.transform
+from pygame import Mask, Rect, Surface
 
 from pygame_animated_sprite.direction import Direction
 
@@ -30,8 +34,84 @@ class Frame:
     surface: Surface
     duration: int
 
+    # downscaled versions of surface (1/2, 1/4, ...), see build_lods
+    lods: tuple[Surface, ...] = field(default=(), repr=False, compare=False)
+    _lod_source: Optional[Surface] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # named rects in frame coordinates, e.g. Aseprite slices
+    hitboxes: dict[str, Rect] = field(default_factory=dict, repr=False, compare=False)
+
+    # collision data of surface, see build_mask
+    _mask: Optional[Mask] = field(default=None, init=False, repr=False, compare=False)
+    _bounds: Optional[Rect] = field(default=None, init=False, repr=False, compare=False)
+    _mask_source: Optional[Surface] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def copy(self) -> Frame:
         return Frame(
             surface=self.surface.copy(),
             duration=self.duration,
+            hitboxes={name: rect.copy() for name, rect in self.hitboxes.items()},
         )
+
+    def build_mask(self) -> None:
+        """
+        Computes the collision mask and the bounding rect of the opaque pixels.
+        Called on demand by get_mask and get_bounds.
+        """
+        self._mask = pygame.mask.from_surface(self.surface)
+        self._bounds = self.surface.get_bounding_rect()
+        self._mask_source = self.surface
+        return
+
+    def get_mask(self) -> Mask:
+        """Gets the cached collision mask of the surface."""
+        if self._mask_source is not self.surface:
+            self.build_mask()
+        return self._mask
+
+    def get_bounds(self) -> Rect:
+        """Gets the cached bounding rect of the opaque pixels of the surface."""
+        if self._mask_source is not self.surface:
+            self.build_mask()
+        return self._bounds
+
+    def build_lods(self, levels: int = 3) -> None:
+        """
+        Builds a chain of downscaled versions of the surface, each half the
+        size of the previous one.
+
+        :param levels: The maximum number of levels below full size.
+        """
+        lods: list[Surface] = []
+        surface = self.surface
+        for _ in range(levels):
+            size = (max(surface.width // 2, 1), max(surface.height // 2, 1))
+            if size == surface.get_size():
+                break
+
+            if surface.get_bitsize() >= 24:
+                surface = pygame.transform.smoothscale(surface, size)
+            else:
+                surface = pygame.transform.scale(surface, size)
+            lods.append(surface)
+
+        self.lods = tuple(lods)
+        self._lod_source = self.surface
+        return
+
+    def get_lod(self, zoom: float) -> Surface:
+        """
+        Gets the level nearest to a zoom factor, without resampling.
+        Falls back to the full size surface if no levels were built.
+        """
+        if zoom >= 1 or not self.lods or self._lod_source is not self.surface:
+            return self.surface
+
+        level = min(round(-math.log2(max(zoom, 1e-6))), len(self.lods))
+        if level <= 0:
+            return self.surface
+        return self.lods[level - 1]
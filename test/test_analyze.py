@@ -0,0 +1,119 @@
+import contextlib
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygame.image
+from pygame import Surface, SRCALPHA
+
+from pygame_animated_sprite.analyze import analyze, find_sheets, main
+
+ROOT = Path(__file__).parent.parent
+EXAMPLE = ROOT / "example" / "aseprite"
+
+
+class AnalyzeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+
+        for folder in ("a", "b"):
+            (self.root / folder).mkdir()
+            for name in ("mario-sheet.json", "mario-sheet.png"):
+                shutil.copy(EXAMPLE / name, self.root / folder / name)
+
+        icon = Surface((8, 8), SRCALPHA)
+        icon.fill((255, 0, 0), (0, 0, 4, 2))
+        pygame.image.save(icon, (self.root / "icon.png").as_posix())
+        return
+
+    def tearDown(self):
+        self.directory.cleanup()
+        return
+
+    def test_find_sheets(self):
+        self.assertEqual(
+            [path.relative_to(self.root).as_posix() for path in find_sheets(self.root)],
+            ["a/mario-sheet.json", "b/mario-sheet.json", "icon.png"],
+        )
+        return
+
+    def test_analyze(self):
+        reports = {report.path: report for report in analyze(self.root)}
+
+        first, second = reports["a/mario-sheet.json"], reports["b/mario-sheet.json"]
+        self.assertEqual(first.frame_count, 6)
+        self.assertEqual(first.bytes, second.bytes)
+        self.assertEqual(first.duplicates, 0)
+        self.assertEqual(second.duplicates, 6)
+        self.assertEqual(second.frames[2].duplicate_of, "a/mario-sheet.json#2")
+
+        icon = reports["icon.png"]
+        self.assertEqual(icon.bytes, 8 * 8 * 4)
+        self.assertAlmostEqual(icon.transparent_ratio, 1 - 8 / 64)
+        self.assertEqual(icon.trim_savings, (64 - 8) * 4)
+        return
+
+    def test_grid(self):
+        shutil.copy(ROOT / "example" / "simple" / "parappa_sheet.png", self.root)
+        reports = {report.path: report for report in analyze(self.root)}
+
+        sheet = reports["parappa_sheet.png"]
+        self.assertEqual(sheet.loader, "SimpleSpriteSheetLoader")
+        self.assertEqual(sheet.frame_count, 3)
+        self.assertEqual(sheet.frames[0].bytes, 32 * 32 * 4)
+        self.assertEqual(
+            (sheet.grid.columns, sheet.grid.rows, sheet.grid.x, sheet.grid.y),
+            (3, 1, 1, 13),
+        )
+
+        # a single frame is not a grid
+        self.assertIsNone(reports["icon.png"].grid)
+        self.assertEqual(reports["icon.png"].frame_count, 1)
+        return
+
+    def test_main(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(main([str(self.root), "--json", "--sort", "path"]), 0)
+
+        report = json.loads(output.getvalue())
+        self.assertEqual(report[0]["path"], "a/mario-sheet.json")
+        self.assertEqual(report[2]["frames"][0]["width"], 8)
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main([str(self.root)])
+        self.assertIn("total", output.getvalue())
+        return
+
+    def test_command_json(self):
+        env = {k: v for k, v in os.environ.items() if k != "PYGAME_HIDE_SUPPORT_PROMPT"}
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(ROOT), env.get("PYTHONPATH")])
+        )
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pygame_animated_sprite.analyze",
+                str(self.root),
+                "--json",
+            ],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        self.assertEqual(len(json.loads(result.stdout)), 3)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygame.image
+from pygame import Surface, SRCALPHA
+
+import pygame_animated_sprite
+from pygame_animated_sprite.codec import (
+    DELTA,
+    KEYFRAME,
+    PackReader,
+    decode_rle,
+    dirty_rect,
+    encode_rle,
+    write_pack,
+)
+from pygame_animated_sprite._utils import direction_from_path
+from pygame_animated_sprite.direction import Forward, PingPong, Reverse
+from pygame_animated_sprite.loader.base import SpriteSheetData
+from pygame_animated_sprite.structures import Frame, Tag
+
+
+def pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+class RLETestCase(unittest.TestCase):
+    def test_round_trip(self):
+        surface = Surface((8, 3), SRCALPHA)
+        surface.fill((10, 20, 30, 255), (2, 0, 3, 2))
+        surface.set_at((7, 2), (1, 2, 3, 4))
+
+        encoded = encode_rle(pixels(surface))
+        self.assertEqual(bytes(decode_rle(encoded, 24)), pixels(surface))
+        self.assertLess(len(encoded), len(pixels(surface)))
+        return
+
+    def test_dirty_rect(self):
+        a = Surface((10, 10), SRCALPHA)
+        b = a.copy()
+        b.fill((255, 0, 0, 255), (3, 4, 2, 5))
+
+        self.assertEqual(dirty_rect(pixels(a), pixels(b), 10, 10), (3, 4, 2, 5))
+        self.assertEqual(dirty_rect(pixels(a), pixels(a), 10, 10), (0, 0, 0, 0))
+        return
+
+
+class PackTestCase(unittest.TestCase):
+    def setUp(self):
+        frames = []
+        for i in range(12):
+            surface = Surface((16, 16) if i < 10 else (8, 8), SRCALPHA)
+            surface.fill((200, 100, 50, 255), (2, 2, 6, 6))
+            surface.fill((0, 0, 255, 255), (i % 8, 9 % surface.height, 2, 2))
+            frames.append(Frame(surface=surface, duration=10 + i))
+
+        self.data = SpriteSheetData(
+            frames=tuple(frames),
+            repeat=3,
+            direction=Reverse,
+            tags={"a": Tag("a", 0, 4, PingPong, -1)},
+        )
+        self.file = io.BytesIO()
+        write_pack(self.file, self.data, keyframe_interval=4)
+        return
+
+    def test_round_trip(self):
+        reader = PackReader(self.file.getvalue())
+        kinds = [entry["kind"] for entry in reader.header["frames"]]
+        self.assertEqual(kinds[:5], [KEYFRAME, DELTA, DELTA, DELTA, KEYFRAME])
+        self.assertEqual(kinds[10], KEYFRAME)  # size changed
+
+        data = reader.read()
+        self.assertEqual(data.repeat, 3)
+        self.assertIs(data.direction, Reverse)
+        self.assertIs(data.tags["a"].direction, PingPong)
+        for original, decoded in zip(self.data.frames, data.frames):
+            self.assertEqual(pixels(original.surface), pixels(decoded.surface))
+            self.assertEqual(original.duration, decoded.duration)
+        return
+
+    def test_random_access(self):
+        reader = PackReader(self.file.getvalue())
+        for index in [7, 2, 3, 9, 0, 11, 6]:
+            self.assertEqual(
+                reader.decode(index), pixels(self.data.frames[index].surface)
+            )
+        return
+
+    def test_untrusted_direction(self):
+        # a file must not name a module to import or a callable to call
+        with self.assertRaises(ValueError):
+            direction_from_path("os:system")
+        with self.assertRaises(ValueError):
+            direction_from_path("pygame_animated_sprite.direction:Direction")
+
+        class Custom(Forward):
+            pass
+
+        data = SpriteSheetData(frames=self.data.frames, direction=Custom)
+        with self.assertRaises(ValueError):
+            write_pack(io.BytesIO(), data)
+        return
+
+    def test_loader(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "effect.sprpack"
+            path.write_bytes(self.file.getvalue())
+
+            sprite = pygame_animated_sprite.load(str(path))
+            self.assertEqual(len(sprite), 12)
+            self.assertIs(sprite.direction, Reverse)
+
+        sprite = pygame_animated_sprite.load(self.file.getvalue())
+        self.assertEqual(len(sprite), 12)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from pygame import Surface, SRCALPHA
+
+from pygame_animated_sprite import AnimatedSprite
+from pygame_animated_sprite.composite import LayeredSprite
+
+
+def make_sprite(colors, size=(4, 4)):
+    surfaces = []
+    for color in colors:
+        surface = Surface(size, SRCALPHA)
+        surface.fill(color)
+        surfaces.append(surface)
+    return AnimatedSprite.from_surfaces(surfaces, [100] * len(surfaces))
+
+
+class LayeredSpriteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.body = make_sprite([(255, 0, 0), (0, 255, 0)])
+        self.hat = make_sprite([(0, 0, 255)], size=(2, 2))
+
+        self.sprite = LayeredSprite()
+        self.sprite.set_layer("body", self.body)
+        self.sprite.set_layer("hat", self.hat, offset=(2, 4))
+        return
+
+    def test_render(self):
+        surface = self.sprite.render()
+
+        self.assertEqual(surface.get_size(), (4, 6))
+        self.assertEqual(surface.get_at((0, 0)), (255, 0, 0, 255))
+        self.assertEqual(surface.get_at((3, 5)), (0, 0, 255, 255))
+        self.assertEqual(surface.get_at((0, 5)).a, 0)
+        return
+
+    def test_cache(self):
+        first = self.sprite.render()
+        self.assertIs(self.sprite.render(), first)
+
+        self.sprite.update(0)
+        self.sprite.update(100)
+        self.sprite.update(0)
+        self.assertIsNot(self.sprite.render(), first)
+        self.assertEqual(self.sprite.cache_stats.misses, 2)
+        self.assertEqual(self.sprite.cache_stats.hits, 1)
+        return
+
+    def test_replace_layer(self):
+        first = self.sprite.render()
+        self.sprite.set_layer("hat", make_sprite([(255, 255, 0)], size=(2, 2)))
+
+        self.assertEqual([layer.name for layer in self.sprite.layers], ["body", "hat"])
+        self.assertIsNot(self.sprite.render(), first)
+        return
+
+    def test_budget(self):
+        sprite = LayeredSprite(budget=0)
+        sprite.set_layer("body", self.body)
+        sprite.render()
+        sprite.update(0)
+        sprite.update(100)
+        sprite.update(0)
+        sprite.render()
+
+        self.assertEqual(sprite.cache_stats.count, 1)
+        self.assertEqual(sprite.cache_stats.evictions, 1)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
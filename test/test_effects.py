@@ -0,0 +1,74 @@
+import unittest
+
+from pygame import Surface, SRCALPHA
+
+from pygame_animated_sprite import AnimatedSprite
+from pygame_animated_sprite.effects import EffectCache
+
+
+def make_sprite():
+    surfaces = []
+    for color in [(200, 100, 50), (50, 100, 200)]:
+        surface = Surface((4, 4), SRCALPHA)
+        surface.fill(color, (1, 1, 2, 2))
+        surfaces.append(surface)
+    return AnimatedSprite.from_surfaces(surfaces, [100, 100])
+
+
+class EffectCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = EffectCache()
+        self.sprite = make_sprite()
+        return
+
+    def test_builtin(self):
+        tinted = self.cache.render(self.sprite, "tint", (255, 0, 0))
+        self.assertEqual(tinted.get_at((1, 1)), (200, 0, 0, 255))
+        self.assertEqual(tinted.get_at((0, 0)).a, 0)
+
+        flashed = self.cache.render(self.sprite, "flash")
+        self.assertEqual(flashed.get_at((1, 1)), (255, 255, 255, 255))
+
+        shadow = self.cache.render(self.sprite, "silhouette", (0, 0, 0, 128))
+        self.assertEqual(shadow.get_at((2, 2)), (0, 0, 0, 128))
+
+        outlined = self.cache.render(self.sprite, "outline", (0, 255, 0), 1)
+        self.assertEqual(outlined.get_size(), (6, 6))
+        self.assertEqual(outlined.get_at((1, 1)), (0, 255, 0, 255))
+        self.assertEqual(outlined.get_at((2, 2)), (200, 100, 50, 255))
+        self.assertEqual(outlined.get_at((0, 0)).a, 0)
+        return
+
+    def test_cache(self):
+        first = self.cache.render(self.sprite, "tint", (255, 0, 0))
+        self.assertIs(self.cache.render(self.sprite, "tint", [255, 0, 0]), first)
+        self.assertIsNot(self.cache.render(self.sprite, "tint", (0, 255, 0)), first)
+
+        self.cache.precompute(self.sprite, "flash")
+        misses = self.cache.stats.misses
+        self.cache.get(self.sprite[1], "flash")
+        self.cache.get(self.sprite[1], "flash", (255, 255, 255))
+        self.assertEqual(self.cache.stats.misses, misses)
+        self.assertIs(
+            self.cache.render(self.sprite, "outline", (255, 255, 255)),
+            self.cache.render(self.sprite, "outline", (255, 255, 255), 1),
+        )
+
+        # a replaced surface does not hit the variants of the old one
+        self.sprite[0].surface = self.sprite[0].surface.copy()
+        self.assertIsNot(self.cache.render(self.sprite, "tint", (255, 0, 0)), first)
+        return
+
+    def test_custom(self):
+        self.cache.register(
+            "crop", lambda surface, size: surface.subsurface((0, 0, size, size))
+        )
+        self.assertEqual(self.cache.render(self.sprite, "crop", 2).get_size(), (2, 2))
+
+        with self.assertRaises(KeyError):
+            self.cache.render(self.sprite, "missing")
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import io
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+import pygame.image
+from pygame import Surface
+
+from pygame_animated_sprite import AnimatedSprite, Forward, PingPong
+from pygame_animated_sprite.structures import Tag
+from pygame_animated_sprite.export import (
+    export_apng,
+    export_png_sequence,
+    iter_runs,
+    iter_timeline,
+)
+
+
+def read_chunks(data):
+    chunks = []
+    position = 8
+    while position < len(data):
+        (length,) = struct.unpack(">I", data[position : position + 4])
+        kind = data[position + 4 : position + 8]
+        chunks.append((kind, data[position + 8 : position + 8 + length]))
+        position += 12 + length
+    return chunks
+
+
+class ExportTestCase(unittest.TestCase):
+    def setUp(self):
+        surfaces = []
+        for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255)]:
+            surface = Surface((2, 2))
+            surface.fill(color)
+            surfaces.append(surface)
+
+        self.sprite = AnimatedSprite.from_surfaces(
+            surfaces, [100, 50, 100], repeats=1, direction=PingPong
+        )
+        return
+
+    def test_timeline(self):
+        frames = self.sprite.frames
+        timeline = list(iter_timeline(self.sprite, fps=20))
+
+        # 0 (100ms), 1 (50ms), 2 (100ms), 1 (50ms) at 50ms per tick
+        self.assertEqual(
+            [frames.index(frame) for frame in timeline], [0, 0, 1, 2, 2, 1]
+        )
+        self.assertEqual(
+            [(frames.index(f), n) for f, n in iter_runs(self.sprite, fps=20)],
+            [(0, 2), (1, 1), (2, 2), (1, 1)],
+        )
+        return
+
+    def test_timeline_while_playing_tag(self):
+        # the whole sheet is exported, not the tag being played
+        expected = list(iter_timeline(self.sprite, fps=20))
+        self.sprite.tags = {"one": Tag("one", 1, 1, Forward, -1)}
+        self.sprite.play_tag("one")
+        self.assertEqual(list(iter_timeline(self.sprite, fps=20)), expected)
+        return
+
+    def test_infinite_requires_duration(self):
+        self.sprite.repeat = -1
+        with self.assertRaises(ValueError):
+            list(iter_timeline(self.sprite, fps=20))
+
+        self.assertEqual(
+            len(list(iter_timeline(self.sprite, fps=20, duration=1000))), 20
+        )
+        return
+
+    def test_png_sequence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            count = export_png_sequence(self.sprite, directory, fps=20, workers=2)
+            self.assertEqual(count, 6)
+
+            image = pygame.image.load((Path(directory) / "frame_00003.png").as_posix())
+            self.assertEqual(image.get_at((0, 0)), (0, 0, 255, 255))
+        return
+
+    def test_apng(self):
+        file = io.BytesIO()
+        count = export_apng(self.sprite, file, fps=20, workers=2, max_pending=1)
+        chunks = read_chunks(file.getvalue())
+        kinds = [kind for kind, _ in chunks]
+
+        self.assertEqual(count, 4)
+        self.assertEqual(kinds[:4], [b"IHDR", b"acTL", b"fcTL", b"IDAT"])
+        self.assertEqual(kinds.count(b"fcTL"), 4)
+        self.assertEqual(kinds.count(b"fdAT"), 3)
+        self.assertEqual(struct.unpack(">II", chunks[1][1]), (4, 0))
+
+        # delay of the first frame is 2 ticks of 1/20s
+        self.assertEqual(struct.unpack(">HH", chunks[2][1][20:24]), (2, 20))
+
+        file.seek(0)
+        image = pygame.image.load(file, "anim.png")
+        self.assertEqual(image.get_at((0, 0)), (255, 0, 0, 255))
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
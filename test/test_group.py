@@ -0,0 +1,49 @@
+import unittest
+
+from pygame import Surface
+
+from pygame_animated_sprite import AnimatedSprite
+from pygame_animated_sprite.group import AnimatedSpriteGroup
+
+
+def make_sprites(count):
+    surfaces = [Surface((1, 1)) for _ in range(5)]
+    return [
+        AnimatedSprite.from_surfaces(surfaces, [10 + i % 7] * len(surfaces))
+        for i in range(count)
+    ]
+
+
+class AnimatedSpriteGroupTestCase(unittest.TestCase):
+    def test_parallel_matches_serial(self):
+        serial = make_sprites(100)
+        parallel = make_sprites(100)
+
+        with AnimatedSpriteGroup(serial, parallel=False) as serial_group:
+            with AnimatedSpriteGroup(
+                parallel, workers=4, min_chunk_size=10, parallel=True
+            ) as parallel_group:
+                for _ in range(50):
+                    serial_group.update(16)
+                    parallel_group.update(16)
+
+        self.assertEqual(
+            [(s.index, s.get_time()) for s in serial],
+            [(s.index, s.get_time()) for s in parallel],
+        )
+        return
+
+    def test_membership(self):
+        sprites = make_sprites(3)
+        group = AnimatedSpriteGroup(sprites)
+        group.add(sprites[0])
+        self.assertEqual(len(group), 3)
+
+        group.remove(sprites[1])
+        self.assertNotIn(sprites[1], group)
+        self.assertEqual(list(group), [sprites[0], sprites[2]])
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
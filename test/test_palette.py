@@ -0,0 +1,83 @@
+import unittest
+
+from pygame import Surface, SRCALPHA
+
+from pygame_animated_sprite import AnimatedSprite
+from pygame_animated_sprite.palette import (
+    PaletteVariants,
+    is_indexed,
+    quantize_frames,
+)
+
+
+class QuantizeFramesTestCase(unittest.TestCase):
+    def setUp(self):
+        surfaces = []
+        for color in [(255, 0, 0), (0, 255, 0)]:
+            surface = Surface((4, 4), SRCALPHA)
+            surface.fill(color, (0, 0, 2, 4))
+            surfaces.append(surface)
+
+        self.sprite = AnimatedSprite.from_surfaces(surfaces, [100, 100])
+        return
+
+    def test_quantize(self):
+        frames = quantize_frames(self.sprite.frames)
+
+        self.assertTrue(all(is_indexed(frame.surface) for frame in frames))
+        self.assertEqual(
+            frames[0].surface.get_palette(), frames[1].surface.get_palette()
+        )
+        self.assertEqual(frames[0].surface.get_at((0, 0))[:3], (255, 0, 0))
+        self.assertEqual(frames[1].surface.get_at((0, 0))[:3], (0, 255, 0))
+        self.assertEqual(
+            frames[0].surface.get_at((3, 0)), frames[0].surface.get_colorkey()
+        )
+        self.assertEqual(frames[1].duration, 100)
+        return
+
+    def test_already_indexed(self):
+        frames = quantize_frames(self.sprite.frames)
+
+        self.assertIs(quantize_frames(frames)[0], frames[0])
+        return
+
+
+class PaletteVariantsTestCase(unittest.TestCase):
+    def setUp(self):
+        surface = Surface((4, 4), SRCALPHA)
+        surface.fill((255, 0, 0), (0, 0, 2, 4))
+        sprite = AnimatedSprite.from_surfaces([surface], [100])
+
+        self.variants = PaletteVariants.from_sprite(sprite)
+        self.variants.add("blue", recolor={(255, 0, 0): (0, 0, 255)})
+        return
+
+    def test_shared_pixels(self):
+        base = self.variants.get_frames()[0].surface
+        blue = self.variants.get_frames("blue")[0].surface
+
+        self.assertEqual(blue.get_at((0, 0))[:3], (0, 0, 255))
+        self.assertEqual(base.get_at((0, 0))[:3], (255, 0, 0))
+
+        base.set_at((1, 1), base.get_at((3, 3)))
+        self.assertEqual(blue.get_at((1, 1)), blue.get_at((3, 3)))
+        return
+
+    def test_converted(self):
+        converted = self.variants.get_converted_frames("blue")
+
+        self.assertEqual(converted[0].surface.get_bitsize(), 32)
+        self.assertEqual(converted[0].surface.get_at((0, 0)), (0, 0, 255, 255))
+        self.assertEqual(converted[0].surface.get_at((3, 0)).a, 0)
+        self.assertIs(self.variants.get_converted_frames("blue"), converted)
+        return
+
+    def test_unknown_variant(self):
+        with self.assertRaises(KeyError):
+            self.variants.get_frames("green")
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from pygame import Surface
+
+from pygame_animated_sprite import AnimatedSprite, Forward
+from pygame_animated_sprite.pool import SpritePool
+
+
+def make_sprite(repeats=1):
+    return AnimatedSprite.from_surfaces(
+        [Surface((1, 1)) for _ in range(3)], [100] * 3, repeats=repeats
+    )
+
+
+class SpritePoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.pool = SpritePool()
+        self.pool.register("spark", make_sprite(), size=2, prewarm=2)
+        self.pool.register("smoke", make_sprite(repeats=-1))
+        return
+
+    def test_reuse(self):
+        sprite = self.pool.acquire("spark")
+        sprite.update(100)
+        sprite.update(100)
+        self.pool.release(sprite)
+
+        again = self.pool.acquire("spark")
+        self.assertIs(again, sprite)
+        self.assertEqual(again.index, 0)
+        self.assertTrue(again.is_playing())
+
+        stats = self.pool.get_stats("spark")
+        self.assertEqual(stats.created, 2)
+        self.assertEqual(stats.reuse_rate, 1.0)
+
+        with self.assertRaises(KeyError):
+            self.pool.release(make_sprite())
+        return
+
+    def test_template_without_tags(self):
+        template = AnimatedSprite(
+            frames=make_sprite().frames, repeats=1, direction=Forward, tags=None
+        )
+        self.pool.register("dust", template, prewarm=1)
+        self.assertEqual(self.pool.acquire("dust").tags, {})
+        return
+
+    def test_auto_release(self):
+        spark = self.pool.acquire("spark")
+        smoke = self.pool.acquire("smoke")
+
+        for _ in range(5):
+            self.pool.update(100)
+
+        self.assertNotIn(spark, self.pool)
+        self.assertIn(smoke, self.pool)
+        self.assertEqual(list(self.pool), [smoke])
+        return
+
+    def test_stats(self):
+        sprites = [self.pool.acquire("spark") for _ in range(4)]
+        for sprite in sprites:
+            self.pool.release(sprite)
+
+        stats = self.pool.get_stats("spark")
+        self.assertEqual(stats.high_water, 4)
+        self.assertEqual(stats.reused, 2)
+        self.assertEqual(stats.dropped, 2)
+        self.assertEqual(stats.active, 0)
+
+        self.pool.acquire("smoke")
+        self.assertEqual(self.pool.get_stats().acquired, 5)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
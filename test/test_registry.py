@@ -0,0 +1,92 @@
+import unittest
+from importlib.metadata import EntryPoint
+from unittest import mock
+
+from pygame_animated_sprite.loader import registry
+from pygame_animated_sprite.loader import (
+    UnsupportedFileFormatError,
+    find_loader_class,
+    register_loader,
+    unregister_loader,
+)
+from pygame_animated_sprite.loader.aseprite import AsepriteSpriteSheetLoader
+from pygame_animated_sprite.loader.base import BaseSpriteSheetLoader
+from pygame_animated_sprite.loader.image import ImageSpriteSheetLoader
+
+
+class DummyLoader(BaseSpriteSheetLoader):
+    pass
+
+
+class PluginLoader(BaseSpriteSheetLoader):
+    pass
+
+
+def entry_points(target):
+    plugin = EntryPoint(".png", target, registry.ENTRY_POINT_GROUP)
+    return mock.patch("importlib.metadata.entry_points", return_value=[plugin])
+
+
+class RegistryTestCase(unittest.TestCase):
+    def test_extension(self):
+        self.assertIs(find_loader_class("sheet.PNG"), ImageSpriteSheetLoader)
+        self.assertIs(find_loader_class("sheet.json"), AsepriteSpriteSheetLoader)
+        return
+
+    def test_magic(self):
+        self.assertIs(
+            find_loader_class("sheet", header=b"\x89PNG\r\n\x1a\n\0\0"),
+            ImageSpriteSheetLoader,
+        )
+        self.assertIs(
+            find_loader_class("sheet.dat", header=b'\xef\xbb\xbf  {"frames"'),
+            AsepriteSpriteSheetLoader,
+        )
+        return
+
+    def test_unsupported(self):
+        with self.assertRaises(UnsupportedFileFormatError):
+            find_loader_class("sheet.xyz", header=b"????")
+        return
+
+    def test_register(self):
+        register_loader("dummy", f"{__name__}:DummyLoader", extensions=(".png",))
+        try:
+            self.assertIs(find_loader_class("sheet.png"), DummyLoader)
+        finally:
+            unregister_loader("dummy")
+
+        self.assertIs(find_loader_class("sheet.png"), ImageSpriteSheetLoader)
+        return
+
+    def test_register_before_entry_points(self):
+        with mock.patch.object(registry, "_entry_points_loaded", False):
+            with entry_points(f"{__name__}:PluginLoader"):
+                register_loader(
+                    "dummy", f"{__name__}:DummyLoader", extensions=(".png",)
+                )
+                try:
+                    self.assertIs(find_loader_class("sheet.png"), DummyLoader)
+                finally:
+                    unregister_loader("dummy")
+
+                self.assertIs(find_loader_class("sheet.png"), PluginLoader)
+                unregister_loader(".png")
+        return
+
+    def test_magic_does_not_import(self):
+        with mock.patch.object(registry, "_entry_points_loaded", False):
+            # the plugin module does not exist, importing it would fail
+            with entry_points("missing_plugin_module:Loader"):
+                try:
+                    self.assertIs(
+                        find_loader_class("sheet", header=b"\x89PNG\r\n\x1a\n"),
+                        ImageSpriteSheetLoader,
+                    )
+                finally:
+                    unregister_loader(".png")
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
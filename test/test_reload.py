@@ -0,0 +1,210 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import pygame.image
+from pygame import Surface
+
+from pygame_animated_sprite.loader.simple import SimpleSpriteSheetLoader
+from pygame_animated_sprite.reload import HotReloader
+
+
+def touch(path):
+    # file systems with a coarse mtime would miss quick edits
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    return
+
+
+class HotReloaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "sheet.png"
+        self.sheet = Surface((12, 4))
+        for i in range(3):
+            self.sheet.fill((i * 50, 0, 0), (i * 4, 0, 4, 4))
+        self.save()
+
+        self.reloader = HotReloader()
+        self.sprite = self.reloader.load(
+            self.path, lambda: SimpleSpriteSheetLoader(columns=1, rows=3, size=(4, 4))
+        )
+        return
+
+    def tearDown(self):
+        self.directory.cleanup()
+        return
+
+    def save(self):
+        pygame.image.save(self.sheet, self.path.as_posix())
+        touch(self.path)
+        return
+
+    def test_unchanged(self):
+        self.assertEqual(self.reloader.poll(), [])
+        return
+
+    def test_patch_in_place(self):
+        self.sprite.update(0)
+        self.sprite.update(100)
+        self.sprite.update(0)
+        index = self.sprite.index
+        untouched = self.sprite[0].surface
+
+        changes = []
+        self.reloader.on_reload = lambda path, changed: changes.append(changed)
+
+        self.sheet.fill((0, 0, 255), (8, 0, 4, 4))
+        self.save()
+
+        self.assertEqual(self.reloader.poll(), [self.path.resolve()])
+        self.assertEqual(changes, [[2]])
+        self.assertEqual(self.sprite[2].surface.get_at((0, 0)), (0, 0, 255, 255))
+        self.assertIs(self.sprite[0].surface, untouched)
+        self.assertEqual(self.sprite.index, index)
+        return
+
+
+class AsepriteHotReloaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "sheet.json"
+        self.image_path = self.path.with_suffix(".png")
+
+        self.sheet = Surface((12, 4))
+        for i in range(3):
+            self.sheet.fill((i * 50, 0, 0), (i * 4, 0, 4, 4))
+        self.data = {
+            "frames": [
+                {
+                    "frame": {"x": i * 4, "y": 0, "w": 4, "h": 4},
+                    "rotated": False,
+                    "trimmed": False,
+                    "spriteSourceSize": {"x": 0, "y": 0, "w": 4, "h": 4},
+                    "sourceSize": {"w": 4, "h": 4},
+                    "duration": 100,
+                }
+                for i in range(3)
+            ],
+            "meta": {
+                "app": "https://www.aseprite.org/",
+                "version": "1.3",
+                "image": self.image_path.name,
+                "format": "RGBA8888",
+                "size": {"w": 12, "h": 4},
+                "scale": "1",
+                "frameTags": [
+                    {"name": "walk", "from": 0, "to": 1, "direction": "forward"}
+                ],
+            },
+        }
+        self.save_image()
+        self.save_json()
+
+        self.reloader = HotReloader()
+        self.sprite = self.reloader.load(self.path)
+        self.changes = []
+        self.reloader.on_reload = lambda path, changed: self.changes.append(changed)
+        return
+
+    def tearDown(self):
+        self.directory.cleanup()
+        return
+
+    def save_image(self):
+        pygame.image.save(self.sheet, self.image_path.as_posix())
+        touch(self.image_path)
+        return
+
+    def save_json(self, text=None):
+        self.path.write_text(json.dumps(self.data) if text is None else text)
+        touch(self.path)
+        return
+
+    def test_half_written(self):
+        errors = []
+        self.reloader.on_error = lambda path, error: errors.append(path)
+
+        text = json.dumps(self.data)
+        self.save_json(text[: len(text) // 2])
+        self.assertEqual(self.reloader.poll(), [])
+        self.assertEqual(self.reloader.poll(), [])
+        # reported once until the file changes again
+        self.assertEqual(errors, [self.path.resolve()])
+
+        self.data["frames"][1]["duration"] = 50
+        self.save_json()
+        self.assertEqual(self.reloader.poll(), [self.path.resolve()])
+        self.assertEqual(self.changes, [[1]])
+        self.assertEqual(self.sprite[1].duration, 50)
+        return
+
+    def test_missing_image(self):
+        self.data["meta"]["image"] = "missing.png"
+        self.save_json()
+        with self.assertWarns(RuntimeWarning):
+            self.assertEqual(self.reloader.poll(), [])
+        return
+
+    def test_json_edit(self):
+        surfaces = [frame.surface for frame in self.sprite.frames]
+        self.data["frames"][1]["duration"] = 50
+        self.data["frames"][2]["frame"]["x"] = 0
+
+        # the image did not change, it is not decoded again
+        with mock.patch("pygame.image.load", side_effect=AssertionError):
+            self.assertEqual(self.reloader.poll(), [])
+            self.save_json()
+            self.assertEqual(self.reloader.poll(), [self.path.resolve()])
+
+        self.assertEqual(self.changes, [[1, 2]])
+        self.assertEqual(self.sprite[1].duration, 50)
+        self.assertIs(self.sprite[1].surface, surfaces[1])
+        self.assertEqual(self.sprite[2].surface.get_at((0, 0)), (0, 0, 0, 255))
+        self.assertIs(self.sprite[0].surface, surfaces[0])
+        return
+
+    def test_image_edit(self):
+        surfaces = [frame.surface for frame in self.sprite.frames]
+        self.sheet.set_at((5, 1), (0, 255, 0))
+        self.save_image()
+
+        self.assertEqual(self.reloader.poll(), [self.path.resolve()])
+        self.assertEqual(self.changes, [[1]])
+        self.assertEqual(self.sprite[1].surface.get_at((1, 1)), (0, 255, 0, 255))
+        self.assertIs(self.sprite[0].surface, surfaces[0])
+        self.assertIs(self.sprite[2].surface, surfaces[2])
+        return
+
+    def test_playing_tag(self):
+        self.sprite.play_tag("walk")
+        self.sprite.update(100)
+        self.assertEqual(self.sprite.index, 1)
+
+        self.data["frames"][2]["duration"] = 50
+        self.save_json()
+        self.reloader.poll()
+        self.assertEqual((self.sprite.tag, self.sprite.index), ("walk", 1))
+        self.assertEqual(self.sprite.get_time(), 0)
+
+        self.data["meta"]["frameTags"] = []
+        self.save_json()
+        self.reloader.poll()
+        self.assertEqual((self.sprite.tag, self.sprite.index), (None, 0))
+        return
+
+    def test_frame_added(self):
+        self.data["frames"].append(dict(self.data["frames"][0]))
+        self.save_json()
+
+        self.assertEqual(self.reloader.poll(), [self.path.resolve()])
+        self.assertEqual(self.changes, [[3]])
+        self.assertEqual(len(self.sprite), 4)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pygame import Surface, SRCALPHA
+from pygame._sdl2.video import Window, Renderer
+
+from pygame_animated_sprite import AnimatedSprite
+from pygame_animated_sprite.renderer import TextureAtlas
+
+
+class TextureAtlasTestCase(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.window = Window("test", (64, 64))
+        self.renderer = Renderer(self.window, accelerated=0)
+
+        surfaces = []
+        for color in [(255, 0, 0), (0, 255, 0), (0, 0, 255)]:
+            surface = Surface((8, 8), SRCALPHA)
+            surface.fill(color)
+            surfaces.append(surface)
+
+        self.sprite = AnimatedSprite.from_surfaces(surfaces, [100, 100, 100])
+        return
+
+    def tearDown(self):
+        self.window.destroy()
+        return
+
+    def test_pack(self):
+        atlas = TextureAtlas.from_sprite(self.renderer, self.sprite)
+
+        rects = [atlas.get_rect(frame) for frame in self.sprite.frames]
+        for i, rect in enumerate(rects):
+            self.assertEqual(rect.size, (8, 8))
+            self.assertEqual(rect.collidelist(rects[i + 1 :]), -1)
+        return
+
+    def test_unknown_frame(self):
+        atlas = TextureAtlas(self.renderer, self.sprite.frames[:1])
+
+        self.assertNotIn(self.sprite.frames[1], atlas)
+        with self.assertRaises(KeyError):
+            atlas.get_rect(self.sprite.frames[1])
+        return
+
+    def draw_marked(self, atlas, frame, **kwargs):
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        atlas.draw_frame(frame, (0, 0), **kwargs)
+        target = self.renderer.to_surface()
+
+        return [
+            (x, y)
+            for x in range(16)
+            for y in range(16)
+            if target.get_at((x, y)) == (255, 0, 0, 255)
+        ]
+
+    def test_draw(self):
+        # a single red pixel next to the top left corner
+        surface = Surface((8, 8), SRCALPHA)
+        surface.set_at((1, 0), (255, 0, 0))
+        sprite = AnimatedSprite.from_surfaces([surface], [100])
+        frame = sprite.frames[0]
+        atlas = TextureAtlas.from_sprite(self.renderer, sprite)
+
+        self.assertEqual(self.draw_marked(atlas, frame), [(1, 0)])
+        self.assertEqual(self.draw_marked(atlas, frame, flip_x=True), [(6, 0)])
+        self.assertEqual(self.draw_marked(atlas, frame, flip_y=True), [(1, 7)])
+        self.assertEqual(self.draw_marked(atlas, frame, angle=90), [(7, 1)])
+        self.assertEqual(
+            self.draw_marked(atlas, frame, scale=2, flip_x=True),
+            [(12, 0), (12, 1), (13, 0), (13, 1)],
+        )
+        return
+
+    def test_pages(self):
+        atlas = TextureAtlas.from_sprite(self.renderer, self.sprite, max_size=16)
+
+        self.assertEqual(len(atlas.textures), 3)
+        self.assertEqual(atlas.sizes, ((16, 8),) * 3)
+        pages = [atlas.get_page(frame) for frame in self.sprite.frames]
+        self.assertEqual(sorted(pages), [0, 1, 2])
+
+        # a frame from a later page is drawn from its own texture
+        frame = self.sprite.frames[pages.index(2)]
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        atlas.draw_frame(frame, (0, 0))
+        target = self.renderer.to_surface()
+        self.assertEqual(target.get_at((7, 7)), frame.surface.get_at((7, 7)))
+        return
+
+    def test_too_large(self):
+        surface = Surface((32, 32), SRCALPHA)
+        sprite = AnimatedSprite.from_surfaces([surface], [100])
+
+        with self.assertRaises(ValueError):
+            TextureAtlas.from_sprite(self.renderer, sprite, max_size=16)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
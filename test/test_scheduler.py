@@ -0,0 +1,73 @@
+import unittest
+
+from pygame import Surface
+
+from pygame_animated_sprite import AnimatedSprite
+from pygame_animated_sprite.scheduler import UpdateScheduler
+
+
+def make_sprite():
+    return AnimatedSprite.from_surfaces(
+        [Surface((1, 1)) for _ in range(5)], [30, 50, 20, 70, 40]
+    )
+
+
+class UpdateSchedulerTestCase(unittest.TestCase):
+    def test_catch_up(self):
+        scheduler = UpdateScheduler()
+        reference = make_sprite()
+        sprites = [make_sprite() for _ in range(4)]
+        for tier, sprite in enumerate(sprites):
+            scheduler.add(sprite, tier)
+
+        for tick in range(37):
+            reference.update(16)
+            scheduler.update(16)
+        scheduler.flush()
+
+        for sprite in sprites:
+            self.assertEqual(sprite.index, reference.index)
+            self.assertEqual(sprite.get_time(), reference.get_time())
+        return
+
+    def test_stagger(self):
+        scheduler = UpdateScheduler()
+        for _ in range(8):
+            scheduler.add(make_sprite(), 2)
+
+        counts = []
+        for _ in range(8):
+            scheduler.update(16)
+            counts.append(scheduler.last_update_count)
+        self.assertEqual(counts, [2] * 8)
+        self.assertEqual(scheduler.get_tier_counts(), [0, 0, 8, 0])
+        return
+
+    def test_priority(self):
+        scheduler = UpdateScheduler(thresholds=[100, 200, 400])
+        self.assertEqual(
+            [scheduler.get_tier(d) for d in (0, 100, 399, 1000)], [0, 1, 2, 3]
+        )
+
+        reference = make_sprite()
+        sprite = make_sprite()
+        scheduler.add(sprite, 1000)
+        for tick in range(23):
+            if tick in (5, 11):
+                scheduler.set_priority(sprite, 150 if tick == 5 else 0)
+            reference.update(16)
+            scheduler.update(16)
+        scheduler.flush()
+
+        self.assertEqual(sprite.get_time(), reference.get_time())
+        self.assertEqual(sprite.index, reference.index)
+
+        scheduler.remove(sprite)
+        self.assertNotIn(sprite, scheduler)
+        with self.assertRaises(KeyError):
+            scheduler.set_priority(sprite, 0)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
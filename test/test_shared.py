@@ -0,0 +1,120 @@
+import gc
+import json
+import multiprocessing
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from pygame import Surface, SRCALPHA
+
+from pygame_animated_sprite import AnimatedSprite
+from pygame_animated_sprite.direction import Forward, PingPong
+from pygame_animated_sprite.loader.base import SpriteSheetData
+from pygame_animated_sprite.shared import attach, publish
+from pygame_animated_sprite.structures import Frame, Tag
+
+
+def read_shared(manifest):
+    with attach(manifest) as attached:
+        frames = attached.data.frames
+        result = [f.duration for f in frames], tuple(frames[1].surface.get_at((2, 1)))
+        del frames
+    return result
+
+
+class SharedSpriteSheetTestCase(unittest.TestCase):
+    def setUp(self):
+        frames = []
+        for i, color in enumerate([(255, 0, 0, 255), (0, 255, 0, 128)]):
+            surface = Surface((3, 2), SRCALPHA)
+            surface.fill(color)
+            frames.append(Frame(surface=surface, duration=100 + i))
+
+        self.data = SpriteSheetData(
+            frames=tuple(frames),
+            repeat=-1,
+            direction=Forward,
+            tags={"idle": Tag("idle", 0, 1, PingPong, 2)},
+        )
+        return
+
+    def test_publish_attach(self):
+        with publish(self.data) as published:
+            manifest = json.loads(json.dumps(published.manifest))
+
+            attached = attach(manifest)
+            data = attached.data
+
+            self.assertEqual([f.duration for f in data.frames], [100, 101])
+            self.assertEqual(data.frames[1].surface.get_at((2, 1)), (0, 255, 0, 128))
+            self.assertIs(data.direction, Forward)
+            self.assertIs(data.tags["idle"].direction, PingPong)
+
+            # surfaces view the shared block
+            published.data.frames[0].surface.set_at((0, 0), (1, 2, 3, 4))
+            self.assertEqual(data.frames[0].surface.get_at((0, 0)), (1, 2, 3, 4))
+
+            sprite = AnimatedSprite(
+                frames=data.frames,
+                repeats=data.repeat,
+                direction=data.direction,
+                tags=data.tags,
+            )
+            self.assertEqual(len(sprite), 2)
+
+            del sprite, data
+            attached.close()
+        return
+
+    def test_other_process(self):
+        context = multiprocessing.get_context("spawn")
+        with publish(self.data) as published:
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                durations, color = executor.submit(
+                    read_shared, published.manifest
+                ).result(timeout=60)
+
+        self.assertEqual(durations, [100, 101])
+        self.assertEqual(color, (0, 255, 0, 128))
+        return
+
+    def test_collected_without_close(self):
+        unraisable = []
+        with mock.patch.object(sys, "unraisablehook", unraisable.append):
+            published = publish(self.data)
+            attached = attach(published.manifest)
+            self.assertEqual(len(attached.data.frames), 2)
+
+            del attached, published
+            gc.collect()
+
+        self.assertEqual(unraisable, [])
+        return
+
+    def test_frames_outlive_sheet(self):
+        def publish_frames():
+            published = publish(self.data)
+            return published.manifest, published.data.frames
+
+        unraisable = []
+        with mock.patch.object(sys, "unraisablehook", unraisable.append):
+            manifest, frames = publish_frames()
+            gc.collect()
+            self.assertEqual(frames[1].surface.get_at((2, 1)), (0, 255, 0, 128))
+
+            # the block is still published while its frames are alive
+            attached = attach(manifest)
+            self.assertEqual(len(attached.data.frames), 2)
+
+            del frames, attached
+            gc.collect()
+
+        self.assertEqual(unraisable, [])
+        with self.assertRaises(FileNotFoundError):
+            attach(manifest)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import io
+import unittest
+
+import pygame.image
+from pygame import Surface, SRCALPHA
+
+from pygame_animated_sprite.loader.simple import (
+    SimpleSpriteSheetLoader,
+    detect_grid,
+)
+
+
+def make_sheet(flags: int = SRCALPHA) -> Surface:
+    # 3 frames per line, 2 lines, 8x6 frames 2px apart starting at (1, 3)
+    sheet = Surface((1 + 3 * 8 + 2 * 2 + 1, 3 + 2 * 6 + 2), flags)
+    sheet.fill((0, 0, 0, 0) if flags & SRCALPHA else (255, 0, 255))
+    for line in range(2):
+        for i in range(3):
+            x, y = 1 + i * 10, 3 + line * 8
+            sheet.fill((line * 100 + i, 0, 0), (x, y, 8, 6))
+            # a hole in the frame must not split it
+            sheet.set_at((x + 4, y + 3), sheet.get_at((0, 0)))
+    return sheet
+
+
+class SimpleLoaderTestCase(unittest.TestCase):
+    def test_grid(self):
+        data = SimpleSpriteSheetLoader(
+            columns=2, rows=3, size=(8, 6), position=(1, 3), padding=(2, 2)
+        ).load(io.BytesIO(self.encode(make_sheet())), name="sheet.png")
+
+        self.assertEqual(len(data.frames), 6)
+        for i, frame in enumerate(data.frames):
+            self.assertEqual(frame.surface.get_size(), (8, 6))
+            self.assertEqual(frame.surface.get_at((0, 0))[0], i // 3 * 100 + i % 3)
+        return
+
+    def test_detect_grid(self):
+        self.assertEqual(detect_grid(make_sheet()), (2, 3, (8, 6), (1, 3), (2, 2)))
+        self.assertEqual(detect_grid(make_sheet(0)), (2, 3, (8, 6), (1, 3), (2, 2)))
+        self.assertEqual(detect_grid(make_sheet(), min_gap=3)[:3], (1, 1, (28, 14)))
+
+        with self.assertRaises(ValueError):
+            detect_grid(Surface((4, 4), SRCALPHA))
+        return
+
+    def test_detect_drawn_grid(self):
+        # opaque frames on an opaque background, with a title above them
+        sheet = make_sheet()
+        background = Surface(sheet.get_size(), SRCALPHA)
+        background.fill((255, 0, 255))
+        background.blit(sheet, (0, 0))
+        background.fill((1, 1, 1), (1, 0, 5, 1))
+        self.assertEqual(detect_grid(background), (2, 3, (8, 6), (1, 3), (2, 2)))
+        return
+
+    def test_auto(self):
+        data = SimpleSpriteSheetLoader().load(
+            io.BytesIO(self.encode(make_sheet())), name="sheet.png"
+        )
+        self.assertEqual(
+            [frame.surface.get_at((0, 0))[0] for frame in data.frames],
+            [0, 1, 2, 100, 101, 102],
+        )
+
+        with self.assertRaises(ValueError):
+            SimpleSpriteSheetLoader(columns=2)
+        return
+
+    @staticmethod
+    def encode(surface: Surface) -> bytes:
+        file = io.BytesIO()
+        pygame.image.save(surface, file, "sheet.png")
+        return file.getvalue()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import io
+import unittest
+import zipfile
+from pathlib import Path
+
+import pygame_animated_sprite
+from pygame_animated_sprite.loader import MemorySource, ZipSource
+from pygame_animated_sprite.loader.aseprite import AsepriteSpriteSheetLoader
+
+EXAMPLE = Path(__file__).parent.parent / "example" / "aseprite"
+
+
+class SourceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.json = (EXAMPLE / "mario-sheet.json").read_bytes()
+        self.png = (EXAMPLE / "mario-sheet.png").read_bytes()
+        return
+
+    def test_zip(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as file:
+            file.writestr("sprites/mario-sheet.json", self.json)
+            file.writestr("sprites/mario-sheet.png", self.png)
+        archive.seek(0)
+
+        with ZipSource(archive) as source:
+            self.assertTrue(source.exists("sprites/mario-sheet.png"))
+            sprite = pygame_animated_sprite.load(
+                "sprites/mario-sheet.json", source=source
+            )
+        self.assertEqual(len(sprite), 6)
+        return
+
+    def test_bytes(self):
+        sprite = pygame_animated_sprite.load(self.png)
+        self.assertEqual(len(sprite), 1)
+
+        data = AsepriteSpriteSheetLoader().load(
+            self.json,
+            source=MemorySource({"mario-sheet.png": self.png}),
+            name="mario-sheet.json",
+        )
+        self.assertEqual(len(data.frames), 6)
+        return
+
+    def test_file_object(self):
+        sprite = pygame_animated_sprite.load(
+            io.BytesIO(self.json), source=MemorySource({"mario-sheet.png": self.png})
+        )
+        self.assertEqual(len(sprite), 6)
+        return
+
+    def test_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            MemorySource({}).open("missing.png")
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
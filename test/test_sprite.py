@@ -0,0 +1,242 @@
+import json
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from pygame import Rect, Surface
+
+from pygame_animated_sprite import AnimatedSprite, Forward, PingPong
+from pygame_animated_sprite.structures import Tag
+from pygame_animated_sprite.loader import MemorySource
+from pygame_animated_sprite.loader.simple import SimpleSpriteSheetLoader
+
+EXAMPLE = Path(__file__).parent.parent / "example" / "aseprite"
+SIMPLE_EXAMPLE = Path(__file__).parent.parent / "example" / "simple"
+
+
+def make_sprite(count=4, duration=100, repeats=-1, direction=None):
+    return AnimatedSprite.from_surfaces(
+        [Surface((1, 1)) for _ in range(count)],
+        [duration] * count,
+        repeats=repeats,
+        direction=direction,
+    )
+
+
+def advance(sprite, steps, time_delta=30):
+    for _ in range(steps):
+        sprite.update(time_delta)
+    return [sprite.index, sprite.get_time(), sprite.is_playing()]
+
+
+def make_tagged_sprite():
+    sprite = make_sprite(count=6)
+    sprite.tags = {
+        "run": Tag(name="run", start=0, end=1, direction=Forward, repeat=-1),
+        "jump": Tag(name="jump", start=2, end=4, direction=PingPong, repeat=1),
+    }
+    return sprite
+
+
+class LoadTestCase(unittest.TestCase):
+    def test_without_tags(self):
+        loader = SimpleSpriteSheetLoader(
+            columns=1, rows=3, size=(32, 32), position=(1, 13), padding=(1, 0)
+        )
+        sprite = AnimatedSprite.load(SIMPLE_EXAMPLE / "parappa_sheet.png", loader)
+
+        self.assertEqual(len(sprite), 3)
+        self.assertEqual(sprite.tags, {})
+        self.assertEqual(advance(sprite, 1, 100)[0], 1)
+
+        sprite.tags = None
+        self.assertEqual(sprite.tags, {})
+        return
+
+
+class StateTestCase(unittest.TestCase):
+    def test_restore(self):
+        sprite = make_sprite(direction=PingPong, repeats=3)
+        advance(sprite, 17)
+        state = sprite.get_state()
+
+        expected = advance(sprite, 25)
+        sprite.set_state(state)
+        self.assertEqual(advance(sprite, 25), expected)
+
+        sprite.set_state(state.tobytes())
+        self.assertEqual(advance(sprite, 25), expected)
+        return
+
+    def test_paused(self):
+        sprite = make_sprite()
+        sprite.pause()
+        state = sprite.get_state()
+        sprite.play()
+
+        sprite.set_state(state)
+        self.assertFalse(sprite.is_playing())
+        return
+
+    def test_bulk(self):
+        sprites = [make_sprite(count=i + 1, direction=PingPong) for i in range(5)]
+        for i, sprite in enumerate(sprites):
+            advance(sprite, i * 7)
+
+        states = AnimatedSprite.get_states(sprites)
+        self.assertEqual(len(states), len(sprites) * AnimatedSprite.STATE_SIZE)
+
+        expected = [advance(sprite, 11) for sprite in sprites]
+        AnimatedSprite.set_states(sprites, states.tobytes())
+        self.assertEqual([advance(sprite, 11) for sprite in sprites], expected)
+
+        with self.assertRaises(ValueError):
+            AnimatedSprite.set_states(sprites[:2], states)
+        return
+
+    def test_tag(self):
+        sprite = make_tagged_sprite()
+        sprite.play_tag("jump")
+        advance(sprite, 5)
+        state = sprite.get_state()
+
+        expected = advance(sprite, 5)
+        sprite.play_tag(None)
+        sprite.set_state(state)
+        self.assertEqual(sprite.tag, "jump")
+        self.assertEqual(advance(sprite, 5), expected)
+        return
+
+
+class PlayTagTestCase(unittest.TestCase):
+    def test_play_tag(self):
+        sprite = make_tagged_sprite()
+
+        sprite.play_tag("jump")
+        self.assertEqual(sprite.tag, "jump")
+        indices = [sprite.index]
+        while sprite.is_playing():
+            sprite.update(100)
+            indices.append(sprite.index)
+        self.assertEqual(indices, [2, 3, 4, 3, 3])
+        self.assertTrue(sprite.is_finished())
+
+        sprite.play_tag("run")
+        self.assertFalse(sprite.is_finished())
+        self.assertEqual(
+            [sprite.index] + [advance(sprite, 1, 100)[0] for _ in range(3)],
+            [0, 1, 0, 1],
+        )
+
+        # playing the same tag keeps its progress unless restarted
+        sprite.play_tag("run")
+        self.assertEqual(sprite.index, 1)
+        sprite.play_tag("run", restart=True)
+        self.assertEqual(sprite.index, 0)
+
+        sprite.play_tag(None)
+        self.assertIsNone(sprite.tag)
+        self.assertEqual(advance(sprite, 5, 100)[0], 5)
+
+        with self.assertRaises(KeyError):
+            sprite.play_tag("missing")
+        return
+
+    def test_sheet_properties(self):
+        sprite = make_tagged_sprite()
+        sprite.play_tag("jump")
+
+        # repeat and direction describe the whole animation, like frames
+        self.assertEqual((sprite.repeat, sprite.direction), (-1, Forward))
+        self.assertEqual(sprite.get_current_repeat(), 1)
+        self.assertIs(sprite.get_current_direction(), PingPong)
+
+        # changing them does not affect the tag being played
+        advance(sprite, 1, 100)
+        sprite.direction = PingPong
+        sprite.repeat = 2
+        self.assertEqual((sprite.tag, sprite.index), ("jump", 3))
+        self.assertIs(sprite.get_current_direction(), PingPong)
+
+        sprite.play_tag(None)
+        self.assertEqual(sprite.get_current_repeat(), 2)
+        self.assertEqual(
+            [sprite.index] + [advance(sprite, 1, 100)[0] for _ in range(7)],
+            [0, 1, 2, 3, 4, 5, 4, 3],
+        )
+
+        # the cached direction of the tag is untouched
+        sprite.play_tag("jump")
+        self.assertEqual(sprite.get_current_repeat(), 1)
+        return
+
+    def test_replace_tags(self):
+        sprite = make_tagged_sprite()
+        sprite.play_tag("jump")
+        advance(sprite, 1, 100)
+        self.assertEqual(sprite.index, 3)
+
+        # an equal tag keeps playing where it was
+        tags = {name: replace(tag) for name, tag in sprite.tags.items()}
+        sprite.tags = tags
+        self.assertEqual((sprite.tag, sprite.index), ("jump", 3))
+        self.assertEqual(advance(sprite, 1, 100)[0], 4)
+
+        # a new repeat applies from the current pass
+        sprite.tags = {**tags, "jump": replace(tags["jump"], repeat=2)}
+        self.assertEqual((sprite.tag, sprite.index), ("jump", 4))
+        self.assertEqual(
+            [advance(sprite, 1, 100)[0] for _ in range(5)], [3, 2, 3, 4, 3]
+        )
+
+        # new frames restart the tag
+        sprite.tags = {**tags, "jump": replace(tags["jump"], start=1)}
+        self.assertEqual((sprite.tag, sprite.index), ("jump", 1))
+
+        sprite.tags = {"run": tags["run"]}
+        self.assertEqual((sprite.tag, sprite.index), (None, 0))
+        return
+
+
+class CollisionTestCase(unittest.TestCase):
+    def setUp(self):
+        data = json.loads((EXAMPLE / "mario-sheet.json").read_text())
+        data["meta"]["slices"] = [
+            {
+                "name": "hurt",
+                "color": "#0000ffff",
+                "keys": [
+                    {"frame": 0, "bounds": {"x": 1, "y": 2, "w": 3, "h": 4}},
+                    {"frame": 2, "bounds": {"x": 0, "y": 0, "w": 5, "h": 5}},
+                ],
+            }
+        ]
+        self.sprite = AnimatedSprite.load(
+            json.dumps(data).encode(),
+            source=MemorySource(
+                {"mario-sheet.png": (EXAMPLE / "mario-sheet.png").read_bytes()}
+            ),
+            name="mario-sheet.json",
+        )
+        return
+
+    def test_hitboxes(self):
+        self.assertEqual(self.sprite.get_current_hitboxes(), {"hurt": Rect(1, 2, 3, 4)})
+        self.assertEqual(self.sprite[1].hitboxes["hurt"], Rect(1, 2, 3, 4))
+        self.assertEqual(self.sprite[5].hitboxes["hurt"], Rect(0, 0, 5, 5))
+        return
+
+    def test_mask(self):
+        self.sprite.build_masks()
+        frame = self.sprite.get_current_frame()
+
+        self.assertIs(self.sprite.get_current_mask(), frame.get_mask())
+        self.assertEqual(
+            self.sprite.get_current_bounds(), frame.surface.get_bounding_rect()
+        )
+        self.assertGreater(self.sprite.get_current_mask().count(), 0)
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
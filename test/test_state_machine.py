@@ -0,0 +1,82 @@
+import unittest
+
+from pygame import Surface
+
+from pygame_animated_sprite import AnimatedSprite, Forward
+from pygame_animated_sprite.structures import Tag
+from pygame_animated_sprite.state_machine import (
+    AnimationState,
+    AnimationStateMachine,
+)
+
+
+def make_machine():
+    sprite = AnimatedSprite.from_surfaces(
+        [Surface((1, 1)) for _ in range(6)], [100] * 6
+    )
+    sprite.tags = {
+        "idle": Tag(name="idle", start=0, end=1, direction=Forward, repeat=-1),
+        "attack": Tag(name="attack", start=2, end=3, direction=Forward, repeat=1),
+        "jump": Tag(name="jump", start=4, end=5, direction=Forward, repeat=1),
+    }
+    return AnimationStateMachine(
+        sprite,
+        [
+            AnimationState("idle", transitions={"attack": "attack"}),
+            AnimationState("attack", on_finish="idle", interruptible=False),
+            AnimationState("jump", on_finish="idle"),
+        ],
+        initial="idle",
+        transitions={"jump": "jump"},
+    )
+
+
+def run(machine, steps, time_delta=100):
+    for _ in range(steps):
+        machine.update(time_delta)
+    return machine.state
+
+
+class StateMachineTestCase(unittest.TestCase):
+    def test_on_finish(self):
+        machine = make_machine()
+
+        self.assertTrue(machine.send("attack"))
+        self.assertEqual(machine.state, "attack")
+        self.assertEqual(machine.sprite.index, 2)
+        self.assertEqual(run(machine, 1), "attack")
+        self.assertEqual(run(machine, 1), "idle")
+        return
+
+    def test_interruptible(self):
+        machine = make_machine()
+
+        self.assertFalse(machine.send("unknown"))
+
+        machine.send("attack")
+        self.assertTrue(machine.send("jump"))
+        self.assertEqual(machine.state, "attack")
+        self.assertEqual(machine.pending, "jump")
+
+        self.assertEqual(run(machine, 2), "jump")
+        self.assertIsNone(machine.pending)
+
+        # jump is interruptible and only has the shared transition
+        self.assertFalse(machine.send("attack"))
+        self.assertTrue(machine.send("jump"))
+        self.assertEqual(machine.sprite.index, 4)
+        return
+
+    def test_invalid(self):
+        sprite = make_machine().sprite
+        with self.assertRaises(KeyError):
+            AnimationStateMachine(sprite, [AnimationState("fall")], initial="fall")
+        with self.assertRaises(KeyError):
+            AnimationStateMachine(
+                sprite, [AnimationState("idle", on_finish="fall")], initial="idle"
+            )
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import pygame.image
+from pygame import Surface, SRCALPHA
+
+from pygame_animated_sprite.codec import write_pack
+from pygame_animated_sprite.loader.base import SpriteSheetData
+from pygame_animated_sprite.structures import Frame
+from pygame_animated_sprite.stream import (
+    ImageSequenceSource,
+    PackSource,
+    StreamingSprite,
+)
+
+
+class SlowSource(ImageSequenceSource):
+    def load_frame(self, index):
+        time.sleep(0.02)
+        return super().load_frame(index)
+
+
+class StreamingSpriteTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i in range(10):
+            surface = Surface((2, 2))
+            surface.fill((i, 0, 0))
+            path = Path(self.directory.name) / f"{i:02}.png"
+            pygame.image.save(surface, path.as_posix())
+            self.paths.append(path)
+        return
+
+    def tearDown(self):
+        self.directory.cleanup()
+        return
+
+    def test_playback(self):
+        source = ImageSequenceSource.from_folder(self.directory.name)
+        with StreamingSprite(source, repeats=1, window=3, lookahead=200) as sprite:
+            seen = []
+            for _ in range(40):
+                seen.append(sprite.render().get_at((0, 0)).r)
+                self.assertLessEqual(sprite.stats.resident, 3)
+                sprite.update(50)
+
+            self.assertEqual(sorted(set(seen)), list(range(10)))
+            self.assertFalse(sprite.is_playing())
+        return
+
+    def test_stall(self):
+        stalls = []
+        # every frame lasts one update, so the prefetch never gets ahead
+        source = SlowSource(self.paths, durations=[0] * 10)
+        with StreamingSprite(
+            source, repeats=1, window=1, on_stall=lambda i, ms: stalls.append(i)
+        ) as sprite:
+            for _ in range(10):
+                sprite.render()
+                sprite.update(0)
+
+            self.assertEqual(stalls, list(range(10)))
+            self.assertEqual(sprite.stats.stalls, 10)
+            self.assertGreater(sprite.stats.stall_time, 0)
+        return
+
+    def test_pack_source(self):
+        frames = []
+        for i in range(4):
+            surface = Surface((2, 2), SRCALPHA)
+            surface.fill((i * 60, 0, 0, 255))
+            frames.append(Frame(surface=surface, duration=50))
+
+        path = Path(self.directory.name) / "sheet.sprpack"
+        write_pack(path, SpriteSheetData(frames=tuple(frames)), keyframe_interval=2)
+
+        source = PackSource(path)
+        self.assertEqual(source.durations, (50,) * 4)
+        with StreamingSprite(source, repeats=1, window=2) as sprite:
+            seen = []
+            while sprite.is_playing():
+                seen.append(sprite.render().get_at((0, 0)).r)
+                sprite.update(50)
+
+        self.assertEqual(seen, [0, 60, 120, 180])
+        return
+
+
+if __name__ == "__main__":
+    unittest.main()
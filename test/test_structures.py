@@ -1,6 +1,6 @@
 import unittest
 
-from pygame import Surface
+from pygame import Rect, Surface, SRCALPHA
 
 from pygame_animated_sprite.direction import Forward
 from pygame_animated_sprite.structures import Tag, Frame
@@ -19,6 +19,40 @@ class FrameTestCase(unittest.TestCase):
         self.assertEqual(self.frame.duration, copied_frame.duration)
         return
 
+    def test_lods(self):
+        frame = Frame(surface=Surface((16, 8)), duration=0)
+        frame.build_lods(levels=5)
+
+        self.assertEqual(
+            [lod.get_size() for lod in frame.lods], [(8, 4), (4, 2), (2, 1), (1, 1)]
+        )
+        self.assertIs(frame.get_lod(1), frame.surface)
+        self.assertIs(frame.get_lod(0.8), frame.surface)
+        self.assertIs(frame.get_lod(0.5), frame.lods[0])
+        self.assertIs(frame.get_lod(0.3), frame.lods[1])
+        self.assertIs(frame.get_lod(0.001), frame.lods[-1])
+
+        # levels of a replaced surface are stale
+        frame.surface = Surface((16, 8))
+        self.assertIs(frame.get_lod(0.5), frame.surface)
+        return
+
+    def test_mask(self):
+        surface = Surface((8, 8), SRCALPHA)
+        surface.fill((255, 0, 0), (2, 3, 4, 2))
+        frame = Frame(surface=surface, duration=0)
+
+        mask = frame.get_mask()
+        self.assertEqual(mask.count(), 8)
+        self.assertEqual(frame.get_bounds(), Rect(2, 3, 4, 2))
+        self.assertIs(frame.get_mask(), mask)
+
+        # a replaced surface is recomputed
+        frame.surface = Surface((8, 8), SRCALPHA)
+        self.assertEqual(frame.get_mask().count(), 0)
+        self.assertIsNot(frame.get_mask(), mask)
+        return
+
 
 class TagTestCase(unittest.TestCase):
     def setUp(self):